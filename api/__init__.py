@@ -3,5 +3,6 @@ API module - Simulador y endpoints
 """
 
 from .simulador import SimuladorCasino
+from .granja_simulacion import GranjaSimulacion
 
-__all__ = ['SimuladorCasino']
\ No newline at end of file
+__all__ = ['SimuladorCasino', 'GranjaSimulacion']
\ No newline at end of file
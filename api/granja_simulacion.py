@@ -0,0 +1,279 @@
+"""
+GRANJA_SIMULACION.PY
+Granja de simulación multinúcleo para validar estrategias con miles de millones de rondas
+Los trabajos (juego, mesa, rondas) se parten en lotes que se reparten entre
+procesos. Cada lote escribe sus contadores en su propia fila de un array en
+memoria compartida (sin locks ni resultados serializados de vuelta) y el
+proceso principal suma las filas e informa progreso y rondas por segundo.
+"""
+
+import os
+import time
+import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from core.geometria_ruleta import COLOR, DOCENA
+from core.motor_blackjack import RESULTADOS_RONDA, jugar_rondas
+from utils.semillas import SemillaMaestra, generador_mesa, semilla_maestra
+from .simulador import TABLA_TIRADAS
+
+
+# Motores por juego: función jugar(rng, rondas) -> contadores int64 y la
+# disposición de esos contadores como tuplas (nombre, tamaño)
+MOTORES: Dict[str, Dict] = {}
+
+# Rondas que un lote juega entre actualizaciones de su fila (fijo para que
+# el consumo de cada flujo aleatorio no dependa de nada más)
+RONDAS_POR_TRAMO = 250_000
+
+# Neto máximo de una ronda de blackjack en medias unidades (dividir y doblar
+# ambas manos: ±4 apuestas); fija el ancho del histograma de netos
+NETO_MAXIMO_MEDIOS = 8
+
+
+def registrar_motor(juego: str, jugar: Callable[[np.random.Generator, int], np.ndarray],
+                    campos: Sequence[Tuple[str, int]],
+                    derivar: Optional[Callable[[Dict], Dict]] = None):
+    """
+    Registra (o reemplaza) el motor de simulación de un juego
+
+    Args:
+        juego: Nombre del juego
+        jugar: Función (rng, rondas) -> vector int64 con los contadores del tramo
+        campos: Disposición del vector: (nombre, tamaño); el primero debe
+            ser ('rondas', 1)
+        derivar: Función opcional que agrega métricas calculadas al resumen
+    """
+    campos = tuple((nombre, int(tamano)) for nombre, tamano in campos)
+    if not campos or campos[0] != ('rondas', 1):
+        raise ValueError("El primer contador de un motor debe ser ('rondas', 1)")
+    MOTORES[juego] = {'jugar': jugar, 'campos': campos, 'derivar': derivar,
+                      'ancho': sum(tamano for _, tamano in campos)}
+
+
+# ========== MOTORES ==========
+
+def _jugar_ruleta(rng: np.random.Generator, rondas: int) -> np.ndarray:
+    """Tiradas de ruleta con la misma tabla de sorteo que el simulador"""
+    numeros = TABLA_TIRADAS['numero'].take(rng.integers(0, TABLA_TIRADAS.size, rondas,
+                                                        dtype=np.uint16))
+    conteos = np.bincount(numeros, minlength=37)
+    return np.concatenate((
+        [rondas], conteos,
+        np.bincount(COLOR, weights=conteos, minlength=3).astype(np.int64),
+        np.bincount(DOCENA, weights=conteos, minlength=4).astype(np.int64)
+    ))
+
+
+def _jugar_blackjack(rng: np.random.Generator, rondas: int, h17: bool = False) -> np.ndarray:
+    """Rondas completas con estrategia básica (ver core/motor_blackjack.py)"""
+    jugadas = jugar_rondas(rng, rondas, h17=h17)
+    medios = np.rint(jugadas['neto'] * 2).astype(np.int64)  # pago 3:2 -> medias unidades exactas
+    return np.concatenate((
+        [rondas],
+        np.bincount(jugadas['resultado'], minlength=len(RESULTADOS_RONDA)),
+        [jugadas['dividida'].sum(), jugadas['doblada'].sum(), medios.sum()],
+        np.bincount(np.clip(medios, -NETO_MAXIMO_MEDIOS, NETO_MAXIMO_MEDIOS) + NETO_MAXIMO_MEDIOS,
+                    minlength=2 * NETO_MAXIMO_MEDIOS + 1)
+    ))
+
+
+def _jugar_blackjack_h17(rng: np.random.Generator, rondas: int) -> np.ndarray:
+    return _jugar_blackjack(rng, rondas, h17=True)
+
+
+def _derivar_blackjack(resumen: Dict) -> Dict:
+    """Ventaja del jugador (% por ronda) a partir del neto acumulado"""
+    rondas = resumen['rondas']
+    return {'ventaja_jugador': round(resumen['neto_medios'] / 2 / rondas * 100, 4)
+            if rondas else None}
+
+
+registrar_motor('ruleta', _jugar_ruleta,
+                (('rondas', 1), ('numeros', 37), ('colores', 3), ('docenas', 4)))
+_CAMPOS_BLACKJACK = ((('rondas', 1),) + tuple((r, 1) for r in RESULTADOS_RONDA) +
+                     (('divididas', 1), ('dobladas', 1), ('neto_medios', 1),
+                      ('histograma_neto_medios', 2 * NETO_MAXIMO_MEDIOS + 1)))
+registrar_motor('blackjack', _jugar_blackjack, _CAMPOS_BLACKJACK, _derivar_blackjack)
+registrar_motor('blackjack_h17', _jugar_blackjack_h17, _CAMPOS_BLACKJACK, _derivar_blackjack)
+
+
+# ========== TRABAJO DE CADA PROCESO ==========
+
+def _ejecutar_lote(nombre_memoria: str, forma: Tuple[int, int], fila: int,
+                   juego: str, mesa: str, indice_lote: int, rondas: int,
+                   maestra: np.random.SeedSequence) -> int:
+    """
+    Juega un lote en un proceso trabajador y acumula sus contadores en la
+    fila `fila` del array compartido (ninguna otra tarea escribe esa fila)
+
+    Returns:
+        Rondas jugadas
+    """
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    try:
+        contadores = np.ndarray(forma, dtype=np.int64, buffer=memoria.buf)
+        motor = MOTORES[juego]
+        ancho = motor['ancho']
+        rng = generador_mesa(maestra, juego, mesa, indice_lote)
+        pendientes = rondas
+        while pendientes > 0:
+            tramo = min(pendientes, RONDAS_POR_TRAMO)
+            contadores[fila, :ancho] += motor['jugar'](rng, tramo)
+            pendientes -= tramo
+        del contadores
+    finally:
+        memoria.close()
+    return rondas
+
+
+# ========== GRANJA ==========
+
+class GranjaSimulacion:
+    """
+    Reparte trabajos de simulación entre procesos. Cada lote usa el flujo
+    aleatorio (semilla maestra, juego, mesa, número de lote), así que con la
+    misma semilla y el mismo `rondas_por_lote` el resultado es idéntico con
+    1 o con 64 procesos.
+    """
+
+    def __init__(self, procesos: Optional[int] = None, semilla: SemillaMaestra = None,
+                 rondas_por_lote: int = 2_000_000):
+        """
+        Args:
+            procesos: Procesos trabajadores (por defecto, uno por núcleo)
+            semilla: Semilla maestra (None = entropía del sistema, ver `semilla`)
+            rondas_por_lote: Tamaño de cada unidad de reparto
+        """
+        if rondas_por_lote < 1:
+            raise ValueError("rondas_por_lote debe ser al menos 1")
+        self.procesos = procesos or os.cpu_count() or 1
+        self._maestra = semilla_maestra(semilla)
+        self.semilla = self._maestra.entropy
+        self.rondas_por_lote = rondas_por_lote
+
+    def ejecutar(self, trabajos: Iterable[Tuple[str, str, int]],
+                 intervalo_progreso: float = 1.0,
+                 al_progresar: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Ejecuta todos los trabajos y devuelve sus contadores agregados
+
+        Args:
+            trabajos: Tuplas (juego, mesa, rondas)
+            intervalo_progreso: Segundos entre informes de progreso
+            al_progresar: Función que recibe cada informe (por defecto se imprime)
+
+        Returns:
+            Dict con los resultados por trabajo, rondas totales, segundos y
+            rondas por segundo
+        """
+        trabajos = [(juego, mesa, int(rondas)) for juego, mesa, rondas in trabajos]
+        for juego, _, rondas in trabajos:
+            if juego not in MOTORES:
+                raise ValueError(f"No hay motor de simulación para: {juego}")
+            if rondas < 0:
+                raise ValueError("La cantidad de rondas no puede ser negativa")
+        al_progresar = al_progresar or _imprimir_progreso
+
+        lotes = self._partir(trabajos)
+        ancho = max((MOTORES[juego]['ancho'] for juego, _, _ in trabajos), default=1)
+        forma = (max(len(lotes), 1), ancho)
+        total_rondas = sum(rondas for _, _, rondas in trabajos)
+
+        memoria = shared_memory.SharedMemory(create=True, size=int(np.prod(forma)) * 8)
+        try:
+            contadores = np.ndarray(forma, dtype=np.int64, buffer=memoria.buf)
+            contadores[:] = 0
+            inicio = time.perf_counter()
+
+            with ProcessPoolExecutor(max_workers=self.procesos) as ejecutor:
+                pendientes = {
+                    ejecutor.submit(_ejecutar_lote, memoria.name, forma, fila,
+                                    juego, mesa, indice, rondas, self._maestra)
+                    for fila, (_, juego, mesa, indice, rondas) in enumerate(lotes)
+                }
+                while pendientes:
+                    terminados, pendientes = wait(pendientes, timeout=intervalo_progreso,
+                                                  return_when=FIRST_COMPLETED)
+                    for futuro in terminados:
+                        futuro.result()  # propaga errores de los trabajadores
+                    al_progresar(self._progreso(contadores, total_rondas, inicio))
+
+            segundos = time.perf_counter() - inicio
+            resultados = [self._resumir(contadores, lotes, i, trabajo)
+                          for i, trabajo in enumerate(trabajos)]
+            del contadores
+        finally:
+            memoria.close()
+            memoria.unlink()
+
+        return {
+            'semilla': self.semilla,
+            'procesos': self.procesos,
+            'trabajos': resultados,
+            'rondas_totales': total_rondas,
+            'segundos': round(segundos, 3),
+            'rondas_por_segundo': round(total_rondas / segundos, 1) if segundos > 0 else None
+        }
+
+    def _partir(self, trabajos: List[Tuple[str, str, int]]) -> List[Tuple]:
+        """Lotes (trabajo, juego, mesa, índice de lote, rondas) de cada trabajo"""
+        lotes = []
+        for numero, (juego, mesa, rondas) in enumerate(trabajos):
+            for indice, desde in enumerate(range(0, rondas, self.rondas_por_lote)):
+                lotes.append((numero, juego, mesa, indice,
+                              min(self.rondas_por_lote, rondas - desde)))
+        return lotes
+
+    def _progreso(self, contadores: np.ndarray, total_rondas: int, inicio: float) -> Dict:
+        """Rondas completadas (columna 'rondas' de todas las filas) y ritmo"""
+        jugadas = int(contadores[:, 0].sum())
+        segundos = time.perf_counter() - inicio
+        return {
+            'rondas': jugadas,
+            'total': total_rondas,
+            'porcentaje': round(jugadas / total_rondas * 100, 2) if total_rondas else 100.0,
+            'segundos': round(segundos, 2),
+            'rondas_por_segundo': round(jugadas / segundos, 1) if segundos > 0 else 0.0
+        }
+
+    def _resumir(self, contadores: np.ndarray, lotes: List[Tuple], numero: int,
+                 trabajo: Tuple[str, str, int]) -> Dict:
+        """Suma las filas de los lotes de un trabajo y las separa por campo"""
+        juego, mesa, _ = trabajo
+        filas = [fila for fila, lote in enumerate(lotes) if lote[0] == numero]
+        totales = contadores[filas].sum(axis=0)
+
+        resumen = {'juego': juego, 'mesa': mesa}
+        desde = 0
+        for nombre, tamano in MOTORES[juego]['campos']:
+            valores = totales[desde:desde + tamano]
+            resumen[nombre] = int(valores[0]) if tamano == 1 else valores.tolist()
+            desde += tamano
+        if MOTORES[juego]['derivar']:
+            resumen.update(MOTORES[juego]['derivar'](resumen))
+        return resumen
+
+
+def _imprimir_progreso(progreso: Dict):
+    print(f"   ⏳ {progreso['porcentaje']:6.2f}% · {progreso['rondas']:,} rondas · "
+          f"{progreso['rondas_por_segundo']:,.0f} rondas/s")
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    granja = GranjaSimulacion(semilla=2024)
+    print(f"🏭 GRANJA DE SIMULACIÓN ({granja.procesos} procesos, semilla {granja.semilla})")
+    print("=" * 50)
+    
+    resultado = granja.ejecutar([
+        ('ruleta', 'table_1', 20_000_000),
+        ('blackjack', 'table_1', 10_000_000)
+    ])
+    
+    for trabajo in resultado['trabajos']:
+        print(f"\n{trabajo['juego']} / {trabajo['mesa']}: {trabajo['rondas']:,} rondas")
+        if 'ventaja_jugador' in trabajo:
+            print(f"   Ventaja del jugador: {trabajo['ventaja_jugador']}%")
+    print(f"\n⚡ {resultado['rondas_por_segundo']:,.0f} rondas/s en {resultado['segundos']} s")
@@ -4,10 +4,52 @@ Simulador de juegos de casino (ruleta, blackjack, póker, jackpot)
 Genera datos realistas para testing sin necesidad de casino real
 """
 
-import random
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from collections import deque
+from core.cartas import RANGO_CARTA, VALOR_BLACKJACK, nombres_cartas
+from core.motor_blackjack import (
+    DOBLAR, DOBLAR_O_PLANTARSE, PEDIR, RENDIRSE, VALOR_DURO, accion_basica, dealer_pide
+)
+from core.geometria_ruleta import (
+    COLOR, COLUMNA, DOCENA, NOMBRES_COLOR, NOMBRES_PARIDAD, PARIDAD
+)
+from utils.buffer_circular import BufferCircular
+from utils.semillas import SemillaMaestra, secuencia_mesa, semilla_maestra
+
+
+# Tabla de sorteo de ruleta: 3600 casillas, 108 (3%) para el cero y 97 para
+# cada número del 1 al 36, con las columnas de la tirada ya resueltas.
+# Un uint16 uniforme en [0, 3600) elige la casilla; un lote es un solo indexado.
+_CASILLAS_RULETA = 3600
+_CASILLAS_CERO = 108
+_TIPO_TIRADA = np.dtype([('numero', np.uint8), ('color', np.uint8),
+                         ('docena', np.uint8), ('columna', np.uint8)])
+_NUMEROS_TABLA = np.concatenate([
+    np.zeros(_CASILLAS_CERO, dtype=np.uint8),
+    np.repeat(np.arange(1, 37, dtype=np.uint8), (_CASILLAS_RULETA - _CASILLAS_CERO) // 36)
+])
+TABLA_TIRADAS = np.empty(_CASILLAS_RULETA, dtype=_TIPO_TIRADA)
+TABLA_TIRADAS['numero'] = _NUMEROS_TABLA
+TABLA_TIRADAS['color'] = COLOR[_NUMEROS_TABLA]
+TABLA_TIRADAS['docena'] = DOCENA[_NUMEROS_TABLA]
+TABLA_TIRADAS['columna'] = COLUMNA[_NUMEROS_TABLA]
+
+# Mazos por zapato en las mesas de blackjack
+MAZOS_BLACKJACK = 6
+CARTAS_ZAPATO_BLACKJACK = 52 * MAZOS_BLACKJACK
+
+# Baraja base repetida para los zapatos (permutation copia y baraja en un paso)
+_MAZOS_BASE = 8
+_BARAJA_BASE = np.tile(np.arange(52, dtype=np.uint8), _MAZOS_BASE)
+# Tablas por código como listas: indexar un int de Python es más rápido que un array
+_VALORES = VALOR_BLACKJACK.tolist()
+_VALORES_DUROS = VALOR_DURO.tolist()
+_RANGOS = RANGO_CARTA.tolist()
+
+# Subclave del flujo de pronósticos del jackpot (fuera del rango de lotes de la granja)
+_SUBFLUJO_PRONOSTICO = 0xFFFFFFFF
+_PERCENTILES_PRONOSTICO = np.array([5, 25, 50, 75, 95])
 
 
 class SimuladorCasino:
@@ -16,8 +58,23 @@ class SimuladorCasino:
     Útil para testing y desarrollo sin conexión a casinos reales.
     """
     
-    def __init__(self):
-        """Inicializa el simulador con mesas virtuales"""
+    def __init__(self, semilla: SemillaMaestra = None, penetracion: float = 0.75):
+        """
+        Inicializa el simulador con mesas virtuales
+        
+        Args:
+            semilla: Semilla maestra. Cada mesa usa su propio flujo derivado
+                de ella, así que la misma semilla reproduce exactamente la
+                misma simulación. Con None se toma entropía del sistema
+                (queda en `self.semilla` para poder repetir la corrida).
+            penetracion: Fracción del zapato de blackjack que se reparte
+                antes de barajar (posición de la carta de corte)
+        """
+        if not 0 < penetracion <= 1:
+            raise ValueError("La penetración debe estar entre 0 y 1")
+        self.penetracion = penetracion
+        self._maestra = semilla_maestra(semilla)
+        self.semilla = self._maestra.entropy
         self.mesas_activas = {
             'ruleta': {},
             'blackjack': {},
@@ -32,32 +89,59 @@ class SimuladorCasino:
         for i in range(1, 4):
             self.mesas_activas['ruleta'][f'table_{i}'] = {
                 'historial': deque(maxlen=100),
-                'total_tiradas': 0
+                'total_tiradas': 0,  # Desde el último reinicio
+                'tiradas_acumuladas': 0,  # Nunca vuelve a 0 (secuencia de la mesa)
+                'reinicios': 0,  # Época: sube con cada reinicio
+                'version': 0,
+                **self._flujo_mesa('ruleta', f'table_{i}')
             }
         
         # Mesas de blackjack
         for i in range(1, 4):
+            flujo = self._flujo_mesa('blackjack', f'table_{i}')
             self.mesas_activas['blackjack'][f'table_{i}'] = {
-                'mazo_actual': self._crear_mazo(num_mazos=6),
-                'cartas_usadas': [],
-                'manos_jugadas': 0
+                'zapato': self._crear_mazo(MAZOS_BLACKJACK, flujo['rng']),
+                'posicion': 0,
+                # Cartas vistas desde el barajado (memoria fija: un zapato)
+                'cartas_usadas': BufferCircular(CARTAS_ZAPATO_BLACKJACK),
+                'cartas_repartidas': 0,  # Nunca vuelve a 0 (secuencia de la mesa)
+                'barajados': 0,  # Época: sube con cada zapato nuevo
+                'manos_jugadas': 0,
+                'version': 0,
+                **flujo
             }
         
         # Mesas de póker
         for i in range(1, 3):
+            flujo = self._flujo_mesa('poker', f'table_{i}')
             self.mesas_activas['poker'][f'table_{i}'] = {
-                'mazo_actual': self._crear_mazo(num_mazos=1),
+                'zapato': self._crear_mazo(1, flujo['rng']),
+                'posicion': 0,
                 'ronda_actual': 'preflop',
-                'manos_jugadas': 0
+                'manos_jugadas': 0,
+                'version': 0,
+                **flujo
             }
         
         # Jackpots progresivos
         self.mesas_activas['jackpot']['progressive_1'] = {
             'premio_actual': 50000.0,
             'historial_premios': [45000, 52000, 48000, 55000, 51000],
-            'incremento_por_jugada': 0.5
+            'incremento_por_jugada': 0.5,
+            'probabilidad_premio': 0.001,  # 0.1% por jugada
+            'premio_reinicio': (40000, 55000),
+            'version': 0,
+            **self._flujo_mesa('jackpot', 'progressive_1')
         }
     
+    def _flujo_mesa(self, juego: str, mesa: str) -> Dict:
+        """
+        Flujo aleatorio propio de una mesa: su SeedSequence ('semillas', para
+        derivar subflujos) y el Generator con el que se juega ('rng')
+        """
+        semillas = secuencia_mesa(self._maestra, juego, mesa)
+        return {'semillas': semillas, 'rng': np.random.Generator(np.random.PCG64(semillas))}
+    
     # ========== SIMULACIÓN DE RULETA ==========
     
     def simular_tirada_ruleta(self, mesa: str = 'table_1') -> Dict:
@@ -73,40 +157,74 @@ class SimuladorCasino:
         if mesa not in self.mesas_activas['ruleta']:
             mesa = 'table_1'
         
-        # Generar número (ligeramente sesgado para realismo)
-        if random.random() < 0.03:  # 3% de probabilidad de 0 (verde)
-            numero = 0
-        else:
-            numero = random.randint(1, 36)
-        
-        # Determinar color
-        rojos = [1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36]
-        if numero == 0:
-            color = 'verde'
-        elif numero in rojos:
-            color = 'rojo'
-        else:
-            color = 'negro'
+        mesa_data = self.mesas_activas['ruleta'][mesa]
         
-        # Determinar par/impar
-        paridad = 'par' if numero % 2 == 0 and numero != 0 else 'impar'
+        # Generar número (ligeramente sesgado para realismo: 3% de 0)
+        numero = int(TABLA_TIRADAS['numero'][mesa_data['rng'].integers(_CASILLAS_RULETA)])
         
         # Actualizar mesa
-        mesa_data = self.mesas_activas['ruleta'][mesa]
         mesa_data['historial'].append(numero)
         mesa_data['total_tiradas'] += 1
+        mesa_data['tiradas_acumuladas'] += 1
+        mesa_data['version'] += 1
         
         return {
             'juego': 'ruleta',
             'mesa': mesa,
             'numero': numero,
-            'color': color,
-            'paridad': paridad,
-            'docena': (numero - 1) // 12 + 1 if numero > 0 else 0,
-            'columna': numero % 3 if numero > 0 else 0,
+            'color': NOMBRES_COLOR[COLOR[numero]],
+            'paridad': NOMBRES_PARIDAD[PARIDAD[numero]],
+            'docena': int(DOCENA[numero]),
+            'columna': int(COLUMNA[numero]),
             'timestamp': self._get_timestamp()
         }
     
+    def simular_tiradas_ruleta(self, mesa: str = 'table_1', n: int = 1000,
+                               semilla: Optional[int] = None) -> Dict:
+        """
+        Simula `n` tiradas de ruleta de una vez (misma distribución que
+        `simular_tirada_ruleta`: 3% de cero)
+        
+        Args:
+            mesa: Identificador de la mesa
+            n: Cantidad de tiradas
+            semilla: Semilla propia del lote (por defecto se usa el flujo de la mesa)
+            
+        Returns:
+            Dict columnar: arrays uint8 de número, código de color
+            (0 = verde, 1 = rojo, 2 = negro), docena y columna (0 para el cero)
+            
+        El historial de la mesa solo conserva las últimas 100 tiradas: para
+        que el predictor vea el lote entero (y sus ventanas largas no tengan
+        hueco) hay que pasarle `numero` con `actualizar` y `obtener_secuencia`.
+        """
+        if mesa not in self.mesas_activas['ruleta']:
+            mesa = 'table_1'
+        if n < 0:
+            raise ValueError("La cantidad de tiradas no puede ser negativa")
+        
+        mesa_data = self.mesas_activas['ruleta'][mesa]
+        rng = mesa_data['rng'] if semilla is None else np.random.default_rng(semilla)
+        casillas = rng.integers(0, _CASILLAS_RULETA, n, dtype=np.uint16)
+        tiradas = TABLA_TIRADAS.take(casillas)
+        
+        # Actualizar mesa en bloque (el historial solo guarda las últimas)
+        historial = mesa_data['historial']
+        historial.extend(tiradas['numero'][-historial.maxlen:].tolist())
+        mesa_data['total_tiradas'] += n
+        mesa_data['tiradas_acumuladas'] += n
+        mesa_data['version'] += 1
+        
+        return {
+            'juego': 'ruleta',
+            'mesa': mesa,
+            'tiradas': n,
+            'numero': tiradas['numero'],
+            'color': tiradas['color'],
+            'docena': tiradas['docena'],
+            'columna': tiradas['columna']
+        }
+    
     def obtener_historial_ruleta(self, mesa: str = 'table_1', 
                                   cantidad: int = 20) -> List[int]:
         """Obtiene historial reciente de una mesa de ruleta"""
@@ -116,12 +234,64 @@ class SimuladorCasino:
         historial = list(self.mesas_activas['ruleta'][mesa]['historial'])
         return historial[-cantidad:] if historial else []
     
+    def obtener_secuencia(self, juego: str, mesa: str) -> int:
+        """
+        Número de secuencia de la mesa: total de eventos producidos hasta ahora
+        (no retrocede al barajar ni al reiniciar; ver `obtener_epoca`).
+        Permite al predictor incorporar solo los eventos nuevos.
+        """
+        if juego not in self.mesas_activas or mesa not in self.mesas_activas[juego]:
+            return 0
+        
+        if juego == 'ruleta':
+            return self.mesas_activas['ruleta'][mesa]['tiradas_acumuladas']
+        elif juego == 'blackjack':
+            return self.mesas_activas['blackjack'][mesa]['cartas_repartidas']
+        elif juego == 'jackpot':
+            return len(self.mesas_activas['jackpot'][mesa]['historial_premios'])
+        
+        return 0
+    
+    def obtener_epoca(self, juego: str, mesa: str) -> int:
+        """
+        Época de la mesa: sube cada vez que los eventos anteriores dejan de
+        valer (zapato barajado o mesa reiniciada). Si cambia entre dos
+        consultas, el predictor debe reconstruir el estado de la mesa.
+        """
+        if juego not in self.mesas_activas or mesa not in self.mesas_activas[juego]:
+            return 0
+        
+        if juego == 'ruleta':
+            return self.mesas_activas['ruleta'][mesa]['reinicios']
+        elif juego == 'blackjack':
+            return self.mesas_activas['blackjack'][mesa]['barajados']
+        
+        return 0
+    
+    def obtener_version(self, juego: str, mesa: str) -> Optional[int]:
+        """
+        Versión de la mesa: contador que sube con cada evento (tirada, mano,
+        jugada o reinicio) y nunca vuelve atrás. Sirve como clave de caché.
+        
+        Returns:
+            int con la versión, o None si la mesa no existe
+        """
+        if juego not in self.mesas_activas or mesa not in self.mesas_activas[juego]:
+            return None
+        return self.mesas_activas[juego][mesa]['version']
+    
     # ========== SIMULACIÓN DE BLACKJACK ==========
     
     def simular_mano_blackjack(self, mesa: str = 'table_1') -> Dict:
         """
         Simula una mano de blackjack (jugador vs dealer)
         
+        Usa las reglas de core/motor_blackjack: el dealer revisa si tiene
+        blackjack y pide hasta 17 (S17), y el jugador sigue la estrategia
+        básica pidiendo cartas del zapato de la mesa. Sin dividir ni
+        rendirse: las parejas se juegan por su total y la rendición se
+        cambia por pedir.
+        
         Args:
             mesa: Identificador de la mesa
             
@@ -133,46 +303,74 @@ class SimuladorCasino:
         
         mesa_data = self.mesas_activas['blackjack'][mesa]
         
-        # Verificar si necesitamos nuevo mazo
-        if len(mesa_data['mazo_actual']) < 20:
-            mesa_data['mazo_actual'] = self._crear_mazo(num_mazos=6)
-            mesa_data['cartas_usadas'] = []
+        # Barajar al pasar la carta de corte (o si no alcanza para una mano)
+        if (mesa_data['posicion'] >= self.penetracion * len(mesa_data['zapato'])
+                or self._cartas_restantes(mesa_data) < 20):
+            self._barajar_zapato(mesa_data)
+        
+        # Repartir cartas (códigos 0-51): jugador, jugador, dealer, dealer
+        cartas = self._sacar_cartas(mesa_data, 4).tolist()
+        mano_jugador, mano_dealer = cartas[:2], cartas[2:]
+        visible = _VALORES_DUROS[mano_dealer[0]]
+        natural_jugador = self._calcular_valor_blackjack(mano_jugador) == 21
+        natural_dealer = self._calcular_valor_blackjack(mano_dealer) == 21
+        
+        # Jugador (si nadie tiene blackjack): doblar recibe una carta y termina
+        if not (natural_jugador or natural_dealer):
+            accion = self._accion_blackjack(mano_jugador, visible)
+            if accion in (DOBLAR, DOBLAR_O_PLANTARSE):
+                mano_jugador.append(int(self._sacar_cartas(mesa_data, 1)[0]))
+            else:
+                while (accion in (PEDIR, RENDIRSE)
+                       and self._calcular_valor_blackjack(mano_jugador) < 21):
+                    mano_jugador.append(int(self._sacar_cartas(mesa_data, 1)[0]))
+                    accion = self._accion_blackjack(mano_jugador, visible)
+        valor_jugador = self._calcular_valor_blackjack(mano_jugador)
         
-        # Repartir cartas
-        mano_jugador = [self._sacar_carta(mesa_data), self._sacar_carta(mesa_data)]
-        mano_dealer = [self._sacar_carta(mesa_data), self._sacar_carta(mesa_data)]
+        # Dealer: solo juega si el jugador no se pasó ni ganó con blackjack
+        if valor_jugador <= 21 and not (natural_jugador or natural_dealer):
+            while dealer_pide(sum(_VALORES_DUROS[c] for c in mano_dealer),
+                              any(_RANGOS[c] == 12 for c in mano_dealer)):
+                mano_dealer.append(int(self._sacar_cartas(mesa_data, 1)[0]))
         
-        # Calcular valores
-        valor_jugador = self._calcular_valor_blackjack(mano_jugador)
-        valor_dealer = self._calcular_valor_blackjack([mano_dealer[0]])  # Solo carta visible
+        if natural_jugador and natural_dealer:
+            resultado = 'empate'
+        elif natural_jugador:
+            resultado = 'blackjack_jugador'
+        else:
+            resultado = self._determinar_ganador_blackjack(
+                valor_jugador, self._calcular_valor_blackjack(mano_dealer)
+            )
+        valor_dealer = self._calcular_valor_blackjack(mano_dealer[:1])  # Solo carta visible
         
-        # Simular resultado simple
-        resultado = self._determinar_ganador_blackjack(
-            self._calcular_valor_blackjack(mano_jugador),
-            self._calcular_valor_blackjack(mano_dealer)
-        )
+        # Todas las cartas repartidas quedan a la vista del contador
+        repartidas = mano_jugador + mano_dealer
+        mesa_data['cartas_usadas'].extender(np.array(repartidas, dtype=np.uint8))
+        mesa_data['cartas_repartidas'] += len(repartidas)
         
         mesa_data['manos_jugadas'] += 1
+        mesa_data['version'] += 1
         
         return {
             'juego': 'blackjack',
             'mesa': mesa,
-            'mano_jugador': mano_jugador,
-            'mano_dealer': mano_dealer,
+            'mano_jugador': nombres_cartas(mano_jugador),
+            'mano_dealer': nombres_cartas(mano_dealer),
             'valor_jugador': valor_jugador,
             'valor_dealer_visible': valor_dealer,
             'resultado': resultado,
-            'cartas_visibles': mano_jugador + [mano_dealer[0]],
-            'cartas_restantes': len(mesa_data['mazo_actual']),
+            'cartas_visibles': nombres_cartas(mano_jugador + mano_dealer[:1]),
+            'cartas_restantes': self._cartas_restantes(mesa_data),
             'timestamp': self._get_timestamp()
         }
     
-    def obtener_cartas_visibles_blackjack(self, mesa: str = 'table_1') -> List[str]:
-        """Obtiene cartas recientes visibles en blackjack"""
+    def obtener_cartas_visibles_blackjack(self, mesa: str = 'table_1',
+                                          cantidad: Optional[int] = 20) -> List[str]:
+        """Obtiene cartas recientes visibles en blackjack (None: todas desde el barajado)"""
         if mesa not in self.mesas_activas['blackjack']:
             return []
         
-        return self.mesas_activas['blackjack'][mesa]['cartas_usadas'][-20:]
+        return nombres_cartas(self.mesas_activas['blackjack'][mesa]['cartas_usadas'].ultimos(cantidad))
     
     # ========== SIMULACIÓN DE PÓKER ==========
     
@@ -192,41 +390,33 @@ class SimuladorCasino:
         mesa_data = self.mesas_activas['poker'][mesa]
         
         # Nuevo mazo si es necesario
-        if len(mesa_data['mazo_actual']) < 10:
-            mesa_data['mazo_actual'] = self._crear_mazo(num_mazos=1)
+        if self._cartas_restantes(mesa_data) < 10:
+            mesa_data['zapato'] = self._crear_mazo(1, mesa_data['rng'])
+            mesa_data['posicion'] = 0
         
         # Repartir mano del jugador (2 cartas)
-        mano_jugador = [
-            mesa_data['mazo_actual'].pop(),
-            mesa_data['mazo_actual'].pop()
-        ]
+        mano_jugador = self._sacar_cartas(mesa_data, 2)
         
         # Simular fase del juego
-        fase = random.choice(['preflop', 'flop', 'turn', 'river'])
-        
-        cartas_comunitarias = []
-        if fase in ['flop', 'turn', 'river']:
-            cartas_comunitarias = [
-                mesa_data['mazo_actual'].pop(),
-                mesa_data['mazo_actual'].pop(),
-                mesa_data['mazo_actual'].pop()
-            ]
-        if fase in ['turn', 'river']:
-            cartas_comunitarias.append(mesa_data['mazo_actual'].pop())
-        if fase == 'river':
-            cartas_comunitarias.append(mesa_data['mazo_actual'].pop())
+        rng = mesa_data['rng']
+        fase = ('preflop', 'flop', 'turn', 'river')[rng.integers(4)]
+        
+        # Comunitarias según la fase: 0, 3 (flop), 4 (turn) o 5 (river)
+        cantidad_comunitarias = {'preflop': 0, 'flop': 3, 'turn': 4, 'river': 5}[fase]
+        cartas_comunitarias = self._sacar_cartas(mesa_data, cantidad_comunitarias)
         
         mesa_data['manos_jugadas'] += 1
         mesa_data['ronda_actual'] = fase
+        mesa_data['version'] += 1
         
         return {
             'juego': 'poker',
             'mesa': mesa,
-            'mano_jugador': mano_jugador,
-            'cartas_comunitarias': cartas_comunitarias,
+            'mano_jugador': nombres_cartas(mano_jugador),
+            'cartas_comunitarias': nombres_cartas(cartas_comunitarias),
             'fase': fase,
-            'pot_simulado': random.randint(100, 1000),
-            'jugadores_activos': random.randint(2, 6),
+            'pot_simulado': int(rng.integers(100, 1001)),
+            'jugadores_activos': int(rng.integers(2, 7)),
             'timestamp': self._get_timestamp()
         }
     
@@ -249,12 +439,14 @@ class SimuladorCasino:
         
         # Incrementar premio levemente
         jackpot_data['premio_actual'] += jackpot_data['incremento_por_jugada']
+        jackpot_data['version'] += 1
         
         # Simular si hay ganador (muy baja probabilidad)
-        if random.random() < 0.001:  # 0.1% de probabilidad
+        rng = jackpot_data['rng']
+        if rng.random() < jackpot_data['probabilidad_premio']:
             premio_ganado = jackpot_data['premio_actual']
             jackpot_data['historial_premios'].append(premio_ganado)
-            jackpot_data['premio_actual'] = random.uniform(40000, 55000)
+            jackpot_data['premio_actual'] = float(rng.uniform(*jackpot_data['premio_reinicio']))
             hubo_ganador = True
         else:
             premio_ganado = None
@@ -270,43 +462,100 @@ class SimuladorCasino:
             'timestamp': self._get_timestamp()
         }
     
+    def pronosticar_jackpot(self, jackpot_id: str = 'progressive_1',
+                            trayectorias: int = 1_000_000,
+                            semilla: Optional[int] = None) -> Dict:
+        """
+        Pronóstico Monte Carlo de cuándo y con qué premio cae el jackpot
+        
+        Cada trayectoria muestrea directamente de la distribución geométrica
+        las jugadas hasta el próximo premio, sin avanzar jugada a jugada.
+        Las jugadas simuladas solo dependen de la probabilidad de premio, así
+        que se guardan por (probabilidad, trayectorias, semilla): las consultas
+        repetidas no vuelven a simular y dan siempre el mismo resultado; el
+        premio actual solo desplaza los cortes.
+        
+        Args:
+            jackpot_id: Identificador del jackpot
+            trayectorias: Cantidad de futuros simulados
+            semilla: Semilla propia del pronóstico. Por defecto se usa un
+                subflujo fijo del jackpot, que no altera las jugadas simuladas
+            
+        Returns:
+            Dict con percentiles de jugadas hasta el premio y del premio entregado
+        """
+        if jackpot_id not in self.mesas_activas['jackpot']:
+            jackpot_id = 'progressive_1'
+        
+        jackpot_data = self.mesas_activas['jackpot'][jackpot_id]
+        clave = (jackpot_data['probabilidad_premio'], trayectorias, semilla)
+        guardado = jackpot_data.get('pronostico')
+        if guardado is None or guardado[0] != clave:
+            rng = np.random.default_rng(
+                semilla if semilla is not None
+                else secuencia_mesa(self._maestra, 'jackpot', jackpot_id, _SUBFLUJO_PRONOSTICO)
+            )
+            # Jugadas hasta el premio (incluida la ganadora); cada una suma el incremento
+            jugadas = rng.geometric(jackpot_data['probabilidad_premio'], trayectorias)
+            guardado = (clave, np.percentile(jugadas, _PERCENTILES_PRONOSTICO),
+                        float(jugadas.mean()))
+            jackpot_data['pronostico'] = guardado
+        
+        _, cortes_jugadas, media_jugadas = guardado
+        percentiles = _PERCENTILES_PRONOSTICO
+        cortes_premio = (jackpot_data['premio_actual'] +
+                         cortes_jugadas * jackpot_data['incremento_por_jugada'])
+        
+        return {
+            'juego': 'jackpot',
+            'jackpot_id': jackpot_id,
+            'premio_actual': round(jackpot_data['premio_actual'], 2),
+            'trayectorias': trayectorias,
+            'jugadas_hasta_premio': {
+                'media': round(media_jugadas, 1),
+                **{f"p{p}": int(v) for p, v in zip(percentiles, cortes_jugadas)}
+            },
+            'premio_al_caer': {
+                'media': round(jackpot_data['premio_actual'] +
+                               media_jugadas * jackpot_data['incremento_por_jugada'], 2),
+                **{f"p{p}": round(float(v), 2) for p, v in zip(percentiles, cortes_premio)}
+            },
+            'timestamp': self._get_timestamp()
+        }
+    
     # ========== MÉTODOS AUXILIARES ==========
     
-    def _crear_mazo(self, num_mazos: int = 1) -> List[str]:
-        """Crea un mazo de cartas estándar"""
-        palos = ['♠', '♥', '♦', '♣']
-        valores = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        
-        mazo = []
-        for _ in range(num_mazos):
-            for palo in palos:
-                for valor in valores:
-                    mazo.append(f"{valor}{palo}")
-        
-        random.shuffle(mazo)
-        return mazo
-    
-    def _sacar_carta(self, mesa_data: Dict) -> str:
-        """Saca una carta del mazo de una mesa"""
-        carta = mesa_data['mazo_actual'].pop()
-        mesa_data['cartas_usadas'].append(carta)
-        return carta
-    
-    def _calcular_valor_blackjack(self, mano: List[str]) -> int:
-        """Calcula el valor de una mano de blackjack"""
-        valor = 0
-        ases = 0
-        
-        for carta in mano:
-            valor_carta = carta[:-1]
-            
-            if valor_carta in ['J', 'Q', 'K']:
-                valor += 10
-            elif valor_carta == 'A':
-                ases += 1
-                valor += 11
-            else:
-                valor += int(valor_carta)
+    def _crear_mazo(self, num_mazos: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Crea un zapato barajado de códigos de carta (uint8, 0-51)
+        
+        Un solo `permutation` sobre las 52·num_mazos cartas, sin objetos por carta
+        """
+        return rng.permutation(_BARAJA_BASE[:52 * num_mazos]
+                                     if num_mazos <= _MAZOS_BASE
+                                     else np.tile(_BARAJA_BASE[:52], num_mazos))
+    
+    def _barajar_zapato(self, mesa_data: Dict):
+        """Zapato nuevo en una mesa de blackjack (abre una nueva época)"""
+        mesa_data['zapato'] = self._crear_mazo(MAZOS_BLACKJACK, mesa_data['rng'])
+        mesa_data['posicion'] = 0
+        mesa_data['cartas_usadas'].vaciar()
+        mesa_data['barajados'] += 1
+    
+    def _cartas_restantes(self, mesa_data: Dict) -> int:
+        """Cartas sin repartir en el zapato de una mesa"""
+        return len(mesa_data['zapato']) - mesa_data['posicion']
+    
+    def _sacar_cartas(self, mesa_data: Dict, cantidad: int) -> np.ndarray:
+        """Reparte `cantidad` cartas avanzando el puntero del zapato (vista, sin copia)"""
+        inicio = mesa_data['posicion']
+        mesa_data['posicion'] = inicio + cantidad
+        return mesa_data['zapato'][inicio:inicio + cantidad]
+    
+    def _calcular_valor_blackjack(self, mano: List[int]) -> int:
+        """Calcula el valor de una mano de blackjack a partir de códigos de carta"""
+        valor = sum(_VALORES[c] for c in mano)
+        ases = sum(_RANGOS[c] == 12 for c in mano)
         
         # Ajustar ases si es necesario
         while valor > 21 and ases > 0:
@@ -315,6 +564,11 @@ class SimuladorCasino:
         
         return valor
     
+    def _accion_blackjack(self, mano: List[int], visible: int) -> int:
+        """Acción de la estrategia básica para una mano (códigos de carta)"""
+        return accion_basica(sum(_VALORES_DUROS[c] for c in mano),
+                             any(_RANGOS[c] == 12 for c in mano), visible)
+    
     def _determinar_ganador_blackjack(self, valor_jugador: int, 
                                        valor_dealer: int) -> str:
         """Determina el ganador de una mano de blackjack"""
@@ -355,7 +609,7 @@ class SimuladorCasino:
         elif juego == 'blackjack':
             return {
                 'manos_jugadas': mesa_data['manos_jugadas'],
-                'cartas_restantes': len(mesa_data['mazo_actual'])
+                'cartas_restantes': self._cartas_restantes(mesa_data)
             }
         elif juego == 'poker':
             return {
@@ -370,13 +624,20 @@ class SimuladorCasino:
         if juego == 'ruleta' and mesa in self.mesas_activas['ruleta']:
             self.mesas_activas['ruleta'][mesa]['historial'].clear()
             self.mesas_activas['ruleta'][mesa]['total_tiradas'] = 0
+            self.mesas_activas['ruleta'][mesa]['reinicios'] += 1
         elif juego == 'blackjack' and mesa in self.mesas_activas['blackjack']:
-            self.mesas_activas['blackjack'][mesa]['mazo_actual'] = self._crear_mazo(6)
-            self.mesas_activas['blackjack'][mesa]['cartas_usadas'] = []
-            self.mesas_activas['blackjack'][mesa]['manos_jugadas'] = 0
+            mesa_data = self.mesas_activas['blackjack'][mesa]
+            self._barajar_zapato(mesa_data)
+            mesa_data['manos_jugadas'] = 0
         elif juego == 'poker' and mesa in self.mesas_activas['poker']:
-            self.mesas_activas['poker'][mesa]['mazo_actual'] = self._crear_mazo(1)
-            self.mesas_activas['poker'][mesa]['manos_jugadas'] = 0
+            mesa_data = self.mesas_activas['poker'][mesa]
+            mesa_data['zapato'] = self._crear_mazo(1, mesa_data['rng'])
+            mesa_data['posicion'] = 0
+            mesa_data['manos_jugadas'] = 0
+        
+        # La versión nunca retrocede: las predicciones de antes del reinicio quedan obsoletas
+        if juego in self.mesas_activas and mesa in self.mesas_activas[juego]:
+            self.mesas_activas[juego][mesa]['version'] += 1
 
 
 # Ejemplo de uso
@@ -6,8 +6,10 @@ Conecta la interfaz con el predictor de casino
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from core.predictor_casino import PredictorCasino
+from core.outs_poker import estadisticas_cache_outs
 from api.simulador import SimuladorCasino
 from chatbot.ollama_chat import ChatbotOllama
+from utils.cache_predicciones import CachePredicciones
 from utils.helpers import validar_juego, log_evento
 import os
 
@@ -19,18 +21,22 @@ predictor = None
 simulador = None
 chatbot = None
 historial_chat = []
+cache_predicciones = CachePredicciones(capacidad=1024)
 
 def init_sistema():
     """Inicializa todos los componentes al arrancar el servidor"""
     global predictor, simulador, chatbot
     
     try:
-        predictor = PredictorCasino(ventana_historica=100)
-        simulador = SimuladorCasino()
+        # Semilla maestra opcional para reproducir una sesión completa
+        semilla = os.environ.get('CASINO_SEMILLA')
+        semilla = int(semilla) if semilla else None
+        predictor = PredictorCasino(ventana_historica=100, semilla=semilla)
+        simulador = SimuladorCasino(semilla)
         chatbot = ChatbotOllama()
         
         print("✅ Predictor inicializado")
-        print("✅ Simulador inicializado")
+        print(f"✅ Simulador inicializado (semilla {simulador.semilla})")
         
         mesas_ruleta = simulador.obtener_mesas_disponibles('ruleta')
         print(f"📍 Mesas de ruleta: {len(mesas_ruleta)}")
@@ -41,6 +47,14 @@ def init_sistema():
         return False
 
 
+def _clave_cache(juego: str, mesa: str, *extra):
+    """Clave (juego, mesa, versión, ...) de una predicción; None si la mesa no existe"""
+    version = simulador.obtener_version(juego, mesa)
+    if version is None:
+        return None
+    return (juego, mesa, version) + extra
+
+
 @app.route('/')
 def index():
     """Endpoint raíz - información de la API"""
@@ -178,45 +192,78 @@ def predict():
         return jsonify({'error': f'Juego inválido: {juego}'}), 400
     
     try:
+        # Datos de la simulación que acompañan a la predicción en la respuesta
+        extras = {}
+        
         if juego == 'ruleta':
-            historial = simulador.obtener_historial_ruleta(mesa, 100)
-            if len(historial) < 10:
-                return jsonify({
-                    'error': 'Historial insuficiente',
-                    'mensaje': 'Se necesitan al menos 10 tiradas para predicción'
-                }), 400
-            
-            prediccion = predictor.predecir_ruleta(historial)
+            clave = _clave_cache('ruleta', mesa)
+            prediccion = cache_predicciones.obtener(clave) if clave else None
+            if prediccion is None:
+                historial = simulador.obtener_historial_ruleta(mesa, 100)
+                if len(historial) < 10:
+                    return jsonify({
+                        'error': 'Historial insuficiente',
+                        'mensaje': 'Se necesitan al menos 10 tiradas para predicción'
+                    }), 400
+                
+                prediccion = predictor.predecir_ruleta(
+                    historial, mesa, simulador.obtener_secuencia('ruleta', mesa),
+                    epoca=simulador.obtener_epoca('ruleta', mesa)
+                )
+                if clave:
+                    cache_predicciones.guardar(clave, prediccion)
             
         elif juego == 'blackjack':
-            cartas_visibles = simulador.obtener_cartas_visibles_blackjack(mesa)
-            if len(cartas_visibles) < 10:
-                return jsonify({
-                    'error': 'Cartas insuficientes',
-                    'mensaje': 'Se necesitan al menos 10 cartas vistas para predicción'
-                }), 400
-            
-            prediccion = predictor.predecir_blackjack(cartas_visibles)
+            mano_jugador = data.get('player_hand')
+            carta_dealer = data.get('dealer_card')
+            clave = _clave_cache('blackjack', mesa,
+                                 tuple(mano_jugador or ()), carta_dealer)
+            prediccion = cache_predicciones.obtener(clave) if clave else None
+            if prediccion is None:
+                # Todas las cartas desde el barajado; el predictor solo procesa las nuevas
+                secuencia = simulador.obtener_secuencia('blackjack', mesa)
+                epoca = simulador.obtener_epoca('blackjack', mesa)
+                cartas_visibles = simulador.obtener_cartas_visibles_blackjack(mesa, None)
+                if len(cartas_visibles) < 10:
+                    return jsonify({
+                        'error': 'Cartas insuficientes',
+                        'mensaje': 'Se necesitan al menos 10 cartas vistas para predicción'
+                    }), 400
+                
+                prediccion = predictor.predecir_blackjack(
+                    cartas_visibles, mesa, secuencia,
+                    mano_jugador=mano_jugador,
+                    carta_dealer=carta_dealer,
+                    epoca=epoca
+                )
+                if clave:
+                    cache_predicciones.guardar(clave, prediccion)
             
         elif juego == 'poker':
             # Simular mano para obtener datos
             mano_data = simulador.simular_mano_poker(mesa)
             prediccion = predictor.predecir_poker(
                 mano_data['mano_jugador'],
-                mano_data['cartas_comunitarias']
+                mano_data['cartas_comunitarias'],
+                oponentes=mano_data['jugadores_activos'] - 1
             )
-            prediccion['mano_simulada'] = mano_data
+            extras['mano_simulada'] = mano_data
             
         elif juego == 'jackpot':
-            estado = simulador.simular_jackpot(data.get('jackpot_id', 'progressive_1'))
-            prediccion = predictor.predecir_jackpot(estado['historial_premios'])
+            jackpot_id = data.get('jackpot_id', 'progressive_1')
+            estado = simulador.simular_jackpot(jackpot_id)
+            prediccion = predictor.predecir_jackpot(
+                estado['historial_premios'], estado['jackpot_id'],
+                simulador.obtener_secuencia('jackpot', estado['jackpot_id'])
+            )
+            extras['pronostico_simulado'] = simulador.pronosticar_jackpot(estado['jackpot_id'])
             
         else:
             return jsonify({'error': 'Juego no implementado'}), 400
         
         log_evento('prediccion', {'juego': juego, 'mesa': mesa}, verbose=False)
         
-        return jsonify({'prediccion': prediccion})
+        return jsonify({'prediccion': {**prediccion.a_dict(), **extras}})
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -254,15 +301,32 @@ def chat():
         # Intentar inferir contexto si menciona un juego
         if any(p in message_lower for p in palabras_ruleta):
             if simulador:
-                historial = simulador.obtener_historial_ruleta('table_1', 50)
-                if len(historial) >= 10:
-                    contexto_prediccion = predictor.predecir_ruleta(historial)
+                clave = _clave_cache('ruleta', 'table_1')
+                contexto_prediccion = cache_predicciones.obtener(clave) if clave else None
+                if contexto_prediccion is None:
+                    historial = simulador.obtener_historial_ruleta('table_1', 50)
+                    if len(historial) >= 10:
+                        contexto_prediccion = predictor.predecir_ruleta(
+                            historial, 'table_1', simulador.obtener_secuencia('ruleta', 'table_1'),
+                            epoca=simulador.obtener_epoca('ruleta', 'table_1')
+                        )
+                        if clave:
+                            cache_predicciones.guardar(clave, contexto_prediccion)
         
         elif any(p in message_lower for p in palabras_blackjack):
             if simulador:
-                cartas = simulador.obtener_cartas_visibles_blackjack('table_1')
-                if len(cartas) >= 10:
-                    contexto_prediccion = predictor.predecir_blackjack(cartas)
+                clave = _clave_cache('blackjack', 'table_1', (), None)
+                contexto_prediccion = cache_predicciones.obtener(clave) if clave else None
+                if contexto_prediccion is None:
+                    secuencia = simulador.obtener_secuencia('blackjack', 'table_1')
+                    epoca = simulador.obtener_epoca('blackjack', 'table_1')
+                    cartas = simulador.obtener_cartas_visibles_blackjack('table_1', None)
+                    if len(cartas) >= 10:
+                        contexto_prediccion = predictor.predecir_blackjack(
+                            cartas, 'table_1', secuencia, epoca=epoca
+                        )
+                        if clave:
+                            cache_predicciones.guardar(clave, contexto_prediccion)
         
         # Generar respuesta con el chatbot
         response = chatbot.generar_respuesta(
@@ -282,7 +346,7 @@ def chat():
         return jsonify({
             'response': response,
             'contexto_detectado': contexto_prediccion is not None,
-            'juego_detectado': contexto_prediccion.get('juego') if contexto_prediccion else None
+            'juego_detectado': contexto_prediccion.juego if contexto_prediccion else None
         })
         
     except Exception as e:
@@ -316,6 +380,9 @@ def get_stats():
             mesa_stats = simulador.obtener_estadisticas_mesa(juego, mesas[0])
             stats['mesas_por_juego'][juego]['ejemplo_stats'] = mesa_stats
     
+    stats['cache_outs_poker'] = estadisticas_cache_outs()
+    stats['cache_predicciones'] = cache_predicciones.estadisticas()
+    
     return jsonify({'estadisticas': stats})
 
 
@@ -51,7 +51,7 @@ Reglas:
         
         Args:
             pregunta: Pregunta del usuario
-            contexto_prediccion: Dict con datos de predicción (opcional)
+            contexto_prediccion: Resultado del predictor o dict con datos de predicción (opcional)
             historial: Lista de mensajes previos para contexto (opcional)
         
         Returns:
@@ -93,6 +93,8 @@ Reglas:
         partes = [self.system_prompt, "\n---\n"]
         
         # Agregar datos de predicción si existen
+        if hasattr(contexto_prediccion, 'a_dict'):
+            contexto_prediccion = contexto_prediccion.a_dict()
         if contexto_prediccion:
             partes.append("DATOS DE LA PREDICCIÓN:\n")
             juego = contexto_prediccion.get('juego', 'desconocido')
@@ -103,6 +105,9 @@ Reglas:
                 partes.append(f"Confianza: {contexto_prediccion.get('confianza_prediccion', 0)}%\n")
                 probs = contexto_prediccion.get('probabilidades_color', {})
                 partes.append(f"Probabilidades - Rojo: {probs.get('rojo', 0)}%, Negro: {probs.get('negro', 0)}%, Verde: {probs.get('verde', 0)}%\n")
+                sesgo = contexto_prediccion.get('deteccion_sesgo') or {}
+                if sesgo:
+                    partes.append(f"Sesgo de la rueda detectado: {'SÍ' if sesgo.get('rueda_sesgada') else 'NO'}\n")
                 
             elif juego == 'blackjack':
                 partes.append(f"Probabilidad de ganar: {contexto_prediccion.get('probabilidad_ganar', 0)}%\n")
@@ -113,11 +118,18 @@ Reglas:
                 partes.append(f"Fuerza de mano: {contexto_prediccion.get('fuerza_mano', 'N/A')}\n")
                 partes.append(f"Probabilidad de mejorar: {contexto_prediccion.get('probabilidad_mejorar', 0)}%\n")
                 partes.append(f"Fase: {contexto_prediccion.get('fase', 'N/A')}\n")
+                equidad = contexto_prediccion.get('equidad') or {}
+                if equidad:
+                    partes.append(f"Equidad vs {equidad.get('oponentes', 1)} rivales: {equidad.get('equidad', 0)}%\n")
                 
             elif juego == 'jackpot':
                 rango = contexto_prediccion.get('rango_predicho', {})
                 partes.append(f"Rango predicho: ${rango.get('minimo', 0):,.2f} - ${rango.get('maximo', 0):,.2f}\n")
                 partes.append(f"Tendencia: {contexto_prediccion.get('tendencia', 'N/A')}\n")
+                modelo = contexto_prediccion.get('modelo_tendencia') or {}
+                if modelo and modelo['estadistico_t'] is not None:
+                    partes.append(f"Pendiente: ${modelo['pendiente']:,.2f} por premio "
+                                  f"(t = {modelo['estadistico_t']})\n")
             
             partes.append("\n")
         
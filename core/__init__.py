@@ -3,5 +3,6 @@ Core module - Motor de predicción del casino
 """
 
 from .predictor_casino import PredictorCasino
+from .frecuencias_ruleta import FrecuenciasRuleta
 
-__all__ = ['PredictorCasino']
\ No newline at end of file
+__all__ = ['PredictorCasino', 'FrecuenciasRuleta']
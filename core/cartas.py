@@ -0,0 +1,85 @@
+"""
+CARTAS.PY
+Codificación entera de cartas de una baraja francesa (0-51)
+código = palo * 13 + rango, con rango 0 = '2' ... 12 = 'A'
+"""
+
+import numpy as np
+from typing import Iterable, List, Union
+
+
+RANGOS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+PALOS = ('♠', '♥', '♦', '♣')
+
+# Tablas indexadas por código de carta
+RANGO_CARTA = (np.arange(52) % 13).astype(np.uint8)
+PALO_CARTA = (np.arange(52) // 13).astype(np.uint8)
+# Valor en blackjack (el as cuenta 11; se rebaja a 1 al sumar la mano)
+VALOR_BLACKJACK = np.array([2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 11],
+                           dtype=np.uint8)[RANGO_CARTA]
+# Texto de cada código, para mostrar cartas solo en el borde de la API
+NOMBRES_CARTA = tuple(f"{RANGOS[c % 13]}{PALOS[c // 13]}" for c in range(52))
+
+_INDICE_RANGO = {r: i for i, r in enumerate(RANGOS)}
+_INDICE_RANGO.update({'T': 8, 't': 8, 'j': 9, 'q': 10, 'k': 11, 'a': 12})
+_INDICE_PALO = {p: i for i, p in enumerate(PALOS)}
+_INDICE_PALO.update({'s': 0, 'h': 1, 'd': 2, 'c': 3})
+
+Carta = Union[str, int]
+
+
+def codificar_carta(carta: Carta) -> int:
+    """
+    Convierte una carta a su código entero
+    
+    Args:
+        carta: Código (0-51) o texto con rango y palo ('10♠', 'K♥', 'As', 'Td')
+        
+    Returns:
+        int: Código de la carta
+    """
+    if isinstance(carta, (int, np.integer)):
+        if not 0 <= carta < 52:
+            raise ValueError(f"Código de carta inválido: {carta}")
+        return int(carta)
+    
+    texto = str(carta).strip()
+    rango = _INDICE_RANGO.get(texto[:-1])
+    palo = _INDICE_PALO.get(texto[-1:].lower() if texto[-1:].isalpha() else texto[-1:])
+    if rango is None or palo is None:
+        raise ValueError(f"Carta inválida: {carta!r}")
+    return palo * 13 + rango
+
+
+def rango_carta(carta: Carta) -> int:
+    """
+    Índice de rango (0 = '2' ... 12 = 'A') de una carta con o sin palo
+    
+    Args:
+        carta: Código (0-51), rango solo ('A', '10') o rango y palo ('K♥')
+    """
+    if isinstance(carta, (int, np.integer)):
+        return codificar_carta(carta) % 13
+    
+    texto = str(carta).strip()
+    rango = _INDICE_RANGO.get(texto)
+    if rango is not None:
+        return rango
+    return codificar_carta(texto) % 13
+
+
+def codificar_cartas(cartas: Iterable[Carta]) -> np.ndarray:
+    """Convierte una lista de cartas a un array uint8 de códigos"""
+    return np.array([codificar_carta(c) for c in cartas], dtype=np.uint8)
+
+
+def nombre_carta(codigo: int) -> str:
+    """Texto de una carta a partir de su código (ej: 8 -> '10♠')"""
+    return NOMBRES_CARTA[codigo]
+
+
+def nombres_cartas(codigos: Iterable[int]) -> List[str]:
+    """Textos de varias cartas (acepta arrays de códigos)"""
+    if isinstance(codigos, np.ndarray):
+        codigos = codigos.tolist()
+    return [NOMBRES_CARTA[c] for c in codigos]
@@ -0,0 +1,80 @@
+"""
+CONTEO_CARTAS.PY
+Registro de sistemas de conteo de cartas definidos como vectores de etiquetas
+Cada sistema es un array indexado por rango ('2' ... 'A'), así que una
+secuencia completa se cuenta con un np.take y un cumsum, todos los sistemas a la vez.
+"""
+
+import numpy as np
+from typing import Dict, Iterable, Optional, Sequence
+from .cartas import Carta, rango_carta
+
+
+SISTEMAS_CONTEO: Dict[str, np.ndarray] = {}
+
+
+def registrar_sistema(nombre: str, etiquetas: Sequence[int]):
+    """
+    Registra (o reemplaza) un sistema de conteo
+
+    Args:
+        nombre: Identificador del sistema
+        etiquetas: 13 valores, uno por rango de '2' a 'A'
+    """
+    etiquetas = np.asarray(etiquetas, dtype=np.int8)
+    if etiquetas.shape != (13,):
+        raise ValueError("Un sistema de conteo necesita 13 etiquetas ('2' ... 'A')")
+    SISTEMAS_CONTEO[nombre] = etiquetas
+
+
+#                         2  3  4  5  6  7  8  9  T  J  Q  K  A
+registrar_sistema('hi_lo',     [1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1])
+registrar_sistema('ko',        [1, 1, 1, 1, 1, 1, 0, 0, -1, -1, -1, -1, -1])
+registrar_sistema('hi_opt_ii', [1, 1, 2, 2, 1, 1, 0, 0, -2, -2, -2, -2, 0])
+registrar_sistema('omega_ii',  [1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2, 0])
+registrar_sistema('zen',       [1, 1, 2, 2, 2, 1, 0, 0, -2, -2, -2, -2, -1])
+
+
+def matriz_etiquetas(sistemas: Optional[Iterable[str]] = None) -> np.ndarray:
+    """Etiquetas de varios sistemas apiladas (sistemas × 13)"""
+    nombres = list(SISTEMAS_CONTEO) if sistemas is None else list(sistemas)
+    faltantes = [n for n in nombres if n not in SISTEMAS_CONTEO]
+    if faltantes:
+        raise ValueError(f"Sistemas de conteo desconocidos: {faltantes}")
+    return np.vstack([SISTEMAS_CONTEO[n] for n in nombres]).astype(np.int32)
+
+
+def contar_secuencia(cartas: Iterable[Carta], sistemas: Optional[Iterable[str]] = None,
+                     num_mazos: int = 6, inicial: Optional[np.ndarray] = None,
+                     vistas_previas: int = 0) -> Dict:
+    """
+    Conteo corrido y true count a lo largo de una secuencia de cartas
+
+    Args:
+        cartas: Cartas en orden de aparición (texto o códigos 0-51)
+        sistemas: Sistemas a evaluar (None = todos los registrados)
+        num_mazos: Mazos del zapato, para el true count
+        inicial: Conteo de cada sistema antes de la primera carta (por defecto 0)
+        vistas_previas: Cartas del mismo zapato vistas antes de la secuencia
+
+    Returns:
+        Dict columnar: 'sistemas' (nombres), 'conteo' y 'true_count'
+        (matrices sistemas × cartas con el valor tras cada carta).
+        En sistemas no balanceados como KO el true count es solo orientativo.
+    """
+    nombres = list(SISTEMAS_CONTEO) if sistemas is None else list(sistemas)
+    if isinstance(cartas, np.ndarray) and np.issubdtype(cartas.dtype, np.integer):
+        rangos = cartas % 13
+    else:
+        rangos = np.array([rango_carta(c) for c in cartas], dtype=np.intp)
+
+    conteo = np.cumsum(np.take(matriz_etiquetas(nombres), rangos, axis=1), axis=1)
+    if inicial is not None:
+        conteo += np.asarray(inicial, dtype=conteo.dtype)[:, None]
+    vistas = np.arange(vistas_previas + 1, vistas_previas + len(rangos) + 1)
+    mazos_restantes = np.maximum((num_mazos * 52 - vistas) / 52, 1)
+    return {
+        'sistemas': nombres,
+        'conteo': conteo,
+        'true_count': conteo / mazos_restantes
+    }
@@ -0,0 +1,111 @@
+"""
+EQUIDAD_POKER.PY
+Motor Monte Carlo vectorizado de equidad para Texas Hold'em
+Reparte board y manos rivales como arrays enteros y evalúa en lote
+"""
+
+import math
+import time
+import numpy as np
+from typing import Dict, Iterable, Optional
+from .cartas import Carta, codificar_carta
+from .evaluador_poker import evaluar_lote
+
+
+def calcular_equidad(mano: Iterable[Carta], comunitarias: Iterable[Carta] = (),
+                     oponentes: int = 1, muestras: int = 10000,
+                     tiempo_max: Optional[float] = None, semilla: Optional[int] = None,
+                     tamano_lote: int = 2000) -> Dict:
+    """
+    Estima la equidad de una mano contra rivales con cartas aleatorias
+
+    Args:
+        mano: 2 cartas del jugador
+        comunitarias: 0, 3, 4 o 5 cartas en la mesa
+        oponentes: Cantidad de rivales (1-9)
+        muestras: Máximo de repartos simulados
+        tiempo_max: Presupuesto de tiempo en segundos (None = sin límite).
+            Siempre se simula al menos un lote y se respeta aunque haya semilla.
+        semilla: Semilla para resultados reproducibles. Solo es exacta con
+            tiempo_max=None: si el tiempo corta antes de `muestras`, la
+            cantidad de lotes (y el resultado) depende de la velocidad de la
+            máquina; 'muestras' en el resultado indica cuántos se simularon.
+        tamano_lote: Repartos simulados por iteración vectorizada
+
+    Returns:
+        Dict con porcentajes de victoria/empate/derrota, equidad
+        (empates repartidos) e intervalo de confianza del 95%
+    """
+    propias = [codificar_carta(c) for c in mano]
+    board = [codificar_carta(c) for c in comunitarias]
+    if len(propias) != 2:
+        raise ValueError("La mano debe tener exactamente 2 cartas")
+    if len(board) not in (0, 3, 4, 5):
+        raise ValueError("El board debe tener 0, 3, 4 o 5 cartas")
+    if not 1 <= oponentes <= 9:
+        raise ValueError("Se admiten entre 1 y 9 oponentes")
+    if len(set(propias + board)) != len(propias) + len(board):
+        raise ValueError("Hay cartas repetidas entre mano y board")
+
+    rng = np.random.default_rng(semilla)
+    resto = np.setdiff1d(np.arange(52), propias + board).astype(np.uint8)
+    faltan_board = 5 - len(board)
+    por_muestra = faltan_board + 2 * oponentes
+
+    victorias = empates = 0
+    suma_equidad = suma_cuadrados = 0.0
+    simuladas = 0
+    inicio = time.perf_counter()
+
+    while simuladas < muestras:
+        lote = min(tamano_lote, muestras - simuladas)
+
+        # Reparto sin reemplazo: primeras posiciones de una permutación por fila
+        repartidas = resto[np.argsort(rng.random((lote, len(resto))), axis=1)[:, :por_muestra]]
+        board_completo = np.hstack([
+            np.broadcast_to(np.array(board, dtype=np.uint8), (lote, len(board))),
+            repartidas[:, :faltan_board]
+        ])
+
+        rango_propio = evaluar_lote(np.hstack([
+            np.broadcast_to(np.array(propias, dtype=np.uint8), (lote, 2)), board_completo
+        ]))
+        rangos_rivales = np.column_stack([
+            evaluar_lote(np.hstack([
+                repartidas[:, faltan_board + 2 * i:faltan_board + 2 * i + 2], board_completo
+            ]))
+            for i in range(oponentes)
+        ])
+
+        mejor_rival = rangos_rivales.min(axis=1)
+        gana = rango_propio < mejor_rival
+        empata = rango_propio == mejor_rival
+        # En un empate el bote se reparte entre todos los que igualan
+        empatados = (rangos_rivales == mejor_rival[:, None]).sum(axis=1)
+        equidad = np.where(gana, 1.0, np.where(empata, 1.0 / (empatados + 1), 0.0))
+
+        victorias += int(gana.sum())
+        empates += int(empata.sum())
+        suma_equidad += float(equidad.sum())
+        suma_cuadrados += float((equidad ** 2).sum())
+        simuladas += lote
+
+        if tiempo_max is not None and time.perf_counter() - inicio >= tiempo_max:
+            break
+
+    media = suma_equidad / simuladas
+    varianza = max(suma_cuadrados / simuladas - media ** 2, 0.0)
+    margen = 1.96 * math.sqrt(varianza / simuladas)
+
+    return {
+        'victoria': round(victorias / simuladas * 100, 2),
+        'empate': round(empates / simuladas * 100, 2),
+        'derrota': round((simuladas - victorias - empates) / simuladas * 100, 2),
+        'equidad': round(media * 100, 2),
+        'intervalo_confianza': [
+            round(max(media - margen, 0.0) * 100, 2),
+            round(min(media + margen, 1.0) * 100, 2)
+        ],
+        'muestras': simuladas,
+        'oponentes': oponentes
+    }
@@ -0,0 +1,302 @@
+"""
+ESTADISTICAS_JACKPOT.PY
+Estadísticas en streaming de premios de jackpot
+Media y varianza de Welford, mínimo/máximo, cuantiles (exactos con pocas
+muestras, P² de Jain y Chlamtac después) y tendencia (EWMA + mínimos
+cuadrados en ventana): cada premio nuevo se incorpora en O(1) sin guardar
+el historial completo.
+"""
+
+import bisect
+import math
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+
+class CuantilP2:
+    """
+    Estimador de un cuantil: exacto mientras hay pocas observaciones y P²
+    con cinco marcadores después. Las primeras `exactas` observaciones se
+    guardan ordenadas (el P² es muy impreciso con pocas muestras); al
+    superarlas, los marcadores se inician desde ese buffer y se libera.
+    """
+
+    def __init__(self, p: float, exactas: int = 100):
+        """
+        Args:
+            p: Cuantil a estimar (entre 0 y 1)
+            exactas: Observaciones con cuantil exacto antes de pasar a P²
+        """
+        if not 0 < p < 1:
+            raise ValueError("El cuantil debe estar entre 0 y 1")
+        if exactas < 5:
+            raise ValueError("Se necesitan al menos 5 observaciones exactas para iniciar P²")
+        self.p = p
+        self.exactas = exactas
+        self._incrementos = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Descarta todas las observaciones"""
+        self._ordenadas: Optional[List[float]] = []
+        self._alturas: List[float] = []
+        self._posiciones: List[int] = []
+        self._deseadas: List[float] = []
+
+    def agregar(self, x: float):
+        """Incorpora una observación"""
+        x = float(x)
+        if self._ordenadas is not None:
+            bisect.insort(self._ordenadas, x)
+            if len(self._ordenadas) > self.exactas:
+                self._iniciar_marcadores()
+            return
+
+        # Celda donde cae x (ajustando los extremos si hace falta)
+        q = self._alturas
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self._posiciones
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._deseadas[i] += self._incrementos[i]
+
+        # Ajustar los marcadores centrales
+        for i in (1, 2, 3):
+            d = self._deseadas[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                candidato = self._parabolica(i, d)
+                if not q[i - 1] < candidato < q[i + 1]:
+                    candidato = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = candidato
+                n[i] += d
+
+    def _iniciar_marcadores(self):
+        """Pasa a P²: marcadores en las posiciones deseadas de la muestra ordenada"""
+        ordenadas = self._ordenadas
+        ultima = len(ordenadas) - 1
+        self._deseadas = [ultima * f for f in self._incrementos]
+        self._posiciones = [round(d) for d in self._deseadas]
+        self._alturas = [ordenadas[i] for i in self._posiciones]
+        self._ordenadas = None
+
+    def _parabolica(self, i: int, d: int) -> float:
+        """Predicción parabólica de la altura del marcador i"""
+        q, n = self._alturas, self._posiciones
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def valor(self) -> Optional[float]:
+        """Estimación actual del cuantil (None sin observaciones)"""
+        q = self._ordenadas
+        if q is None:
+            return self._alturas[2]
+        if not q:
+            return None
+        # Cuantil exacto con interpolación lineal (como np.percentile)
+        posicion = self.p * (len(q) - 1)
+        base = int(posicion)
+        siguiente = min(base + 1, len(q) - 1)
+        return q[base] + (q[siguiente] - q[base]) * (posicion - base)
+
+
+class EstadisticasJackpot:
+    """
+    Acumulador en streaming de los premios de un jackpot: conteo, media,
+    varianza, extremos y cuantiles, todo actualizado en O(1) por premio.
+    """
+
+    def __init__(self, cuantiles: Iterable[float] = (0.1, 0.25, 0.5, 0.75, 0.9)):
+        """
+        Args:
+            cuantiles: Cuantiles a estimar (exactos al principio, luego P²)
+        """
+        self.estimadores = {p: CuantilP2(p) for p in cuantiles}
+        self.reiniciar()
+
+    def __len__(self) -> int:
+        return self.n
+
+    def reiniciar(self):
+        """Vacía el acumulador"""
+        self.n = 0
+        self.media = 0.0
+        self._m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        for estimador in self.estimadores.values():
+            estimador.reiniciar()
+
+    def agregar(self, premio: float):
+        """Incorpora un premio (Welford)"""
+        premio = float(premio)
+        self.n += 1
+        delta = premio - self.media
+        self.media += delta / self.n
+        self._m2 += delta * (premio - self.media)
+        self.minimo = min(self.minimo, premio)
+        self.maximo = max(self.maximo, premio)
+        for estimador in self.estimadores.values():
+            estimador.agregar(premio)
+
+    def agregar_varios(self, premios: Iterable[float]):
+        """Incorpora varios premios en orden"""
+        for premio in premios:
+            self.agregar(premio)
+
+    @property
+    def varianza(self) -> float:
+        """Varianza poblacional (igual que np.var)"""
+        return self._m2 / self.n if self.n else 0.0
+
+    @property
+    def desviacion(self) -> float:
+        return math.sqrt(self.varianza)
+
+    def cuantil(self, p: float) -> Optional[float]:
+        """Cuantil estimado (solo los configurados al crear el acumulador)"""
+        if p not in self.estimadores:
+            raise ValueError(f"Cuantil no configurado: {p}")
+        return self.estimadores[p].valor
+
+    def resumen(self) -> Dict:
+        """Estadísticas actuales redondeadas a centavos"""
+        if not self.n:
+            return {}
+        percentiles = {f"p{round(p * 100)}": round(self.estimadores[p].valor, 2)
+                       for p in sorted(self.estimadores)}
+        return {
+            'promedio_historico': round(self.media, 2),
+            'mediana': round(self.cuantil(0.5), 2) if 0.5 in self.estimadores else None,
+            'desviacion_estandar': round(self.desviacion, 2),
+            'minimo_historico': round(self.minimo, 2),
+            'maximo_historico': round(self.maximo, 2),
+            'percentiles': percentiles
+        }
+
+
+class TendenciaIncremental:
+    """
+    Tendencia de una serie: media móvil exponencial y recta de mínimos
+    cuadrados sobre las últimas `ventana` observaciones. Las sumas de la
+    regresión se desplazan al entrar y salir cada punto, así que agregar
+    cuesta O(1) sin importar el tamaño de la ventana.
+    """
+
+    def __init__(self, ventana: int = 20, alfa: float = 0.3, confianza_z: float = 1.96):
+        """
+        Args:
+            ventana: Observaciones usadas para la pendiente
+            alfa: Peso de la observación nueva en la EWMA
+            confianza_z: Cuantil normal del nivel de confianza (1.96 = 95%)
+        """
+        if ventana < 3:
+            raise ValueError("La ventana de tendencia necesita al menos 3 puntos")
+        if not 0 < alfa <= 1:
+            raise ValueError("Alfa debe estar entre 0 y 1")
+        self.ventana = ventana
+        self.alfa = alfa
+        self.confianza_z = confianza_z
+        self.valores = deque(maxlen=ventana)
+        self.reiniciar()
+
+    def __len__(self) -> int:
+        return len(self.valores)
+
+    def reiniciar(self):
+        """Vacía la serie"""
+        self.valores.clear()
+        self.ewma: Optional[float] = None
+        # Sumas con x = 0 .. m-1 desde el punto más antiguo de la ventana
+        self._suma_y = 0.0
+        self._suma_xy = 0.0
+        self._suma_yy = 0.0
+
+    def agregar(self, y: float):
+        """Incorpora una observación"""
+        y = float(y)
+        self.ewma = y if self.ewma is None else self.ewma + self.alfa * (y - self.ewma)
+
+        if len(self.valores) == self.ventana:
+            # Sale el punto x = 0 y los demás se corren una posición
+            saliente = self.valores[0]
+            self._suma_y -= saliente
+            self._suma_yy -= saliente * saliente
+            self._suma_xy -= self._suma_y
+
+        x = len(self.valores) if len(self.valores) < self.ventana else self.ventana - 1
+        self.valores.append(y)
+        self._suma_y += y
+        self._suma_xy += x * y
+        self._suma_yy += y * y
+
+    def agregar_varios(self, valores: Iterable[float]):
+        """Incorpora varias observaciones en orden"""
+        for y in valores:
+            self.agregar(y)
+
+    def ajuste(self) -> Optional[Dict]:
+        """
+        Recta ajustada sobre la ventana actual
+
+        Returns:
+            Dict con pendiente (por premio), su error estándar, estadístico t,
+            si es significativa y la banda de pronóstico del próximo valor;
+            None con menos de 3 observaciones
+        """
+        m = len(self.valores)
+        if m < 3:
+            return None
+
+        media_x = (m - 1) / 2
+        sxx = m * (m * m - 1) / 12          # Σ(x - x̄)²
+        sxy = self._suma_xy - media_x * self._suma_y
+        syy = max(self._suma_yy - self._suma_y ** 2 / m, 0.0)
+        pendiente = sxy / sxx
+        ordenada = self._suma_y / m - pendiente * media_x
+
+        residuo = max(syy - pendiente * sxy, 0.0)
+        sigma = math.sqrt(residuo / (m - 2))
+        error = sigma / math.sqrt(sxx)
+        t = pendiente / error if error > 0 else (math.inf if pendiente else 0.0)
+        critico = _t_critico(self.confianza_z, m - 2)
+
+        # Próximo punto: x = m
+        pronostico = ordenada + pendiente * m
+        margen = critico * sigma * math.sqrt(1 + 1 / m + (m - media_x) ** 2 / sxx)
+        return {
+            'pendiente': pendiente,
+            'error_estandar': error,
+            't': t,
+            'significativa': abs(t) > critico,
+            'pronostico': pronostico,
+            'banda': (pronostico - margen, pronostico + margen)
+        }
+
+    def clasificar(self) -> str:
+        """'creciente', 'decreciente' o 'estable' según la significancia de la pendiente"""
+        ajuste = self.ajuste()
+        if ajuste is None:
+            return 'insuficiente'
+        if not ajuste['significativa']:
+            return 'estable'
+        return 'creciente' if ajuste['pendiente'] > 0 else 'decreciente'
+
+
+def _t_critico(z: float, grados: int) -> float:
+    """Cuantil t de Student aproximado desde el normal (Cornish-Fisher)"""
+    return z + (z ** 3 + z) / (4 * grados) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * grados ** 2)
@@ -0,0 +1,251 @@
+"""
+EV_BLACKJACK.PY
+Valor esperado de cada decisión de blackjack según la composición del zapato
+Las probabilidades del dealer se memorizan por (carta visible, composición
+agrupada), de modo que consultas repetidas no recalculan nada.
+
+Modelo: las probabilidades de cada valor salen de la composición restante y
+no cambian durante la mano; el dealer revisa si tiene blackjack (peek), se
+permite doblar tras dividir, no se redivide y los ases divididos reciben
+una sola carta.
+"""
+
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+from .cartas import Carta, rango_carta
+
+
+# Resolución de la agrupación de composiciones (pasos de 0.1%)
+RESOLUCION_COMPOSICION = 1000
+
+ACCIONES = ('plantarse', 'pedir', 'doblar', 'dividir', 'rendirse')
+RESULTADOS_DEALER = ('17', '18', '19', '20', '21', 'se_pasa')
+
+# Valor de blackjack por rango (2-9 = valor, 10/J/Q/K = 10, A = 1)
+VALOR_RANGO = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1)
+
+
+def agrupar_composicion(restantes: Sequence[int]) -> Tuple[int, ...]:
+    """
+    Agrupa una composición de 13 rangos en proporciones por valor (A, 2-10)
+
+    Returns:
+        Tupla de 10 enteros: proporción de cada valor × RESOLUCION_COMPOSICION
+    """
+    restantes = np.asarray(restantes, dtype=np.float64)
+    por_valor = np.zeros(11)
+    np.add.at(por_valor, np.array(VALOR_RANGO), restantes)
+    total = por_valor.sum()
+    if total <= 0:
+        raise ValueError("La composición del zapato está vacía")
+    return tuple(np.round(por_valor[1:] / total * RESOLUCION_COMPOSICION).astype(int).tolist())
+
+
+def analizar_mano(mano_jugador: Iterable[Carta], carta_dealer: Carta,
+                  restantes: Sequence[int], h17: bool = False,
+                  permitir_rendicion: bool = True) -> Dict:
+    """
+    EV de cada acción posible para la mano actual y la acción óptima
+
+    Args:
+        mano_jugador: Cartas del jugador (2 o más)
+        carta_dealer: Carta visible del dealer
+        restantes: Cartas restantes por rango (13 valores, '2' ... 'A')
+        h17: True si el dealer pide con 17 blando
+        permitir_rendicion: Si se ofrece rendición tardía
+
+    Returns:
+        Dict con la acción óptima, su EV (en apuestas), el EV de cada acción
+        disponible y la distribución final del dealer. Un blackjack natural
+        (as + 10 en dos cartas) no tiene decisión: cobra 3:2 porque el dealer
+        ya revisó que no tiene blackjack.
+    """
+    valores = [VALOR_RANGO[rango_carta(c)] for c in mano_jugador]
+    if len(valores) < 2:
+        raise ValueError("La mano del jugador necesita al menos 2 cartas")
+    visible = VALOR_RANGO[rango_carta(carta_dealer)]
+    grupo = agrupar_composicion(restantes)
+
+    distribucion, prob_blackjack = _distribucion_dealer(visible, grupo, h17)
+    duro, con_as = sum(valores), 1 in valores
+    inicial = len(valores) == 2
+    natural = inicial and duro == 11 and con_as
+
+    if natural:
+        ev = {'plantarse': 1.5}
+    else:
+        ev = _ev_acciones(valores, visible, grupo, h17, permitir_rendicion)
+
+    accion = max(ev, key=ev.get)
+    return {
+        'accion_optima': accion,
+        'ev_optimo': round(float(ev[accion]), 4),
+        'ev_acciones': {a: round(float(v), 4) for a, v in ev.items()},
+        'blackjack_natural': natural,
+        'distribucion_dealer': {r: round(p * 100, 2)
+                                for r, p in zip(RESULTADOS_DEALER, distribucion)},
+        'prob_blackjack_dealer': round(prob_blackjack * 100, 2)
+    }
+
+
+def _ev_acciones(valores: Sequence[int], visible: int, grupo: Tuple[int, ...],
+                 h17: bool, permitir_rendicion: bool) -> Dict[str, float]:
+    """EV de cada acción disponible para una mano sin blackjack natural"""
+    tabla = _tabla_jugador(visible, grupo, h17)
+    estado = (min(sum(valores), 22), 1 in valores)
+    inicial = len(valores) == 2
+
+    ev = {'plantarse': tabla['plantarse'][estado], 'pedir': tabla['pedir'][estado]}
+    if inicial:
+        ev['doblar'] = tabla['doblar'][estado]
+        if valores[0] == valores[1]:
+            ev['dividir'] = tabla['dividir'][valores[0]]
+        if permitir_rendicion:
+            ev['rendirse'] = -0.5
+    return ev
+
+
+def ev_ronda(restantes: Sequence[int], h17: bool = False,
+             permitir_rendicion: bool = True) -> float:
+    """
+    EV de una ronda nueva jugada de forma óptima con la composición dada
+
+    Returns:
+        float: Ganancia esperada por unidad apostada (blackjack paga 3:2)
+    """
+    return _ev_ronda(agrupar_composicion(restantes), h17, permitir_rendicion)
+
+
+def estadisticas_cache_dealer() -> Dict:
+    """Aciertos y fallos de la memoización de probabilidades del dealer"""
+    info = _distribucion_dealer.cache_info()
+    consultas = info.hits + info.misses
+    return {
+        'aciertos': info.hits,
+        'fallos': info.misses,
+        'tasa_aciertos': round(info.hits / consultas * 100, 2) if consultas else 0.0,
+        'entradas': info.currsize
+    }
+
+
+def _probabilidades(grupo: Tuple[int, ...]) -> np.ndarray:
+    """Probabilidad de cada valor, indexada 1 (as) a 10"""
+    p = np.zeros(11)
+    p[1:] = grupo
+    return p / p.sum()
+
+
+def _total(duro: int, con_as: bool) -> int:
+    """Mejor total de una mano (el as vale 11 si no se pasa)"""
+    return duro + 10 if con_as and duro + 10 <= 21 else duro
+
+
+@lru_cache(maxsize=4096)
+def _distribucion_dealer(visible: int, grupo: Tuple[int, ...],
+                         h17: bool) -> Tuple[Tuple[float, ...], float]:
+    """
+    Distribución final del dealer condicionada a que no tenga blackjack
+
+    Returns:
+        (probabilidades de 17, 18, 19, 20, 21 y pasarse; probabilidad de blackjack)
+    """
+    p = _probabilidades(grupo)
+    memo = {}
+
+    def final(duro: int, con_as: bool) -> np.ndarray:
+        clave = (duro, con_as)
+        if clave in memo:
+            return memo[clave]
+        total = _total(duro, con_as)
+        blando = con_as and duro + 10 <= 21
+        if total > 21:
+            resultado = np.eye(6)[5]
+        elif total >= 18 or (total == 17 and not (blando and h17)):
+            resultado = np.eye(6)[total - 17]
+        else:
+            resultado = sum(p[v] * final(duro + v, con_as or v == 1) for v in range(1, 11))
+        memo[clave] = resultado
+        return resultado
+
+    # Carta oculta: se excluye el blackjack (el dealer ya lo revisó)
+    natural = {1: 10, 10: 1}.get(visible)
+    prob_blackjack = p[natural] if natural else 0.0
+    distribucion = sum(p[v] * final(visible + v, visible == 1 or v == 1)
+                       for v in range(1, 11) if v != natural)
+    distribucion = distribucion / (1 - prob_blackjack)
+    return tuple(distribucion.tolist()), float(prob_blackjack)
+
+
+@lru_cache(maxsize=4096)
+def _tabla_jugador(visible: int, grupo: Tuple[int, ...], h17: bool) -> Dict:
+    """
+    EV de plantarse, pedir (jugando óptimo después) y doblar para cada estado
+    (total duro, tiene as) del jugador, más el EV de dividir cada pareja
+    """
+    p = _probabilidades(grupo)
+    distribucion, _ = _distribucion_dealer(visible, grupo, h17)
+    acumulada = np.cumsum(distribucion[:5])
+
+    def plantarse(total: int) -> float:
+        if total > 21:
+            return -1.0
+        gana = distribucion[5] + (acumulada[total - 18] if total >= 18 else 0.0)
+        empata = distribucion[total - 17] if total >= 17 else 0.0
+        return gana - (1 - gana - empata)
+
+    ev_plantarse, ev_pedir, ev_doblar, mejor = {}, {}, {}, {}
+    for con_as in (False, True):
+        mejor[(22, con_as)] = ev_plantarse[(22, con_as)] = ev_pedir[(22, con_as)] = -1.0
+        ev_doblar[(22, con_as)] = -2.0
+    # De mayor a menor: pedir solo lleva a estados con más puntos
+    for duro in range(21, 1, -1):
+        for con_as in (True, False):
+            estado = (duro, con_as)
+            siguientes = [(min(duro + v, 22), con_as or v == 1) for v in range(1, 11)]
+            ev_plantarse[estado] = plantarse(_total(duro, con_as))
+            ev_pedir[estado] = sum(p[v] * mejor[s] for v, s in zip(range(1, 11), siguientes))
+            ev_doblar[estado] = 2 * sum(p[v] * ev_plantarse[s]
+                                        for v, s in zip(range(1, 11), siguientes))
+            mejor[estado] = max(ev_plantarse[estado], ev_pedir[estado])
+
+    # Dividir: dos manos que empiezan con una carta; los ases reciben una sola
+    ev_dividir = {}
+    for v in range(1, 11):
+        manos = [(min(v + w, 22), v == 1 or w == 1) for w in range(1, 11)]
+        if v == 1:
+            ev_mano = sum(p[w] * ev_plantarse[m] for w, m in zip(range(1, 11), manos))
+        else:
+            ev_mano = sum(p[w] * max(mejor[m], ev_doblar[m]) for w, m in zip(range(1, 11), manos))
+        ev_dividir[v] = 2 * ev_mano
+
+    return {'plantarse': ev_plantarse, 'pedir': ev_pedir,
+            'doblar': ev_doblar, 'dividir': ev_dividir}
+
+
+@lru_cache(maxsize=1024)
+def _ev_ronda(grupo: Tuple[int, ...], h17: bool, permitir_rendicion: bool) -> float:
+    """EV de una ronda completa promediando carta visible y mano inicial"""
+    p = _probabilidades(grupo)
+    total = 0.0
+    for visible in range(1, 11):
+        _, prob_blackjack = _distribucion_dealer(visible, grupo, h17)
+        tabla = _tabla_jugador(visible, grupo, h17)
+        ev_visible = 0.0
+        for a in range(1, 11):
+            for b in range(1, 11):
+                if {a, b} == {1, 10}:
+                    # Blackjack del jugador: paga 3:2 salvo empate con el dealer
+                    ev = 1.5 * (1 - prob_blackjack)
+                else:
+                    estado = (a + b, a == 1 or b == 1)
+                    opciones = [tabla['pedir'][estado], tabla['plantarse'][estado],
+                                tabla['doblar'][estado]]
+                    if a == b:
+                        opciones.append(tabla['dividir'][a])
+                    if permitir_rendicion:
+                        opciones.append(-0.5)
+                    ev = -prob_blackjack + (1 - prob_blackjack) * max(opciones)
+                ev_visible += p[a] * p[b] * ev
+        total += p[visible] * ev_visible
+    return float(total)
@@ -0,0 +1,195 @@
+"""
+EVALUADOR_POKER.PY
+Evaluador de manos de póker de 5 a 7 cartas basado en tablas precalculadas
+Esquema de producto de primos: cada rango tiene un primo y el producto de
+los rangos identifica la combinación sin importar el orden de las cartas.
+
+Rango de una mano: 1 (escalera real) a 7462 (peor carta alta). Menor es mejor.
+"""
+
+import numpy as np
+from bisect import bisect_left
+from itertools import combinations, combinations_with_replacement
+from typing import Iterable, Tuple
+from .cartas import Carta, PALO_CARTA, RANGO_CARTA, codificar_carta
+
+
+PRIMOS = np.array([2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41], dtype=np.int64)
+
+CATEGORIAS = (
+    'Escalera de color', 'Póker', 'Full', 'Color', 'Escalera',
+    'Trío', 'Doble pareja', 'Pareja', 'Carta alta'
+)
+# Peor rango (inclusive) de cada categoría
+LIMITES_CATEGORIA = (10, 166, 322, 1599, 1609, 2467, 3325, 6185, 7462)
+
+PEOR_RANGO = 7462
+
+
+def _construir_tablas() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Genera las tablas de evaluación
+
+    Returns:
+        (tabla_color, claves, valores): tabla_color indexada por máscara de
+        rangos de un mismo palo (5-7 bits); claves/valores ordenados por
+        producto de primos para manos sin color de 5, 6 o 7 cartas
+    """
+    primos = PRIMOS.tolist()
+    descendente = list(range(12, -1, -1))
+
+    def producto(rangos):
+        resultado = 1
+        for r in rangos:
+            resultado *= primos[r]
+        return resultado
+
+    # Escaleras de mayor a menor; la última es A-2-3-4-5
+    escaleras = [tuple(range(alta, alta - 5, -1)) for alta in range(12, 3, -1)]
+    escaleras.append((3, 2, 1, 0, 12))
+    mascaras_escalera = {sum(1 << r for r in e) for e in escaleras}
+    sin_escalera = [c for c in combinations(descendente, 5)
+                    if sum(1 << r for r in c) not in mascaras_escalera]
+
+    tabla_color = np.zeros(1 << 13, dtype=np.int16)
+    cinco = {}
+    rango = 1
+
+    for e in escaleras:                                    # Escalera de color
+        tabla_color[sum(1 << r for r in e)] = rango
+        rango += 1
+    for q in descendente:                                  # Póker
+        for k in descendente:
+            if k != q:
+                cinco[primos[q] ** 4 * primos[k]] = rango
+                rango += 1
+    for t in descendente:                                  # Full
+        for p in descendente:
+            if p != t:
+                cinco[primos[t] ** 3 * primos[p] ** 2] = rango
+                rango += 1
+    for c in sin_escalera:                                 # Color
+        tabla_color[sum(1 << r for r in c)] = rango
+        rango += 1
+    for e in escaleras:                                    # Escalera
+        cinco[producto(e)] = rango
+        rango += 1
+    for t in descendente:                                  # Trío
+        for kickers in combinations([r for r in descendente if r != t], 2):
+            cinco[primos[t] ** 3 * producto(kickers)] = rango
+            rango += 1
+    for p1, p2 in combinations(descendente, 2):            # Doble pareja
+        for k in descendente:
+            if k not in (p1, p2):
+                cinco[(primos[p1] * primos[p2]) ** 2 * primos[k]] = rango
+                rango += 1
+    for p in descendente:                                  # Pareja
+        for kickers in combinations([r for r in descendente if r != p], 3):
+            cinco[primos[p] ** 2 * producto(kickers)] = rango
+            rango += 1
+    for c in sin_escalera:                                 # Carta alta
+        cinco[producto(c)] = rango
+        rango += 1
+    assert rango - 1 == PEOR_RANGO
+
+    # Colores de 6 y 7 cartas del mismo palo: mejor subconjunto de 5
+    for bits in (6, 7):
+        for mascara in range(1 << 13):
+            if bin(mascara).count('1') == bits:
+                tabla_color[mascara] = min(
+                    tabla_color[mascara ^ (1 << r)] for r in range(13) if mascara >> r & 1
+                )
+
+    # Manos sin color de 6 y 7 cartas: mejor resultado quitando una carta
+    claves = np.array(sorted(cinco), dtype=np.int64)
+    valores = np.array([cinco[c] for c in claves.tolist()], dtype=np.int16)
+    todas_claves, todos_valores = [claves], [valores]
+    for cantidad in (6, 7):
+        manos = np.array(list(combinations_with_replacement(range(13), cantidad)),
+                         dtype=np.int64)
+        # Como máximo 4 cartas por rango
+        manos = manos[~np.any(manos[:, 4:] == manos[:, :-4], axis=1)]
+        productos = PRIMOS[manos].prod(axis=1)
+        mejor = np.full(len(manos), PEOR_RANGO + 1, dtype=np.int16)
+        for j in range(cantidad):
+            sub = productos // PRIMOS[manos[:, j]]
+            mejor = np.minimum(mejor, valores[np.searchsorted(claves, sub)])
+        orden = np.argsort(productos)
+        claves, valores = productos[orden], mejor[orden]
+        todas_claves.append(claves)
+        todos_valores.append(valores)
+
+    claves = np.concatenate(todas_claves)
+    valores = np.concatenate(todos_valores)
+    orden = np.argsort(claves)
+    return tabla_color, claves[orden], valores[orden]
+
+
+TABLA_COLOR, CLAVES_PRODUCTO, VALORES_PRODUCTO = _construir_tablas()
+_RANGO_POR_PRODUCTO = dict(zip(CLAVES_PRODUCTO.tolist(), VALORES_PRODUCTO.tolist()))
+
+
+def evaluar_mano(cartas: Iterable[Carta]) -> int:
+    """
+    Evalúa una mano de 5 a 7 cartas
+
+    Args:
+        cartas: Cartas en texto ('10♠', 'As') o códigos enteros
+
+    Returns:
+        int: Rango de la mejor mano de 5 cartas (1 = escalera real)
+    """
+    codigos = [codificar_carta(c) for c in cartas]
+    if not 5 <= len(codigos) <= 7:
+        raise ValueError(f"Se necesitan entre 5 y 7 cartas, recibidas {len(codigos)}")
+    if len(set(codigos)) != len(codigos):
+        raise ValueError("La mano contiene cartas repetidas")
+
+    mascaras = [0, 0, 0, 0]
+    producto = 1
+    for codigo in codigos:
+        rango = codigo % 13
+        mascaras[codigo // 13] |= 1 << rango
+        producto *= int(PRIMOS[rango])
+
+    # Con 7 cartas o menos, un color excluye póker y full
+    for mascara in mascaras:
+        if bin(mascara).count('1') >= 5:
+            return int(TABLA_COLOR[mascara])
+    return _RANGO_POR_PRODUCTO[producto]
+
+
+def evaluar_lote(codigos: np.ndarray) -> np.ndarray:
+    """
+    Evalúa muchas manos a la vez
+
+    Args:
+        codigos: Matriz (manos × cartas) de códigos 0-51, con 5 a 7 columnas
+
+    Returns:
+        np.ndarray: Rango de cada mano (int16)
+    """
+    codigos = np.asarray(codigos)
+    if codigos.ndim != 2 or not 5 <= codigos.shape[1] <= 7:
+        raise ValueError("Se esperaba una matriz (manos × cartas) de 5 a 7 columnas")
+
+    rangos = RANGO_CARTA[codigos]
+    palos = PALO_CARTA[codigos]
+    productos = PRIMOS[rangos].prod(axis=1)
+    resultado = VALORES_PRODUCTO[np.searchsorted(CLAVES_PRODUCTO, productos)]
+
+    bits = np.left_shift(1, rangos.astype(np.int32))
+    for palo in range(4):
+        en_palo = palos == palo
+        con_color = en_palo.sum(axis=1) >= 5
+        if con_color.any():
+            mascaras = np.bitwise_or.reduce(np.where(en_palo[con_color], bits[con_color], 0), axis=1)
+            resultado[con_color] = TABLA_COLOR[mascaras]
+    return resultado
+
+
+def categoria_mano(rango: int) -> str:
+    """Nombre de la categoría de una mano a partir de su rango"""
+    if rango == 1:
+        return 'Escalera real'
+    return CATEGORIAS[bisect_left(LIMITES_CATEGORIA, rango)]
@@ -0,0 +1,82 @@
+"""
+FRECUENCIAS_RULETA.PY
+Conteo incremental de frecuencias sobre una ventana deslizante de ruleta
+Cada número que entra o sale de la ventana se procesa en O(1)
+"""
+
+import numpy as np
+from collections import deque
+from typing import Iterable, Tuple
+from .geometria_ruleta import COLOR, COLUMNA, DOCENA
+
+
+class FrecuenciasRuleta:
+    """
+    Ventana deslizante de tiradas con contadores fijos actualizados en O(1).
+    Mantiene 37 contadores por número más contadores de color, docena y columna.
+    """
+
+    def __init__(self, ventana: int = 100):
+        """
+        Args:
+            ventana: Cantidad máxima de tiradas consideradas
+        """
+        self.ventana = ventana
+        self.historial = deque(maxlen=ventana)
+        self.conteos = np.zeros(37, dtype=np.int64)
+        self.conteos_color = np.zeros(3, dtype=np.int64)
+        self.conteos_docena = np.zeros(4, dtype=np.int64)
+        self.conteos_columna = np.zeros(4, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.historial)
+
+    def agregar(self, numero: int):
+        """Agrega una tirada y descarta la más antigua si la ventana está llena"""
+        numero = int(numero)
+        if not 0 <= numero <= 36:
+            raise ValueError(f"Número de ruleta inválido: {numero}")
+
+        if len(self.historial) == self.ventana:
+            self._mover(self.historial[0], -1)
+
+        self.historial.append(numero)
+        self._mover(numero, 1)
+
+    def agregar_varios(self, numeros: Iterable[int]):
+        """Agrega varias tiradas en orden"""
+        for numero in numeros:
+            self.agregar(numero)
+
+    def reiniciar(self):
+        """Vacía la ventana y todos los contadores"""
+        self.historial.clear()
+        self.conteos[:] = 0
+        self.conteos_color[:] = 0
+        self.conteos_docena[:] = 0
+        self.conteos_columna[:] = 0
+
+    def numeros_calientes(self, cantidad: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+        """Números más frecuentes y su frecuencia (solo los que aparecieron)"""
+        orden = np.argsort(-self.conteos, kind='stable')[:cantidad]
+        frecuencias = self.conteos[orden]
+        return orden[frecuencias > 0], frecuencias[frecuencias > 0]
+
+    def numeros_frios(self, cantidad: int = 5) -> np.ndarray:
+        """Números que no aparecen en la ventana actual"""
+        return np.flatnonzero(self.conteos == 0)[:cantidad]
+
+    def probabilidades_color(self) -> np.ndarray:
+        """Porcentajes observados de (rojo, negro, verde)"""
+        total = len(self.historial)
+        if total == 0:
+            return np.array([48.6, 48.6, 2.8])
+
+        return self.conteos_color[[1, 2, 0]] / total * 100
+
+    def _mover(self, numero: int, delta: int):
+        """Suma o resta una aparición de un número en todos los contadores"""
+        self.conteos[numero] += delta
+        self.conteos_color[COLOR[numero]] += delta
+        self.conteos_docena[DOCENA[numero]] += delta
+        self.conteos_columna[COLUMNA[numero]] += delta
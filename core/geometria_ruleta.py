@@ -0,0 +1,69 @@
+"""
+GEOMETRIA_RULETA.PY
+Tablas precalculadas de la ruleta europea indexadas por número (0-36)
+Clasificar una tirada es un acceso a array; clasificar un lote, un fancy-indexing
+"""
+
+import numpy as np
+from typing import Dict
+
+
+# Números rojos de la ruleta europea
+ROJOS = (1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36)
+
+# Orden físico de los números en el cilindro, en sentido horario desde el cero
+ORDEN_RUEDA = np.array([
+    0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10,
+    5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26
+], dtype=np.int8)
+
+# Sectores clásicos del cilindro (apuestas francesas)
+VECINOS_CERO = (22, 18, 29, 7, 28, 12, 35, 3, 26, 0, 32, 15, 19, 4, 21, 2, 25)
+TERCIO_CILINDRO = (27, 13, 36, 11, 30, 8, 23, 10, 5, 24, 16, 33)
+HUERFANOS = (1, 20, 14, 31, 9, 17, 34, 6)
+
+_NUMEROS = np.arange(37)
+
+# Códigos por número. El cero siempre usa el código 0.
+# color: 0 = verde, 1 = rojo, 2 = negro
+COLOR = np.where(_NUMEROS == 0, 0, np.where(np.isin(_NUMEROS, ROJOS), 1, 2)).astype(np.int8)
+# paridad: 0 = cero, 1 = par, 2 = impar
+PARIDAD = np.where(_NUMEROS == 0, 0, 2 - (_NUMEROS % 2 == 0)).astype(np.int8)
+# docena y columna: 1-3
+DOCENA = np.where(_NUMEROS == 0, 0, (_NUMEROS - 1) // 12 + 1).astype(np.int8)
+COLUMNA = np.where(_NUMEROS == 0, 0, (_NUMEROS - 1) % 3 + 1).astype(np.int8)
+# mitad: 1 = bajo (1-18), 2 = alto (19-36)
+ALTO_BAJO = np.where(_NUMEROS == 0, 0, np.where(_NUMEROS <= 18, 1, 2)).astype(np.int8)
+# posición de cada número en el cilindro (inversa de ORDEN_RUEDA)
+POSICION_RUEDA = np.argsort(ORDEN_RUEDA).astype(np.int8)
+# sector: 0 = vecinos del cero, 1 = tercio del cilindro, 2 = huérfanos
+SECTOR = np.where(np.isin(_NUMEROS, VECINOS_CERO), 0,
+                  np.where(np.isin(_NUMEROS, TERCIO_CILINDRO), 1, 2)).astype(np.int8)
+
+NOMBRES_COLOR = ('verde', 'rojo', 'negro')
+NOMBRES_PARIDAD = ('cero', 'par', 'impar')
+NOMBRES_ALTO_BAJO = ('cero', 'bajo', 'alto')
+NOMBRES_SECTOR = ('vecinos del cero', 'tercio del cilindro', 'huérfanos')
+
+
+def clasificar_numeros(numeros) -> Dict[str, np.ndarray]:
+    """
+    Clasifica uno o varios números con un único indexado por tabla
+    
+    Args:
+        numeros: Número o array de números (0-36)
+        
+    Returns:
+        Dict con los códigos de color, paridad, docena, columna,
+        alto/bajo, posición en el cilindro y sector
+    """
+    indices = np.asarray(numeros, dtype=np.intp)
+    return {
+        'color': COLOR[indices],
+        'paridad': PARIDAD[indices],
+        'docena': DOCENA[indices],
+        'columna': COLUMNA[indices],
+        'alto_bajo': ALTO_BAJO[indices],
+        'posicion_rueda': POSICION_RUEDA[indices],
+        'sector': SECTOR[indices]
+    }
@@ -0,0 +1,268 @@
+"""
+MOTOR_BLACKJACK.PY
+Motor vectorizado de rondas completas de blackjack
+Juega miles de rondas a la vez sobre arrays de NumPy: estrategia básica por
+tablas, dealer S17/H17 con peek, doblar, dividir, rendición tardía y pago
+configurable del blackjack natural.
+
+Modelo: mazo infinito (cada carta es un código 0-51 uniforme), una sola
+división por ronda (sin redividir), los ases divididos reciben una carta y
+un 21 tras dividir no cuenta como blackjack.
+"""
+
+import numpy as np
+from typing import Dict, Optional
+from .cartas import VALOR_BLACKJACK
+
+# Acciones de las tablas de estrategia
+PLANTARSE, PEDIR, DOBLAR, DOBLAR_O_PLANTARSE, RENDIRSE, RENDIRSE_O_PLANTARSE, DIVIDIR = range(7)
+_CODIGOS_ACCION = {'S': PLANTARSE, 'H': PEDIR, 'D': DOBLAR, 'd': DOBLAR_O_PLANTARSE,
+                   'R': RENDIRSE, 'r': RENDIRSE_O_PLANTARSE, 'P': DIVIDIR}
+
+# Resultado de cada ronda
+RESULTADOS_RONDA = ('pierde', 'empate', 'gana', 'blackjack', 'rendicion')
+PIERDE, EMPATE, GANA, BLACKJACK, RENDICION = range(5)
+
+# Valor de cada código de carta con el as como 1
+VALOR_DURO = np.where(VALOR_BLACKJACK == 11, 1, VALOR_BLACKJACK).astype(np.int8)
+
+# Columnas de las tablas: carta visible del dealer 2, 3, ..., 10, A
+_ESTRATEGIA_DURA = {
+    # total: 2 3 4 5 6 7 8 9 T A
+    17: 'SSSSSSSSSS',
+    16: 'SSSSSHHRRR',
+    15: 'SSSSSHHHRH',
+    14: 'SSSSSHHHHH',
+    13: 'SSSSSHHHHH',
+    12: 'HHSSSHHHHH',
+    11: 'DDDDDDDDDH',
+    10: 'DDDDDDDDHH',
+    9: 'HDDDDHHHHH',
+}
+_ESTRATEGIA_BLANDA = {
+    20: 'SSSSSSSSSS',
+    19: 'SSSSSSSSSS',
+    18: 'SddddSSHHH',
+    17: 'HDDDDHHHHH',
+    16: 'HHDDDHHHHH',
+    15: 'HHDDDHHHHH',
+    14: 'HHHDDHHHHH',
+    13: 'HHHDDHHHHH',
+}
+_ESTRATEGIA_PARES = {
+    # valor de la pareja (1 = ases); '-' = jugar como total normal
+    1: 'PPPPPPPPPP',
+    10: '----------',
+    9: 'PPPPPSPPSS',
+    8: 'PPPPPPPPPP',
+    7: 'PPPPPPHHHH',
+    6: 'PPPPPHHHHH',
+    5: '----------',
+    4: 'HHHPPHHHHH',
+    3: 'PPPPPPHHHH',
+    2: 'PPPPPPHHHH',
+}
+# Cambios de la estrategia básica cuando el dealer pide con 17 blando
+_CAMBIOS_H17 = (('dura', 11, 9, 'D'), ('dura', 15, 9, 'R'), ('dura', 17, 9, 'r'),
+                ('blanda', 18, 0, 'd'), ('blanda', 19, 4, 'd'))
+
+
+def tablas_estrategia(h17: bool = False) -> Dict[str, np.ndarray]:
+    """
+    Tablas de estrategia básica (4-8 mazos, doblar tras dividir, rendición tardía)
+
+    Returns:
+        Dict con 'dura' y 'blanda' (32 totales × 10 cartas del dealer) y
+        'pares' (11 valores × 10); en 'pares' -1 significa no dividir
+    """
+    dura = np.full((32, 10), PLANTARSE, dtype=np.int8)
+    dura[:9] = PEDIR
+    for total, fila in _ESTRATEGIA_DURA.items():
+        dura[total] = [_CODIGOS_ACCION[a] for a in fila]
+    dura[17:] = dura[17]
+
+    blanda = np.full((32, 10), PLANTARSE, dtype=np.int8)
+    for total, fila in _ESTRATEGIA_BLANDA.items():
+        blanda[total] = [_CODIGOS_ACCION[a] for a in fila]
+
+    pares = np.full((11, 10), -1, dtype=np.int8)
+    for valor, fila in _ESTRATEGIA_PARES.items():
+        pares[valor] = [_CODIGOS_ACCION.get(a, -1) for a in fila]
+
+    tablas = {'dura': dura, 'blanda': blanda, 'pares': pares}
+    if h17:
+        for tabla, total, columna, accion in _CAMBIOS_H17:
+            tablas[tabla][total, columna] = _CODIGOS_ACCION[accion]
+    return tablas
+
+
+_TABLAS = {False: tablas_estrategia(False), True: tablas_estrategia(True)}
+
+
+def jugar_rondas(rng: np.random.Generator, rondas: int, h17: bool = False,
+                 pago_blackjack: float = 1.5, doblar_tras_dividir: bool = True,
+                 rendicion: bool = True,
+                 estrategia: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+    """
+    Juega `rondas` rondas independientes de un jugador contra el dealer
+
+    Args:
+        rng: Generador del que salen las cartas
+        rondas: Cantidad de rondas
+        h17: True si el dealer pide con 17 blando
+        pago_blackjack: Pago del blackjack natural (1.5 = 3:2, 1.2 = 6:5)
+        doblar_tras_dividir: Si se permite doblar las manos divididas
+        rendicion: Si se ofrece rendición tardía
+        estrategia: Tablas propias (formato de `tablas_estrategia`); por
+            defecto la estrategia básica según h17
+
+    Returns:
+        Dict con arrays por ronda: 'neto' (unidades de apuesta ganadas o
+        perdidas), 'resultado' (índice en RESULTADOS_RONDA), 'dividida'
+        y 'doblada'
+    """
+    tablas = estrategia or _TABLAS[bool(h17)]
+    neto = np.zeros(rondas, dtype=np.float64)
+    resultado = np.zeros(rondas, dtype=np.int8)
+    doblada = np.zeros(rondas, dtype=bool)
+    dividida = np.zeros(rondas, dtype=bool)
+
+    # Reparto inicial: jugador, visible del dealer, jugador, oculta del dealer
+    iniciales = VALOR_DURO[rng.integers(0, 52, (4, rondas), dtype=np.uint8)]
+    primera, visible, segunda, oculta = iniciales.astype(np.int16)
+    columna = (visible + 8) % 10  # 2-10 -> 0-8, as -> 9
+
+    # Naturales (el dealer revisa su carta oculta antes de que se juegue)
+    natural_jugador = (primera + segunda == 11) & ((primera == 1) | (segunda == 1))
+    natural_dealer = (visible + oculta == 11) & ((visible == 1) | (oculta == 1))
+    solo_jugador = natural_jugador & ~natural_dealer
+    neto[solo_jugador] = pago_blackjack
+    resultado[solo_jugador] = BLACKJACK
+    neto[natural_dealer & ~natural_jugador] = -1.0
+    resultado[natural_dealer & natural_jugador] = EMPATE
+    activas = np.flatnonzero(~(natural_jugador | natural_dealer))
+
+    # Primera decisión sobre las dos cartas: dividir, rendirse o jugar
+    c1, c2, col = primera[activas], segunda[activas], columna[activas]
+    accion_par = np.where(c1 == c2, tablas['pares'][c1, col], -1)
+    dividir = accion_par == DIVIDIR
+    accion = np.where(accion_par >= 0, accion_par,
+                      _accion(tablas, c1 + c2, (c1 == 1) | (c2 == 1), col))
+    rendirse = rendicion & ~dividir & ((accion == RENDIRSE) | (accion == RENDIRSE_O_PLANTARSE))
+    neto[activas[rendirse]] = -0.5
+    resultado[activas[rendirse]] = RENDICION
+
+    # Manos a jugar: una por ronda normal y dos por ronda dividida
+    normales = ~dividir & ~rendirse
+    divididas = activas[dividir]
+    dividida[divididas] = True
+    par = c1[dividir]
+    ronda = np.concatenate((activas[normales], divididas, divididas))
+    base = np.concatenate((c1[normales], par, par))
+    otra = np.concatenate((c2[normales], _sacar(rng, 2 * divididas.size)))
+    duro = base + otra
+    con_as = (base == 1) | (otra == 1)
+    es_dividida = np.arange(ronda.size) >= ronda.size - 2 * divididas.size
+    apuesta = np.ones(ronda.size, dtype=np.float64)
+    col_mano = columna[ronda]
+
+    # Los ases divididos reciben una sola carta
+    jugando = ~(es_dividida & (base == 1))
+
+    # Decisión sobre dos cartas: doblar recibe una carta y termina la mano
+    accion = _accion(tablas, duro, con_as, col_mano)
+    doblar = (jugando & (doblar_tras_dividir | ~es_dividida) &
+              ((accion == DOBLAR) | (accion == DOBLAR_O_PLANTARSE)))
+    if doblar.any():
+        cartas = _sacar(rng, int(doblar.sum()))
+        duro[doblar] += cartas
+        con_as[doblar] |= cartas == 1
+    jugando &= ~doblar
+    apuesta[doblar] = 2.0
+    doblada[ronda[doblar]] = True
+
+    # Pedir mientras la estrategia lo indique (D/d/R/r sin opción -> pedir/plantarse)
+    while True:
+        total, _ = _total(duro, con_as)
+        accion = _accion(tablas, duro, con_as, col_mano)
+        pide = jugando & (total < 21) & ((accion == PEDIR) | (accion == DOBLAR) |
+                                         (accion == RENDIRSE))
+        jugando = pide
+        if not pide.any():
+            break
+        cartas = _sacar(rng, int(pide.sum()))
+        duro[pide] += cartas
+        con_as[pide] |= cartas == 1
+
+    total, _ = _total(duro, con_as)
+    viva = total <= 21
+
+    # Dealer: solo juega en rondas con alguna mano viva
+    juega_dealer = np.zeros(rondas, dtype=bool)
+    juega_dealer[ronda[viva]] = True
+    indices = np.flatnonzero(juega_dealer)
+    duro_dealer = visible[indices] + oculta[indices]
+    as_dealer = (visible[indices] == 1) | (oculta[indices] == 1)
+    while True:
+        total_dealer, blanda_dealer = _total(duro_dealer, as_dealer)
+        pide = (total_dealer < 17) | (h17 & (total_dealer == 17) & blanda_dealer)
+        if not pide.any():
+            break
+        cartas = _sacar(rng, int(pide.sum()))
+        duro_dealer[pide] += cartas
+        as_dealer[pide] |= cartas == 1
+    final_dealer = np.zeros(rondas, dtype=np.int16)
+    final_dealer[indices] = total_dealer
+
+    # Liquidación de cada mano y suma por ronda
+    dealer_mano = final_dealer[ronda]
+    gana = viva & ((dealer_mano > 21) | (total > dealer_mano))
+    pierde = ~viva | ((dealer_mano <= 21) & (dealer_mano > total))
+    neto += np.bincount(ronda, weights=apuesta * (gana.astype(np.float64) - pierde),
+                        minlength=rondas)
+
+    jugadas = np.zeros(rondas, dtype=bool)
+    jugadas[ronda] = True
+    resultado[jugadas] = np.where(neto[jugadas] > 0, GANA,
+                                  np.where(neto[jugadas] < 0, PIERDE, EMPATE))
+    return {'neto': neto, 'resultado': resultado, 'dividida': dividida, 'doblada': doblada}
+
+
+def accion_basica(duro: int, con_as: bool, visible: int, h17: bool = False) -> int:
+    """
+    Acción de la estrategia básica para una sola mano (sin dividir)
+
+    Args:
+        duro: Suma de la mano contando el as como 1
+        con_as: Si la mano tiene algún as
+        visible: Valor de la carta visible del dealer (as = 1)
+        h17: True si el dealer pide con 17 blando
+    """
+    total, blanda = _total(duro, con_as)
+    tabla = _TABLAS[bool(h17)]['blanda' if blanda else 'dura']
+    return int(tabla[min(total, 31), (visible + 8) % 10])
+
+
+def dealer_pide(duro: int, con_as: bool, h17: bool = False) -> bool:
+    """Si el dealer debe pedir con esta mano (S17 o H17)"""
+    total, blanda = _total(duro, con_as)
+    return bool(total < 17 or (h17 and total == 17 and blanda))
+
+
+def _sacar(rng: np.random.Generator, cantidad: int) -> np.ndarray:
+    """Valores (as = 1) de `cantidad` cartas nuevas"""
+    return VALOR_DURO[rng.integers(0, 52, cantidad, dtype=np.uint8)].astype(np.int16)
+
+
+def _total(duro: np.ndarray, con_as: np.ndarray):
+    """Total de cada mano y si es blanda (un as contado como 11)"""
+    blanda = con_as & (duro <= 11)
+    return duro + 10 * blanda, blanda
+
+
+def _accion(tablas: Dict[str, np.ndarray], duro: np.ndarray, con_as: np.ndarray,
+            columna: np.ndarray) -> np.ndarray:
+    """Acción de la estrategia para cada mano según su total y la carta del dealer"""
+    total, blanda = _total(duro, con_as)
+    total = np.minimum(total, 31)
+    return np.where(blanda, tablas['blanda'][total, columna], tablas['dura'][total, columna])
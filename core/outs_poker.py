@@ -0,0 +1,115 @@
+"""
+OUTS_POKER.PY
+Enumeración exacta de outs en flop y turn
+Los resultados se memorizan bajo una clave canónica por palos: dos
+situaciones que solo difieren en una permutación de palos comparten entrada.
+"""
+
+import numpy as np
+from functools import lru_cache
+from itertools import combinations, permutations
+from typing import Dict, Iterable, List, Tuple
+from .cartas import Carta, codificar_carta, nombre_carta
+from .evaluador_poker import CATEGORIAS, LIMITES_CATEGORIA, evaluar_lote, evaluar_mano
+
+
+_PERMUTACIONES_PALOS = list(permutations(range(4)))
+
+
+def calcular_outs(mano: Iterable[Carta], comunitarias: Iterable[Carta]) -> Dict:
+    """
+    Cuenta las cartas no vistas que mejoran la categoría de la mano
+
+    Args:
+        mano: 2 cartas del jugador
+        comunitarias: 3 (flop) o 4 (turn) cartas en la mesa
+
+    Returns:
+        Dict con outs para la próxima carta, probabilidad de mejorar en la
+        próxima carta y probabilidad de mejorar al llegar al river
+    """
+    propias = [codificar_carta(c) for c in mano]
+    board = [codificar_carta(c) for c in comunitarias]
+    if len(propias) != 2 or len(board) not in (3, 4):
+        raise ValueError("Se necesitan 2 cartas propias y un board de 3 o 4 cartas")
+    if len(set(propias + board)) != len(propias) + len(board):
+        raise ValueError("Hay cartas repetidas entre mano y board")
+
+    propias_c, board_c, permutacion = _canonizar(propias, board)
+    categoria, outs, prob_siguiente, prob_final, no_vistas = _outs_canonicos(propias_c, board_c)
+
+    # Devolver las cartas out en los palos originales
+    inversa = np.argsort(permutacion)
+    cartas_out = [nombre_carta(int(inversa[c // 13]) * 13 + c % 13) for c in outs]
+
+    return {
+        'categoria_actual': CATEGORIAS[categoria],
+        'outs': len(outs),
+        'cartas_out': sorted(cartas_out),
+        'cartas_no_vistas': no_vistas,
+        'prob_mejorar_siguiente': round(prob_siguiente * 100, 2),
+        'prob_mejorar_final': round(prob_final * 100, 2)
+    }
+
+
+def estadisticas_cache_outs() -> Dict:
+    """Aciertos, fallos y tasa de aciertos de la memoización de outs"""
+    info = _outs_canonicos.cache_info()
+    consultas = info.hits + info.misses
+    return {
+        'aciertos': info.hits,
+        'fallos': info.misses,
+        'tasa_aciertos': round(info.hits / consultas * 100, 2) if consultas else 0.0,
+        'entradas': info.currsize,
+        'capacidad': info.maxsize
+    }
+
+
+def _canonizar(propias: List[int], board: List[int]) -> Tuple[tuple, tuple, tuple]:
+    """
+    Representante canónico bajo permutación de palos
+
+    Returns:
+        (propias, board, permutacion): cartas canónicas ordenadas y la
+        permutación aplicada (palo original -> palo canónico)
+    """
+    mejor = None
+    for perm in _PERMUTACIONES_PALOS:
+        clave = (
+            tuple(sorted(perm[c // 13] * 13 + c % 13 for c in propias)),
+            tuple(sorted(perm[c // 13] * 13 + c % 13 for c in board))
+        )
+        if mejor is None or clave < mejor[0]:
+            mejor = (clave, perm)
+    (propias_c, board_c), perm = mejor
+    return propias_c, board_c, perm
+
+
+@lru_cache(maxsize=65536)
+def _outs_canonicos(propias: tuple, board: tuple) -> Tuple[int, tuple, float, float, int]:
+    """Enumeración exhaustiva sobre una situación ya canonizada"""
+    vistas = list(propias) + list(board)
+    categoria = int(_categoria(evaluar_mano(vistas)))
+    no_vistas = np.setdiff1d(np.arange(52), vistas).astype(np.uint8)
+    base = np.array(vistas, dtype=np.uint8)
+
+    # Próxima carta: todas las no vistas
+    siguientes = np.column_stack([np.broadcast_to(base, (len(no_vistas), len(base))), no_vistas])
+    mejora = _categoria(evaluar_lote(siguientes)) < categoria
+    outs = tuple(no_vistas[mejora].tolist())
+    prob_siguiente = float(mejora.mean())
+
+    # Desde el flop: todas las parejas turn + river
+    if len(board) == 3:
+        parejas = np.array(list(combinations(no_vistas.tolist(), 2)), dtype=np.uint8)
+        finales = np.column_stack([np.broadcast_to(base, (len(parejas), len(base))), parejas])
+        prob_final = float((_categoria(evaluar_lote(finales)) < categoria).mean())
+    else:
+        prob_final = prob_siguiente
+
+    return categoria, outs, prob_siguiente, prob_final, len(no_vistas)
+
+
+def _categoria(rangos):
+    """Índice de categoría en CATEGORIAS (0 = escalera de color)"""
+    return np.searchsorted(LIMITES_CATEGORIA, rangos)
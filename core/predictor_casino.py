@@ -5,8 +5,21 @@ Análisis basado en ventanas históricas y probabilidades condicionales
 """
 
 import numpy as np
-from collections import Counter, deque
-from typing import Dict, List, Tuple
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from .equidad_poker import calcular_equidad
+from .estadisticas_jackpot import EstadisticasJackpot, TendenciaIncremental
+from .ev_blackjack import analizar_mano, ev_ronda
+from .evaluador_poker import categoria_mano, evaluar_mano
+from .frecuencias_ruleta import FrecuenciasRuleta
+from .geometria_ruleta import COLOR
+from .outs_poker import calcular_outs
+from .rachas_ruleta import RachasRuleta
+from .resultados import ResultadoBlackjack, ResultadoJackpot, ResultadoPoker, ResultadoRuleta
+from .sesgo_ruleta import DetectorSesgoRuleta
+from .tabla_preflop import equidad_preflop
+from .ventanas_ruleta import VENTANAS_POR_DEFECTO, VentanasRuleta
+from .zapato_blackjack import ZapatoBlackjack
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -17,332 +30,459 @@ class PredictorCasino:
     No usa ML tradicional, sino análisis de frecuencias y patrones.
     """
     
-    def __init__(self, ventana_historica: int = 100):
+    def __init__(self, ventana_historica: int = 100, num_mazos: int = 6,
+                 penetracion: float = 0.75, sistema_conteo: str = 'hi_lo',
+                 ventana_tendencia: int = 20,
+                 ventanas_ruleta: Sequence[int] = VENTANAS_POR_DEFECTO,
+                 semilla: Optional[int] = None):
         """
         Args:
             ventana_historica: Cantidad de tiradas/manos a considerar para análisis
+            num_mazos: Mazos por zapato en las mesas de blackjack
+            penetracion: Fracción del zapato repartida antes de barajar
+            sistema_conteo: Sistema de conteo principal para blackjack
+            ventana_tendencia: Premios usados para la pendiente del jackpot
+            ventanas_ruleta: Ventanas (tiradas) del análisis multiventana de ruleta
+            semilla: Semilla del generador usado cuando no hay datos para decidir
         """
         self.ventana_historica = ventana_historica
-        self.historiales = {
-            'ruleta': deque(maxlen=ventana_historica),
-            'blackjack': deque(maxlen=ventana_historica),
-            'poker': deque(maxlen=ventana_historica),
-            'jackpot': deque(maxlen=ventana_historica)
-        }
+        self.num_mazos = num_mazos
+        self.penetracion = penetracion
+        self.sistema_conteo = sistema_conteo
+        self.ventana_tendencia = ventana_tendencia
+        self.ventanas_ruleta = tuple(ventanas_ruleta)
+        self._rng = np.random.default_rng(semilla)
+        # Estado independiente por (juego, mesa)
+        self.mesas: Dict[Tuple[str, str], Dict] = {}
+    
+    def actualizar(self, juego: str, mesa: str, eventos: List,
+                   secuencia: Optional[int] = None, epoca: Optional[int] = None) -> int:
+        """
+        Incorpora al estado de una mesa solo los eventos que aún no ha visto
+        
+        Si faltan eventos entre la última consulta y `eventos` (la mesa
+        produjo más de los que se reciben), los dos tramos no se empalman:
+        se marca un hueco (ver `_marcar_hueco`) y se sigue desde `eventos`.
         
-    def predecir_ruleta(self, historial: List[int]) -> Dict:
+        Args:
+            juego: Nombre del juego
+            mesa: Identificador de la mesa
+            eventos: Eventos recientes de la mesa, del más antiguo al más nuevo
+            secuencia: Total de eventos producidos por la mesa hasta el último
+                de `eventos`. Si es None, `eventos` se toma como el historial
+                completo y el estado de la mesa se reconstruye desde cero.
+            epoca: Identificador del tramo de juego actual (sube en cada
+                barajado o reinicio de la mesa). Si cambia, `eventos` se toma
+                como el tramo nuevo completo y el estado se reconstruye.
+            
+        Returns:
+            Cantidad de eventos nuevos incorporados
+        """
+        estado = self._obtener_estado_mesa(juego, mesa)
+        ultima = estado['secuencia']
+        
+        if (secuencia is None or ultima is None or secuencia < ultima
+                or epoca != estado['epoca']):
+            # Historial desconocido, barajado o mesa reiniciada: reconstruir
+            self._reiniciar_estado_mesa(estado)
+            nuevos = list(eventos)
+        elif secuencia - ultima > len(eventos):
+            # Hay eventos que nunca se vieron: cortar en lugar de empalmar
+            self._marcar_hueco(estado, secuencia - ultima - len(eventos))
+            nuevos = list(eventos)
+        else:
+            pendientes = secuencia - ultima
+            nuevos = list(eventos[len(eventos) - pendientes:]) if pendientes else []
+        
+        estado['eventos'].extend(nuevos)
+        if juego == 'ruleta' and nuevos:
+            # En lote: sesgo y ventanas se actualizan vectorizados
+            estado['frecuencias'].agregar_varios(nuevos)
+            estado['sesgo'].agregar_varios(nuevos)
+            estado['rachas'].agregar_varios(nuevos)
+            estado['ventanas'].agregar_varios(nuevos)
+        elif juego == 'blackjack':
+            estado['zapato'].agregar_varias(nuevos)
+        elif juego == 'jackpot':
+            for evento in nuevos:
+                estado['estadisticas'].agregar(evento)
+                estado['tendencia'].agregar(evento)
+        
+        estado['secuencia'] = secuencia
+        estado['epoca'] = epoca
+        return len(nuevos)
+    
+    def predecir_ruleta(self, historial: List[int], mesa: str = 'table_1',
+                        secuencia: Optional[int] = None,
+                        detalle: bool = True,
+                        epoca: Optional[int] = None) -> ResultadoRuleta:
         """
         Predice siguiente número y color en ruleta europea (0-36)
         
         Args:
             historial: Lista de números recientes
+            mesa: Identificador de la mesa
+            secuencia: Total de tiradas de la mesa (ver `actualizar`)
+            detalle: Si incluye rachas, transiciones, detección de sesgo y el
+                análisis de todas las ventanas de `ventanas_ruleta`
+                (desactivar en lotes y backtests para ahorrar asignaciones)
+            epoca: Reinicio de la mesa al que pertenece el historial (ver `actualizar`)
             
         Returns:
-            Dict con predicciones y probabilidades
+            ResultadoRuleta con predicciones y probabilidades
         """
         if not historial:
-            return self._prediccion_ruleta_vacia()
-        
-        # Actualizar historial interno
-        for num in historial[-self.ventana_historica:]:
-            self.historiales['ruleta'].append(num)
-        
-        # Análisis de frecuencias
-        counter = Counter(self.historiales['ruleta'])
-        total_tiradas = len(self.historiales['ruleta'])
+            return ResultadoRuleta.vacio()
         
-        # Números calientes (más frecuentes)
-        numeros_calientes = counter.most_common(5)
+        # Incorporar solo las tiradas nuevas de esta mesa (O(1) por tirada)
+        self.actualizar('ruleta', mesa, historial, secuencia, epoca)
+        estado = self.mesas[('ruleta', mesa)]
+        frecuencias = estado['frecuencias']
+        total_tiradas = len(frecuencias)
         
-        # Números fríos (menos frecuentes)
-        todos_numeros = set(range(37))
-        numeros_en_historial = set(self.historiales['ruleta'])
-        numeros_frios = list(todos_numeros - numeros_en_historial)[:5]
-        
-        # Análisis de colores
-        rojos = [1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36]
-        negros = [2,4,6,8,10,11,13,15,17,20,22,24,26,28,29,31,33,35]
-        
-        count_rojo = sum(1 for n in self.historiales['ruleta'] if n in rojos)
-        count_negro = sum(1 for n in self.historiales['ruleta'] if n in negros)
-        count_verde = sum(1 for n in self.historiales['ruleta'] if n == 0)
-        
-        prob_rojo = (count_rojo / total_tiradas * 100) if total_tiradas > 0 else 48.6
-        prob_negro = (count_negro / total_tiradas * 100) if total_tiradas > 0 else 48.6
-        prob_verde = (count_verde / total_tiradas * 100) if total_tiradas > 0 else 2.8
+        # Números calientes (más frecuentes) y fríos (sin apariciones)
+        calientes, frecuencias_calientes = frecuencias.numeros_calientes(5)
+        numeros_frios = frecuencias.numeros_frios(5)
         
         # Análisis de secuencias
-        secuencia_actual = self._analizar_secuencia_ruleta(list(self.historiales['ruleta']))
+        rachas = estado['rachas']
+        secuencia_actual = self._analizar_secuencia_ruleta(rachas)
         
         # Predicción del próximo número (basado en frecuencias)
-        if numeros_calientes:
-            numero_predicho = numeros_calientes[0][0]
-            confianza = min(numeros_calientes[0][1] / total_tiradas * 100, 95)
+        if len(calientes):
+            numero_predicho = calientes[0]
+            confianza = min(frecuencias_calientes[0] / total_tiradas * 100, 95)
         else:
-            numero_predicho = np.random.randint(0, 37)
+            numero_predicho = int(self._rng.integers(37))
             confianza = 2.7  # Probabilidad teórica 1/37
         
+        detalles = None
+        if detalle:
+            detalles = rachas.resumen()
+            detalles['deteccion_sesgo'] = estado['sesgo'].resumen()
+            detalles['ventanas'] = estado['ventanas'].resumen()
+            detalles['tiradas_perdidas'] = estado['eventos_perdidos']
+        
+        return ResultadoRuleta(
+            numero_predicho, confianza, frecuencias.probabilidades_color(),
+            calientes, frecuencias_calientes, numeros_frios,
+            secuencia_actual, total_tiradas, detalles
+        )
+    
+    def predecir_ruleta_lote(self, historiales: Union[np.ndarray, Sequence[Sequence[int]]],
+                             cantidad: int = 5) -> Dict[str, np.ndarray]:
+        """
+        Predice varias mesas de ruleta a la vez en una sola pasada vectorizada
+        
+        Args:
+            historiales: Matriz (mesas × tiradas) o lista de historiales de
+                distinta longitud. Se usan las últimas `ventana_historica`
+                tiradas de cada mesa.
+            cantidad: Números calientes/fríos a reportar por mesa
+            
+        Returns:
+            Dict columnar con un array por campo (una fila por mesa). Las
+            posiciones sin número caliente/frío se rellenan con -1.
+        """
+        matriz = self._matriz_historiales(historiales)
+        total_mesas = matriz.shape[0]
+        validos = matriz >= 0
+        filas = np.broadcast_to(np.arange(total_mesas)[:, None], matriz.shape)[validos]
+        numeros = matriz[validos]
+        
+        # Conteos por (mesa, número) y (mesa, color) con un solo bincount
+        conteos = np.bincount(filas * 37 + numeros,
+                              minlength=total_mesas * 37).reshape(total_mesas, 37)
+        conteos_color = np.bincount(filas * 3 + COLOR[numeros],
+                                    minlength=total_mesas * 3).reshape(total_mesas, 3)
+        total_tiradas = validos.sum(axis=1)
+        
+        # Calientes: mayor frecuencia primero (empates por número ascendente)
+        calientes = np.argsort(-conteos, axis=1, kind='stable')[:, :cantidad]
+        frecuencias = np.take_along_axis(conteos, calientes, axis=1)
+        calientes = np.where(frecuencias > 0, calientes, -1)
+        
+        # Fríos: números sin apariciones, en orden ascendente
+        frios = np.argsort(conteos > 0, axis=1, kind='stable')[:, :cantidad]
+        frios = np.where(np.take_along_axis(conteos, frios, axis=1) == 0, frios, -1)
+        
+        divisor = np.maximum(total_tiradas, 1)[:, None]
+        porcentajes = np.where(total_tiradas[:, None] > 0,
+                               conteos_color / divisor * 100,
+                               np.array([2.8, 48.6, 48.6]))
+        confianza = np.where(total_tiradas > 0,
+                             np.minimum(frecuencias[:, 0] / divisor[:, 0] * 100, 95),
+                             2.7)
+        
         return {
-            'juego': 'ruleta',
-            'numero_predicho': int(numero_predicho),
-            'confianza_prediccion': round(confianza, 2),
-            'probabilidades_color': {
-                'rojo': round(prob_rojo, 2),
-                'negro': round(prob_negro, 2),
-                'verde': round(prob_verde, 2)
-            },
-            'numeros_calientes': [{'numero': n, 'frecuencia': f} for n, f in numeros_calientes],
-            'numeros_frios': numeros_frios,
-            'analisis_secuencia': secuencia_actual,
-            'total_tiradas_analizadas': total_tiradas,
-            'recomendacion': self._generar_recomendacion_ruleta(
-                numero_predicho, prob_rojo, prob_negro, numeros_calientes
-            )
+            'numero_predicho': np.where(total_tiradas > 0, calientes[:, 0], 0),
+            'confianza_prediccion': np.round(confianza, 2),
+            'prob_rojo': np.round(porcentajes[:, 1], 2),
+            'prob_negro': np.round(porcentajes[:, 2], 2),
+            'prob_verde': np.round(porcentajes[:, 0], 2),
+            'numeros_calientes': calientes,
+            'frecuencias_calientes': frecuencias,
+            'numeros_frios': frios,
+            'total_tiradas_analizadas': total_tiradas
         }
     
-    def predecir_blackjack(self, cartas_visibles: List[str]) -> Dict:
+    def predecir_blackjack(self, cartas_visibles: List[str], mesa: str = 'table_1',
+                           secuencia: Optional[int] = None,
+                           mano_jugador: Optional[List[str]] = None,
+                           carta_dealer: Optional[str] = None,
+                           h17: bool = False,
+                           epoca: Optional[int] = None) -> ResultadoBlackjack:
         """
-        Estima probabilidad de ganar en blackjack usando conteo simple
+        Estima la ventaja del jugador en blackjack a partir de la composición
+        exacta del zapato (conteo de cartas como referencia)
         
         Args:
-            cartas_visibles: Lista de cartas vistas (ej: ['A', 'K', '5', '2'])
+            cartas_visibles: Cartas vistas desde el último barajado (ej: ['A', 'K', '5♠', '10♥'])
+            mesa: Identificador de la mesa
+            secuencia: Total de cartas repartidas por la mesa (ver `actualizar`)
+            mano_jugador: Mano actual del jugador (opcional, para decidir la jugada)
+            carta_dealer: Carta visible del dealer (opcional, junto a mano_jugador)
+            h17: True si el dealer pide con 17 blando
+            epoca: Número de barajado del zapato (ver `actualizar`)
             
         Returns:
-            Dict con probabilidades y recomendaciones
+            ResultadoBlackjack con probabilidades y recomendaciones
         """
         if not cartas_visibles:
-            return self._prediccion_blackjack_vacia()
-        
-        # Sistema de conteo Hi-Lo simplificado
-        conteo = 0
-        cartas_altas = ['10', 'J', 'Q', 'K', 'A']
-        cartas_bajas = ['2', '3', '4', '5', '6']
+            return ResultadoBlackjack.vacio()
         
-        for carta in cartas_visibles:
-            if carta in cartas_bajas:
-                conteo += 1
-            elif carta in cartas_altas:
-                conteo -= 1
+        # Composición del zapato de la mesa: solo se procesan cartas nuevas
+        self.actualizar('blackjack', mesa, cartas_visibles, secuencia, epoca)
+        zapato = self.mesas[('blackjack', mesa)]['zapato']
         
-        # Calcular porcentaje de cartas vistas
-        total_mazos = 6  # Asumimos 6 mazos
-        total_cartas = total_mazos * 52
-        cartas_vistas = len(cartas_visibles)
-        porcentaje_usado = (cartas_vistas / total_cartas) * 100
+        # Ventaja del jugador: EV de una ronda óptima con la composición restante
+        # (con el zapato agotado, la próxima mano sale de uno nuevo)
+        true_count = zapato.true_count
+        restantes = (zapato.restantes if zapato.restantes.any()
+                     else np.full(13, 4 * zapato.num_mazos))
+        ventaja_jugador = ev_ronda(restantes, h17) * 100
         
-        # Estimar ventaja del jugador
-        true_count = conteo / max((total_cartas - cartas_vistas) / 52, 1)
-        ventaja_jugador = true_count * 0.5  # Aproximación
+        # Acción óptima para la mano en curso, si se indicó
+        decision = None
+        if mano_jugador and carta_dealer:
+            decision = analizar_mano(mano_jugador, carta_dealer, restantes, h17)
         
         # Probabilidad base de ganar en blackjack: ~42-49% dependiendo de reglas
         prob_base = 46.0
         prob_ganar = prob_base + ventaja_jugador
         prob_ganar = max(0, min(100, prob_ganar))  # Limitar entre 0-100
         
-        return {
-            'juego': 'blackjack',
-            'probabilidad_ganar': round(prob_ganar, 2),
-            'conteo_actual': conteo,
-            'true_count': round(true_count, 2),
-            'ventaja_jugador': round(ventaja_jugador, 2),
-            'cartas_vistas': cartas_vistas,
-            'porcentaje_mazo_usado': round(porcentaje_usado, 2),
-            'momento_favorable': true_count > 2,
-            'recomendacion': self._generar_recomendacion_blackjack(
-                true_count, prob_ganar, porcentaje_usado
-            )
-        }
+        return ResultadoBlackjack(
+            prob_ganar, zapato.conteo, true_count, ventaja_jugador,
+            zapato.cartas_vistas, zapato.porcentaje_usado,
+            zapato.sistema, zapato.sistemas, zapato.conteos.copy(), decision,
+            zapato.necesita_barajar
+        )
     
-    def predecir_poker(self, mano_actual: List[str], cartas_comunitarias: List[str]) -> Dict:
+    def predecir_poker(self, mano_actual: List[str], cartas_comunitarias: List[str],
+                       oponentes: int = 1, muestras: int = 5000,
+                       tiempo_max: Optional[float] = 0.25,
+                       semilla: Optional[int] = None) -> ResultadoPoker:
         """
         Analiza probabilidades en una mano de póker Texas Hold'em
         
         Args:
             mano_actual: 2 cartas del jugador (ej: ['As', 'Kd'])
             cartas_comunitarias: Cartas en la mesa (ej: ['2h', '5c', '9d'])
+            oponentes: Rivales con cartas desconocidas (1-9)
+            muestras: Máximo de repartos Monte Carlo para la equidad
+            tiempo_max: Presupuesto de tiempo (segundos) para la equidad
+            semilla: Semilla opcional para una equidad reproducible (exacta
+                solo con tiempo_max=None; ver `calcular_equidad`)
             
         Returns:
-            Dict con análisis de la mano
+            ResultadoPoker con el análisis de la mano
         """
-        # Evaluación simplificada de fuerza de mano
-        fuerza_mano = self._evaluar_mano_poker(mano_actual, cartas_comunitarias)
+        # Mano hecha real con el board (o fuerza de las cartas propias en preflop)
+        fuerza_mano, rango_mano = self._evaluar_mano_poker(mano_actual, cartas_comunitarias)
         
-        # Calcular outs aproximados
+        # Outs exactos y probabilidad de mejorar hasta el river
         fase = self._determinar_fase_poker(cartas_comunitarias)
-        outs_estimados = self._calcular_outs_aproximados(mano_actual, cartas_comunitarias)
-        
-        # Probabilidad de mejorar
+        analisis_outs = self._calcular_outs(mano_actual, cartas_comunitarias)
+        outs_estimados = analisis_outs['outs'] if analisis_outs else 0
+        prob_mejorar = analisis_outs['prob_mejorar_final'] if analisis_outs else 0
         cartas_restantes = 52 - len(mano_actual) - len(cartas_comunitarias)
-        if fase == 'flop':
-            prob_mejorar = (outs_estimados / cartas_restantes) * 100 * 2  # Regla del 4
-        elif fase == 'turn':
-            prob_mejorar = (outs_estimados / cartas_restantes) * 100 * 2  # Regla del 2
-        else:
-            prob_mejorar = 0
         
-        return {
-            'juego': 'poker',
-            'fuerza_mano': fuerza_mano,
-            'fase': fase,
-            'outs_estimados': outs_estimados,
-            'probabilidad_mejorar': round(min(prob_mejorar, 100), 2),
-            'cartas_restantes': cartas_restantes,
-            'recomendacion': self._generar_recomendacion_poker(
-                fuerza_mano, prob_mejorar, fase
-            )
-        }
+        # Equidad Monte Carlo contra rivales aleatorios (latencia acotada).
+        # En preflop se consulta la tabla precalculada (O(1)) si está disponible
+        equidad = None
+        if len(mano_actual) == 2 and fase == 'preflop':
+            equidad = equidad_preflop(mano_actual, oponentes)
+        if equidad is None and len(mano_actual) == 2 and fase != 'desconocida':
+            equidad = calcular_equidad(mano_actual, cartas_comunitarias, oponentes,
+                                       muestras, tiempo_max, semilla)
+        
+        return ResultadoPoker(
+            fuerza_mano, rango_mano, fase, outs_estimados, prob_mejorar,
+            cartas_restantes, analisis_outs, equidad
+        )
     
-    def predecir_jackpot(self, historial_premios: List[float]) -> Dict:
+    def predecir_jackpot(self, historial_premios: List[float],
+                         jackpot_id: str = 'progressive_1',
+                         secuencia: Optional[int] = None) -> ResultadoJackpot:
         """
         Predice rango de próximo premio de jackpot
         
         Args:
             historial_premios: Lista de premios anteriores
+            jackpot_id: Identificador del jackpot
+            secuencia: Total de premios entregados por el jackpot (ver `actualizar`)
             
         Returns:
-            Dict con predicción de rango
+            ResultadoJackpot con la predicción de rango
         """
-        if not historial_premios or len(historial_premios) < 3:
-            return self._prediccion_jackpot_vacia()
-        
-        # Análisis estadístico básico
-        promedio = np.mean(historial_premios)
-        mediana = np.median(historial_premios)
-        desviacion = np.std(historial_premios)
-        minimo = np.min(historial_premios)
-        maximo = np.max(historial_premios)
-        
-        # Predicción basada en tendencia
-        tendencia = self._calcular_tendencia(historial_premios)
-        
-        # Rango predicho (intervalo de confianza simple)
-        rango_inferior = max(0, promedio - desviacion)
-        rango_superior = promedio + desviacion
-        
-        return {
-            'juego': 'jackpot',
-            'rango_predicho': {
-                'minimo': round(rango_inferior, 2),
-                'maximo': round(rango_superior, 2),
-                'promedio': round(promedio, 2)
-            },
-            'estadisticas': {
-                'promedio_historico': round(promedio, 2),
-                'mediana': round(mediana, 2),
-                'desviacion_estandar': round(desviacion, 2),
-                'minimo_historico': round(minimo, 2),
-                'maximo_historico': round(maximo, 2)
-            },
-            'tendencia': tendencia,
-            'premios_analizados': len(historial_premios),
-            'recomendacion': self._generar_recomendacion_jackpot(tendencia, promedio)
-        }
+        if not historial_premios:
+            return ResultadoJackpot.vacio()
+        
+        # Incorporar solo los premios nuevos (O(1) por premio)
+        self.actualizar('jackpot', jackpot_id, historial_premios, secuencia)
+        estado = self.mesas[('jackpot', jackpot_id)]
+        estadisticas = estado['estadisticas']
+        if len(estadisticas) < 3:
+            return ResultadoJackpot.vacio()
+        
+        # Tendencia: pendiente por mínimos cuadrados y su significancia
+        tendencia = estado['tendencia'].clasificar()
+        ajuste = estado['tendencia'].ajuste()
+        
+        # Rango predicho (promedio ± desviación) lo arma el resultado al serializar
+        return ResultadoJackpot(
+            estadisticas.media, estadisticas.desviacion, estadisticas.resumen(),
+            tendencia, len(estadisticas),
+            modelo_tendencia={
+                'pendiente': round(ajuste['pendiente'], 2),
+                'error_estandar': round(ajuste['error_estandar'], 2),
+                'estadistico_t': round(ajuste['t'], 2) if np.isfinite(ajuste['t']) else None,
+                'significativa': ajuste['significativa'],
+                'ewma': round(estado['tendencia'].ewma, 2),
+                'pronostico': {
+                    'valor': round(ajuste['pronostico'], 2),
+                    'minimo': round(max(0, ajuste['banda'][0]), 2),
+                    'maximo': round(ajuste['banda'][1], 2)
+                },
+                'ventana': len(estado['tendencia'])
+            }
+        )
     
     # ========== MÉTODOS AUXILIARES ==========
     
-    def _prediccion_ruleta_vacia(self) -> Dict:
-        """Predicción por defecto cuando no hay historial de ruleta"""
-        return {
-            'juego': 'ruleta',
-            'numero_predicho': 0,
-            'confianza_prediccion': 2.7,
-            'probabilidades_color': {'rojo': 48.6, 'negro': 48.6, 'verde': 2.8},
-            'numeros_calientes': [],
-            'numeros_frios': [],
-            'analisis_secuencia': 'Sin datos suficientes',
-            'total_tiradas_analizadas': 0,
-            'recomendacion': 'Se requiere más historial para predicciones precisas'
-        }
+    def _matriz_historiales(self, historiales) -> np.ndarray:
+        """Convierte historiales (matriz o listas irregulares) a una matriz rellena con -1"""
+        if isinstance(historiales, np.ndarray):
+            if historiales.ndim != 2:
+                raise ValueError("Se esperaba una matriz 2-D (mesas × tiradas)")
+            matriz = historiales[:, -self.ventana_historica:].astype(np.int64)
+        else:
+            filas = [list(h)[-self.ventana_historica:] for h in historiales]
+            ancho = max((len(f) for f in filas), default=0)
+            matriz = np.full((len(filas), ancho), -1, dtype=np.int64)
+            for i, fila in enumerate(filas):
+                if fila:
+                    matriz[i, ancho - len(fila):] = fila
+        
+        if np.any(matriz > 36) or np.any(matriz < -1):
+            raise ValueError("Los historiales solo pueden contener números 0-36")
+        return matriz
     
-    def _prediccion_blackjack_vacia(self) -> Dict:
-        """Predicción por defecto cuando no hay cartas"""
-        return {
-            'juego': 'blackjack',
-            'probabilidad_ganar': 46.0,
-            'conteo_actual': 0,
-            'true_count': 0,
-            'ventaja_jugador': 0,
-            'cartas_vistas': 0,
-            'porcentaje_mazo_usado': 0,
-            'momento_favorable': False,
-            'recomendacion': 'Mazo neutro - Juega estrategia básica'
-        }
+    def _obtener_estado_mesa(self, juego: str, mesa: str) -> Dict:
+        """Obtiene (o crea) el estado interno de una mesa"""
+        clave = (juego, mesa)
+        if clave not in self.mesas:
+            estado = {
+                'secuencia': None,
+                'epoca': None,
+                'eventos_perdidos': 0,
+                'eventos': deque(maxlen=self.ventana_historica)
+            }
+            if juego == 'ruleta':
+                estado['frecuencias'] = FrecuenciasRuleta(self.ventana_historica)
+                estado['sesgo'] = DetectorSesgoRuleta()
+                estado['rachas'] = RachasRuleta()
+                estado['ventanas'] = VentanasRuleta(self.ventanas_ruleta)
+            elif juego == 'blackjack':
+                estado['zapato'] = ZapatoBlackjack(
+                    self.num_mazos, self.penetracion, self.sistema_conteo
+                )
+            elif juego == 'jackpot':
+                estado['estadisticas'] = EstadisticasJackpot()
+                estado['tendencia'] = TendenciaIncremental(self.ventana_tendencia)
+            self.mesas[clave] = estado
+        return self.mesas[clave]
     
-    def _prediccion_jackpot_vacia(self) -> Dict:
-        """Predicción por defecto para jackpot"""
-        return {
-            'juego': 'jackpot',
-            'rango_predicho': {'minimo': 0, 'maximo': 0, 'promedio': 0},
-            'estadisticas': {},
-            'tendencia': 'desconocida',
-            'premios_analizados': 0,
-            'recomendacion': 'Se requieren más datos históricos'
-        }
+    def _reiniciar_estado_mesa(self, estado: Dict):
+        """Vacía el estado acumulado de una mesa"""
+        estado['secuencia'] = None
+        estado['epoca'] = None
+        estado['eventos_perdidos'] = 0
+        estado['eventos'].clear()
+        if 'frecuencias' in estado:
+            estado['frecuencias'].reiniciar()
+        if 'sesgo' in estado:
+            estado['sesgo'].reiniciar()
+        if 'rachas' in estado:
+            estado['rachas'].reiniciar()
+        if 'ventanas' in estado:
+            estado['ventanas'].reiniciar()
+        if 'zapato' in estado:
+            estado['zapato'].barajar()
+        if 'estadisticas' in estado:
+            estado['estadisticas'].reiniciar()
+        if 'tendencia' in estado:
+            estado['tendencia'].reiniciar()
+    
+    def _marcar_hueco(self, estado: Dict, perdidos: int):
+        """
+        Discontinuidad en los eventos de una mesa: se vacía todo lo que
+        supone eventos consecutivos (ventana reciente, ventanas, composición
+        del zapato, tendencia) y se cortan las rachas y transiciones. Las
+        pruebas de sesgo y las estadísticas de premios no dependen del orden
+        y se conservan.
+        """
+        estado['eventos_perdidos'] += perdidos
+        estado['eventos'].clear()
+        if 'frecuencias' in estado:
+            estado['frecuencias'].reiniciar()
+        if 'rachas' in estado:
+            estado['rachas'].cortar()
+        if 'ventanas' in estado:
+            estado['ventanas'].marcar_hueco()
+        if 'zapato' in estado:
+            estado['zapato'].barajar()
+        if 'tendencia' in estado:
+            estado['tendencia'].reiniciar()
     
-    def _analizar_secuencia_ruleta(self, historial: List[int]) -> str:
-        """Analiza patrones en la secuencia de números"""
-        if len(historial) < 5:
+    def _analizar_secuencia_ruleta(self, rachas: RachasRuleta) -> str:
+        """Describe la racha de color en curso"""
+        if len(rachas) < 5:
             return "Historial insuficiente"
         
-        ultimos_5 = historial[-5:]
-        
-        # Detectar rachas de color
-        rojos = [1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36]
-        colores = ['rojo' if n in rojos else ('verde' if n == 0 else 'negro') for n in ultimos_5]
-        
-        if len(set(colores)) == 1:
-            return f"Racha de {colores[0]} ({len(colores)} seguidos)"
+        racha_color = rachas.racha('color')
+        if racha_color['longitud'] >= 5:
+            return f"Racha de {racha_color['valor']} ({racha_color['longitud']} seguidos)"
         
         return "Secuencia mixta"
     
-    def _generar_recomendacion_ruleta(self, numero: int, prob_rojo: float, 
-                                      prob_negro: float, calientes: List) -> str:
-        """Genera recomendación textual para ruleta"""
-        if prob_rojo > 55:
-            return f"Los rojos están calientes ({prob_rojo:.1f}%). Considera apostar a rojo."
-        elif prob_negro > 55:
-            return f"Los negros dominan ({prob_negro:.1f}%). Considera apostar a negro."
-        elif calientes and calientes[0][1] > 5:
-            return f"El número {calientes[0][0]} ha salido {calientes[0][1]} veces. Puede estar caliente."
-        else:
-            return "Distribución equilibrada. Juega con precaución."
-    
-    def _generar_recomendacion_blackjack(self, true_count: float, 
-                                         prob_ganar: float, porcentaje_usado: float) -> str:
-        """Genera recomendación para blackjack"""
-        if true_count > 3:
-            return f"¡Momento muy favorable! True count: {true_count:.1f}. Aumenta apuesta."
-        elif true_count > 1:
-            return f"Momento favorable. True count: {true_count:.1f}. Mantén estrategia agresiva."
-        elif true_count < -2:
-            return "Mazo desfavorable. Reduce apuestas o espera."
-        else:
-            return "Mazo neutro. Usa estrategia básica conservadora."
-    
-    def _generar_recomendacion_poker(self, fuerza: str, prob_mejorar: float, fase: str) -> str:
-        """Genera recomendación para póker"""
-        if fuerza in ['AA', 'KK', 'QQ']:
-            return "Mano premium. Juega agresivamente."
-        elif prob_mejorar > 30:
-            return f"Buena probabilidad de mejorar ({prob_mejorar:.1f}%). Considera call."
-        elif prob_mejorar > 15:
-            return f"Probabilidad moderada ({prob_mejorar:.1f}%). Evalúa el pot odds."
-        else:
-            return "Mano débil. Considera fold si hay presión."
-    
-    def _generar_recomendacion_jackpot(self, tendencia: str, promedio: float) -> str:
-        """Genera recomendación para jackpot"""
-        if tendencia == 'creciente':
-            return f"Tendencia alcista. Premio promedio: ${promedio:,.2f}"
-        elif tendencia == 'decreciente':
-            return "Tendencia a la baja. Espera acumulación."
-        else:
-            return f"Tendencia estable. Premio promedio: ${promedio:,.2f}"
-    
-    def _evaluar_mano_poker(self, mano: List[str], comunitarias: List[str]) -> str:
-        """Evalúa fuerza de mano de póker (simplificado)"""
+    def _evaluar_mano_poker(self, mano: List[str],
+                            comunitarias: List[str]) -> Tuple[str, Optional[int]]:
+        """
+        Evalúa fuerza de mano de póker
+        
+        Returns:
+            (fuerza, rango): con 5 o más cartas, la categoría de la mejor mano
+            y su rango (1 = escalera real); en preflop, una etiqueta de las
+            cartas propias y None
+        """
         if not mano or len(mano) != 2:
-            return "desconocida"
+            return "desconocida", None
+        
+        if len(comunitarias) >= 3:
+            rango = evaluar_mano(list(mano) + list(comunitarias))
+            return categoria_mano(rango), rango
         
         # Evaluar pocket cards
         valores = {'A': 14, 'K': 13, 'Q': 12, 'J': 11}
@@ -355,12 +495,12 @@ class PredictorCasino:
         
         if cartas[0] == cartas[1]:
             if cartas[0] >= 13:
-                return "Premium (pareja alta)"
-            return "Pareja"
+                return "Premium (pareja alta)", None
+            return "Pareja", None
         elif max(cartas) >= 12:
-            return "Cartas altas"
+            return "Cartas altas", None
         
-        return "Mano media"
+        return "Mano media", None
     
     def _determinar_fase_poker(self, comunitarias: List[str]) -> str:
         """Determina fase del juego de póker"""
@@ -374,30 +514,8 @@ class PredictorCasino:
             return "river"
         return "desconocida"
     
-    def _calcular_outs_aproximados(self, mano: List[str], comunitarias: List[str]) -> int:
-        """Calcula outs aproximados (simplificado)"""
-        # Este es un cálculo muy básico
-        # En una implementación real, evaluarías draws específicos
-        if not comunitarias:
-            return 6  # Outs promedio preflop
-        
-        return np.random.randint(4, 15)  # Simulación simple
-    
-    def _calcular_tendencia(self, datos: List[float]) -> str:
-        """Calcula tendencia simple de una serie"""
-        if len(datos) < 2:
-            return "insuficiente"
-        
-        mitad = len(datos) // 2
-        promedio_primera_mitad = np.mean(datos[:mitad])
-        promedio_segunda_mitad = np.mean(datos[mitad:])
-        
-        diferencia_porcentual = ((promedio_segunda_mitad - promedio_primera_mitad) / 
-                                promedio_primera_mitad * 100)
-        
-        if diferencia_porcentual > 10:
-            return "creciente"
-        elif diferencia_porcentual < -10:
-            return "decreciente"
-        else:
-            return "estable"
\ No newline at end of file
+    def _calcular_outs(self, mano: List[str], comunitarias: List[str]) -> Optional[Dict]:
+        """Outs exactos en flop y turn (memorizados por textura de board)"""
+        if len(mano) != 2 or len(comunitarias) not in (3, 4):
+            return None
+        return calcular_outs(mano, comunitarias)
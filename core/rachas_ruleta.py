@@ -0,0 +1,133 @@
+"""
+RACHAS_RULETA.PY
+Rachas y transiciones de una secuencia de ruleta
+Codificación por longitud de racha (color, paridad, docena) y matriz de
+transiciones 37×37, ambas actualizadas en O(1) por tirada sin releer historial.
+"""
+
+import numpy as np
+from typing import Dict, Iterable, List
+from .geometria_ruleta import COLOR, DOCENA, NOMBRES_COLOR, NOMBRES_PARIDAD, PARIDAD
+
+
+# Atributo -> (código por número, nombre de cada código)
+ATRIBUTOS_RACHA = {
+    'color': (COLOR, NOMBRES_COLOR),
+    'paridad': (PARIDAD, NOMBRES_PARIDAD),
+    'docena': (DOCENA, ('cero', '1ª docena', '2ª docena', '3ª docena'))
+}
+
+# Las rachas de esta longitud o más comparten la última casilla del histograma
+LONGITUD_MAXIMA_HISTOGRAMA = 32
+
+
+class RachasRuleta:
+    """
+    Estado de rachas por atributo (valor y longitud actuales, racha más larga
+    e histograma de rachas cerradas) más los conteos de transición entre
+    números consecutivos.
+    """
+
+    def __init__(self):
+        self._codigos = {nombre: codigos.tolist()
+                         for nombre, (codigos, _) in ATRIBUTOS_RACHA.items()}
+        self.histogramas = {nombre: np.zeros(LONGITUD_MAXIMA_HISTOGRAMA + 1, dtype=np.int64)
+                            for nombre in ATRIBUTOS_RACHA}
+        self.transiciones = np.zeros((37, 37), dtype=np.int64)
+        self.reiniciar()
+
+    def __len__(self) -> int:
+        return self.tiradas
+
+    def reiniciar(self):
+        """Vuelve al estado sin tiradas"""
+        self.tiradas = 0
+        self.ultimo = None
+        self.actual = {nombre: None for nombre in ATRIBUTOS_RACHA}
+        self.longitud = {nombre: 0 for nombre in ATRIBUTOS_RACHA}
+        self.maxima = {nombre: 0 for nombre in ATRIBUTOS_RACHA}
+        for histograma in self.histogramas.values():
+            histograma[:] = 0
+        self.transiciones[:] = 0
+
+    def cortar(self):
+        """
+        Discontinuidad en la secuencia: la próxima tirada no es vecina de la
+        última. Se descartan las rachas abiertas (su longitud real se
+        desconoce, no entran al histograma) y no se registra la transición;
+        histogramas, máximas y matriz de transiciones se conservan.
+        """
+        self.ultimo = None
+        self.actual = {nombre: None for nombre in ATRIBUTOS_RACHA}
+        self.longitud = {nombre: 0 for nombre in ATRIBUTOS_RACHA}
+
+    def agregar(self, numero: int):
+        """Incorpora una tirada"""
+        numero = int(numero)
+        if not 0 <= numero <= 36:
+            raise ValueError(f"Número de ruleta inválido: {numero}")
+
+        for nombre, codigos in self._codigos.items():
+            codigo = codigos[numero]
+            if codigo == self.actual[nombre]:
+                self.longitud[nombre] += 1
+            else:
+                # Se cierra la racha anterior
+                if self.longitud[nombre]:
+                    self.histogramas[nombre][min(self.longitud[nombre],
+                                                 LONGITUD_MAXIMA_HISTOGRAMA)] += 1
+                self.actual[nombre] = codigo
+                self.longitud[nombre] = 1
+            if self.longitud[nombre] > self.maxima[nombre]:
+                self.maxima[nombre] = self.longitud[nombre]
+
+        if self.ultimo is not None:
+            self.transiciones[self.ultimo, numero] += 1
+        self.ultimo = numero
+        self.tiradas += 1
+
+    def agregar_varios(self, numeros: Iterable[int]):
+        """Incorpora varias tiradas en orden"""
+        for numero in numeros:
+            self.agregar(numero)
+
+    def racha(self, atributo: str) -> Dict:
+        """Racha actual, racha más larga e histograma de rachas cerradas de un atributo"""
+        nombres = ATRIBUTOS_RACHA[atributo][1]
+        histograma = self.histogramas[atributo]
+        longitudes = np.flatnonzero(histograma)
+        return {
+            'valor': nombres[self.actual[atributo]] if self.actual[atributo] is not None else None,
+            'longitud': self.longitud[atributo],
+            'maxima': self.maxima[atributo],
+            'histograma': {int(l): int(histograma[l]) for l in longitudes}
+        }
+
+    def sucesores(self, cantidad: int = 3) -> List[Dict]:
+        """
+        Números que más han seguido al último número observado
+
+        Returns:
+            Lista de dicts con número, veces y frecuencia relativa (%)
+        """
+        if self.ultimo is None:
+            return []
+        fila = self.transiciones[self.ultimo]
+        total = fila.sum()
+        if total == 0:
+            return []
+        orden = np.argsort(-fila, kind='stable')[:cantidad]
+        return [{'numero': int(n), 'veces': int(fila[n]),
+                 'frecuencia': round(float(fila[n] / total * 100), 2)}
+                for n in orden if fila[n] > 0]
+
+    def resumen(self) -> Dict:
+        """Rachas de todos los atributos y transiciones desde el último número"""
+        return {
+            'rachas': {atributo: self.racha(atributo) for atributo in ATRIBUTOS_RACHA},
+            'transiciones': {
+                'desde': self.ultimo,
+                'observadas': int(max(self.tiradas - 1, 0)),
+                'sucesores_frecuentes': self.sucesores()
+            }
+        }
@@ -0,0 +1,333 @@
+"""
+RESULTADOS.PY
+Resultados de predicción compactos (con __slots__) para cada juego
+Los datos se guardan como escalares y arrays de NumPy; el dict/JSON y el
+texto de recomendación solo se construyen cuando alguien los pide.
+"""
+
+import json
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Sequence
+
+
+# Fuerzas de póker con las que se recomienda jugar agresivamente
+MANOS_FUERTES = (
+    'Premium (pareja alta)', 'Escalera real', 'Escalera de color',
+    'Póker', 'Full', 'Color', 'Escalera', 'Trío'
+)
+
+
+class ResultadoPrediccion(ABC):
+    """Base de los resultados: recomendación perezosa y serialización bajo demanda"""
+
+    __slots__ = ('_recomendacion',)
+    juego = 'desconocido'
+
+    def __init__(self, recomendacion: Optional[str] = None):
+        self._recomendacion = recomendacion
+
+    @property
+    def recomendacion(self) -> str:
+        """Texto de recomendación (se genera la primera vez que se consulta)"""
+        if self._recomendacion is None:
+            self._recomendacion = self._generar_recomendacion()
+        return self._recomendacion
+
+    def a_dict(self) -> Dict:
+        """Representación como dict de tipos nativos (lista para JSON)"""
+        datos = {'juego': self.juego}
+        datos.update(self._campos())
+        datos['recomendacion'] = self.recomendacion
+        return datos
+
+    def a_json(self) -> str:
+        return json.dumps(self.a_dict(), ensure_ascii=False)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._campos()!r})"
+
+    @abstractmethod
+    def _campos(self) -> Dict:
+        """Campos propios del juego como tipos nativos"""
+
+    @abstractmethod
+    def _generar_recomendacion(self) -> str:
+        """Texto de recomendación a partir de los campos"""
+
+
+class ResultadoRuleta(ResultadoPrediccion):
+    """Predicción de ruleta"""
+
+    __slots__ = ('numero_predicho', 'confianza', 'probabilidades_color',
+                 'numeros_calientes', 'frecuencias_calientes', 'numeros_frios',
+                 'analisis_secuencia', 'total_tiradas', 'detalles')
+    juego = 'ruleta'
+
+    def __init__(self, numero_predicho: int, confianza: float,
+                 probabilidades_color: np.ndarray, numeros_calientes: np.ndarray,
+                 frecuencias_calientes: np.ndarray, numeros_frios: np.ndarray,
+                 analisis_secuencia: str, total_tiradas: int,
+                 detalles: Optional[Dict] = None, recomendacion: Optional[str] = None):
+        """
+        Args:
+            numero_predicho: Número con más apariciones en la ventana
+            confianza: Porcentaje de la ventana que ocupa ese número
+            probabilidades_color: Porcentajes observados (rojo, negro, verde)
+            numeros_calientes: Números más frecuentes
+            frecuencias_calientes: Apariciones de cada número caliente
+            numeros_frios: Números sin apariciones en la ventana
+            analisis_secuencia: Descripción de la racha en curso
+            total_tiradas: Tiradas en la ventana
+            detalles: Rachas, transiciones, detección de sesgo y ventanas (opcional)
+        """
+        super().__init__(recomendacion)
+        self.numero_predicho = numero_predicho
+        self.confianza = confianza
+        self.probabilidades_color = probabilidades_color
+        self.numeros_calientes = numeros_calientes
+        self.frecuencias_calientes = frecuencias_calientes
+        self.numeros_frios = numeros_frios
+        self.analisis_secuencia = analisis_secuencia
+        self.total_tiradas = total_tiradas
+        self.detalles = detalles
+
+    @classmethod
+    def vacio(cls) -> 'ResultadoRuleta':
+        """Resultado por defecto cuando no hay historial"""
+        vacio = np.zeros(0, dtype=np.int64)
+        return cls(0, 2.7, np.array([48.6, 48.6, 2.8]), vacio, vacio, vacio,
+                   'Sin datos suficientes', 0,
+                   recomendacion='Se requiere más historial para predicciones precisas')
+
+    def _campos(self) -> Dict:
+        rojo, negro, verde = np.round(self.probabilidades_color, 2).tolist()
+        campos = {
+            'numero_predicho': int(self.numero_predicho),
+            'confianza_prediccion': round(float(self.confianza), 2),
+            'probabilidades_color': {'rojo': rojo, 'negro': negro, 'verde': verde},
+            'numeros_calientes': [{'numero': n, 'frecuencia': f} for n, f in
+                                  zip(self.numeros_calientes.tolist(),
+                                      self.frecuencias_calientes.tolist())],
+            'numeros_frios': self.numeros_frios.tolist(),
+            'analisis_secuencia': self.analisis_secuencia
+        }
+        if self.detalles:
+            campos.update(self.detalles)
+        campos['total_tiradas_analizadas'] = int(self.total_tiradas)
+        return campos
+
+    def _generar_recomendacion(self) -> str:
+        prob_rojo, prob_negro = float(self.probabilidades_color[0]), float(self.probabilidades_color[1])
+        if prob_rojo > 55:
+            return f"Los rojos están calientes ({prob_rojo:.1f}%). Considera apostar a rojo."
+        elif prob_negro > 55:
+            return f"Los negros dominan ({prob_negro:.1f}%). Considera apostar a negro."
+        elif len(self.numeros_calientes) and self.frecuencias_calientes[0] > 5:
+            return (f"El número {self.numeros_calientes[0]} ha salido "
+                    f"{self.frecuencias_calientes[0]} veces. Puede estar caliente.")
+        else:
+            return "Distribución equilibrada. Juega con precaución."
+
+
+class ResultadoBlackjack(ResultadoPrediccion):
+    """Predicción de blackjack"""
+
+    __slots__ = ('probabilidad_ganar', 'conteo', 'sistema_conteo', 'sistemas',
+                 'conteos_sistemas', 'true_count', 'ventaja_jugador', 'cartas_vistas',
+                 'porcentaje_usado', 'necesita_barajar', 'decision')
+    juego = 'blackjack'
+
+    def __init__(self, probabilidad_ganar: float, conteo: int, true_count: float,
+                 ventaja_jugador: float, cartas_vistas: int, porcentaje_usado: float,
+                 sistema_conteo: Optional[str] = None, sistemas: Sequence[str] = (),
+                 conteos_sistemas: Optional[np.ndarray] = None,
+                 decision: Optional[Dict] = None, necesita_barajar: bool = False,
+                 recomendacion: Optional[str] = None):
+        """
+        Args:
+            probabilidad_ganar: Probabilidad estimada de ganar la próxima mano (%)
+            conteo: Conteo corrido del sistema principal
+            true_count: Conteo por mazo restante
+            ventaja_jugador: EV de una ronda óptima (%)
+            cartas_vistas: Cartas vistas desde el barajado
+            porcentaje_usado: Porcentaje del zapato repartido
+            sistema_conteo: Nombre del sistema principal
+            sistemas: Nombres de todos los sistemas contados
+            conteos_sistemas: Conteo corrido de cada sistema (mismo orden)
+            decision: Análisis de la mano en curso (opcional)
+            necesita_barajar: Si ya se repartió la penetración configurada
+        """
+        super().__init__(recomendacion)
+        self.probabilidad_ganar = probabilidad_ganar
+        self.conteo = conteo
+        self.true_count = true_count
+        self.ventaja_jugador = ventaja_jugador
+        self.cartas_vistas = cartas_vistas
+        self.porcentaje_usado = porcentaje_usado
+        self.sistema_conteo = sistema_conteo
+        self.sistemas = sistemas
+        self.conteos_sistemas = conteos_sistemas
+        self.decision = decision
+        self.necesita_barajar = necesita_barajar
+
+    @classmethod
+    def vacio(cls) -> 'ResultadoBlackjack':
+        """Resultado por defecto cuando no hay cartas"""
+        return cls(46.0, 0, 0.0, 0.0, 0, 0.0,
+                   recomendacion='Mazo neutro - Juega estrategia básica')
+
+    @property
+    def momento_favorable(self) -> bool:
+        return self.true_count > 2
+
+    def _campos(self) -> Dict:
+        conteos = ({} if self.conteos_sistemas is None else
+                   dict(zip(self.sistemas, self.conteos_sistemas.tolist())))
+        return {
+            'probabilidad_ganar': round(float(self.probabilidad_ganar), 2),
+            'conteo_actual': int(self.conteo),
+            'sistema_conteo': self.sistema_conteo,
+            'conteos_sistemas': conteos,
+            'true_count': round(float(self.true_count), 2),
+            'ventaja_jugador': round(float(self.ventaja_jugador), 2),
+            'cartas_vistas': int(self.cartas_vistas),
+            'porcentaje_mazo_usado': round(float(self.porcentaje_usado), 2),
+            'necesita_barajar': bool(self.necesita_barajar),
+            'momento_favorable': bool(self.momento_favorable),
+            'decision': self.decision
+        }
+
+    def _generar_recomendacion(self) -> str:
+        true_count = self.true_count
+        if true_count > 3:
+            return f"¡Momento muy favorable! True count: {true_count:.1f}. Aumenta apuesta."
+        elif true_count > 1:
+            return f"Momento favorable. True count: {true_count:.1f}. Mantén estrategia agresiva."
+        elif true_count < -2:
+            return "Mazo desfavorable. Reduce apuestas o espera."
+        else:
+            return "Mazo neutro. Usa estrategia básica conservadora."
+
+
+class ResultadoPoker(ResultadoPrediccion):
+    """Análisis de una mano de póker"""
+
+    __slots__ = ('fuerza_mano', 'rango_mano', 'fase', 'outs', 'prob_mejorar',
+                 'analisis_outs', 'cartas_restantes', 'equidad')
+    juego = 'poker'
+
+    def __init__(self, fuerza_mano: str, rango_mano: Optional[int], fase: str,
+                 outs: int, prob_mejorar: float, cartas_restantes: int,
+                 analisis_outs: Optional[Dict] = None, equidad: Optional[Dict] = None,
+                 recomendacion: Optional[str] = None):
+        """
+        Args:
+            fuerza_mano: Categoría de la mano (o etiqueta preflop)
+            rango_mano: Rango del evaluador (1 = escalera real), None en preflop
+            fase: preflop, flop, turn o river
+            outs: Cartas que mejoran la mano en la próxima calle
+            prob_mejorar: Probabilidad de mejorar hasta el river (%)
+            cartas_restantes: Cartas no vistas
+            analisis_outs: Detalle de outs (flop y turn)
+            equidad: Equidad contra rivales aleatorios
+        """
+        super().__init__(recomendacion)
+        self.fuerza_mano = fuerza_mano
+        self.rango_mano = rango_mano
+        self.fase = fase
+        self.outs = outs
+        self.prob_mejorar = prob_mejorar
+        self.cartas_restantes = cartas_restantes
+        self.analisis_outs = analisis_outs
+        self.equidad = equidad
+
+    def _campos(self) -> Dict:
+        return {
+            'fuerza_mano': self.fuerza_mano,
+            'rango_mano': None if self.rango_mano is None else int(self.rango_mano),
+            'fase': self.fase,
+            'outs_estimados': int(self.outs),
+            'probabilidad_mejorar': round(min(float(self.prob_mejorar), 100), 2),
+            'analisis_outs': self.analisis_outs,
+            'cartas_restantes': int(self.cartas_restantes),
+            'equidad': self.equidad
+        }
+
+    def _generar_recomendacion(self) -> str:
+        equidad, fuerza, prob_mejorar = self.equidad, self.fuerza_mano, self.prob_mejorar
+        if self.fase == 'preflop' and equidad and 'clase' in equidad:
+            # Comparar con la equidad de un reparto justo entre todos los jugadores
+            justa = 100 / (equidad['oponentes'] + 1)
+            resumen = f"{equidad['clase']}, {equidad['equidad']:.1f}% vs {equidad['oponentes']}"
+            if equidad['equidad'] >= 1.5 * justa:
+                return f"Mano inicial fuerte ({resumen}). Juega agresivamente."
+            elif equidad['equidad'] >= justa:
+                return f"Mano inicial jugable ({resumen}). Juega con cautela."
+            return f"Equidad preflop baja ({resumen}). Considera fold."
+        if fuerza in MANOS_FUERTES:
+            return f"Mano fuerte ({fuerza}). Juega agresivamente."
+        elif prob_mejorar > 30:
+            return f"Buena probabilidad de mejorar ({prob_mejorar:.1f}%). Considera call."
+        elif prob_mejorar > 15:
+            return f"Probabilidad moderada ({prob_mejorar:.1f}%). Evalúa el pot odds."
+        else:
+            return "Mano débil. Considera fold si hay presión."
+
+
+class ResultadoJackpot(ResultadoPrediccion):
+    """Predicción del próximo premio de un jackpot"""
+
+    __slots__ = ('promedio', 'desviacion', 'estadisticas', 'tendencia',
+                 'modelo_tendencia', 'premios_analizados')
+    juego = 'jackpot'
+
+    def __init__(self, promedio: float, desviacion: float, estadisticas: Dict,
+                 tendencia: str, premios_analizados: int,
+                 modelo_tendencia: Optional[Dict] = None,
+                 recomendacion: Optional[str] = None):
+        """
+        Args:
+            promedio: Premio medio histórico
+            desviacion: Desviación estándar de los premios
+            estadisticas: Resumen de EstadisticasJackpot
+            tendencia: creciente, decreciente o estable
+            premios_analizados: Premios incorporados
+            modelo_tendencia: Pendiente, significancia y pronóstico
+        """
+        super().__init__(recomendacion)
+        self.promedio = promedio
+        self.desviacion = desviacion
+        self.estadisticas = estadisticas
+        self.tendencia = tendencia
+        self.premios_analizados = premios_analizados
+        self.modelo_tendencia = modelo_tendencia
+
+    @classmethod
+    def vacio(cls) -> 'ResultadoJackpot':
+        """Resultado por defecto cuando faltan premios"""
+        return cls(0.0, 0.0, {}, 'desconocida', 0,
+                   recomendacion='Se requieren más datos históricos')
+
+    def _campos(self) -> Dict:
+        campos = {
+            'rango_predicho': {
+                'minimo': round(max(0.0, self.promedio - self.desviacion), 2),
+                'maximo': round(self.promedio + self.desviacion, 2),
+                'promedio': round(self.promedio, 2)
+            },
+            'estadisticas': self.estadisticas,
+            'tendencia': self.tendencia
+        }
+        if self.modelo_tendencia is not None:
+            campos['modelo_tendencia'] = self.modelo_tendencia
+        campos['premios_analizados'] = int(self.premios_analizados)
+        return campos
+
+    def _generar_recomendacion(self) -> str:
+        if self.tendencia == 'creciente':
+            return f"Tendencia alcista. Premio promedio: ${self.promedio:,.2f}"
+        elif self.tendencia == 'decreciente':
+            return "Tendencia a la baja. Espera acumulación."
+        else:
+            return f"Tendencia estable. Premio promedio: ${self.promedio:,.2f}"
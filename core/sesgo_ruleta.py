@@ -0,0 +1,370 @@
+"""
+SESGO_RULETA.PY
+Detección secuencial de sesgo en ruedas de ruleta
+Por cada tipo de apuesta (número, color, docena, sector) se mantiene un
+chi-cuadrado incremental y un CUSUM de Bernoulli por categoría. Ambos tienen
+la tasa de falsas alarmas acotada: el CUSUM con un umbral calibrado por ARL
+(tiradas esperadas entre falsas alarmas) y el chi-cuadrado evaluado cada
+`cadencia` tiradas repartiendo alfa entre todas las evaluaciones.
+"""
+
+import math
+import numpy as np
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+from .geometria_ruleta import COLOR, DOCENA, NOMBRES_COLOR, NOMBRES_SECTOR, SECTOR
+
+
+# Código de categoría por número y nombre de cada categoría
+TIPOS_APUESTA = {
+    'numero': (np.arange(37), tuple(str(n) for n in range(37))),
+    'color': (COLOR, NOMBRES_COLOR),
+    'docena': (DOCENA, ('cero', '1ª docena', '2ª docena', '3ª docena')),
+    'sector': (SECTOR, NOMBRES_SECTOR)
+}
+
+# El chi-cuadrado deja de marcar sesgo solo cuando p supera alfa × HISTERESIS
+HISTERESIS = 10
+
+# Gasto de alfa: la evaluación j del chi-cuadrado usa alfa · 6 / (π² j²),
+# cuya suma sobre todas las evaluaciones es alfa
+_GASTO_ALFA = 6 / math.pi ** 2
+
+
+def umbral_cusum(arl: float, deriva: float) -> float:
+    """
+    Umbral h de un CUSUM de log-razones con ARL bajo H0 dado, por la
+    aproximación de Siegmund ARL ≈ (e^h - h - 1) / |deriva|, donde deriva es
+    la log-razón esperada bajo H0 (negativa). El salto discreto por encima
+    del umbral hace que el ARL real sea algo mayor (conservador).
+    """
+    objetivo = arl * abs(deriva)
+    h = math.log(objetivo + 1)
+    for _ in range(50):
+        # Newton sobre f(h) = e^h - h - 1 - objetivo (convexa y creciente)
+        paso = (math.exp(h) - h - 1 - objetivo) / (math.exp(h) - 1)
+        h -= paso
+        if abs(paso) < 1e-12:
+            break
+    return h
+
+
+class PruebaSesgo:
+    """
+    Pruebas de uniformidad de un tipo de apuesta sobre todas las tiradas de una mesa.
+
+    - Chi-cuadrado: se mantiene Σ O²/p, así que χ² = Σ O²/p / N - N
+      se actualiza con una suma por tirada. Se evalúa cada `cadencia`
+      tiradas y la evaluación j usa el nivel alfa · 6/(π² j²): la probabilidad
+      de alguna falsa alarma en toda la vida de la mesa no supera alfa.
+    - CUSUM: por categoría, S = max(0, S + log-razón) de H1 p = p0·(1 + efecto)
+      contra H0 p = p0, con alarma cuando S ≥ h. Entre dos apariciones de la
+      categoría solo hay pasos negativos, así que S se actualiza de forma
+      perezosa cuando la categoría sale. Tras una alarma la categoría no
+      vuelve a alertar hasta que S regresa a 0.
+    """
+
+    def __init__(self, tipo: str, alfa: float = 0.001, arl: float = 1_000_000,
+                 efecto: float = 0.5, cadencia: int = 100, min_esperado: float = 5.0):
+        """
+        Args:
+            tipo: Tipo de apuesta ('numero', 'color', 'docena', 'sector')
+            alfa: Probabilidad total de falsa alarma del chi-cuadrado
+            arl: Tiradas esperadas entre falsas alarmas del CUSUM (rueda justa)
+            efecto: Aumento relativo de probabilidad que el CUSUM busca detectar
+            cadencia: Tiradas entre dos evaluaciones del chi-cuadrado
+            min_esperado: Frecuencia esperada mínima por categoría antes de
+                evaluar el chi-cuadrado
+        """
+        if tipo not in TIPOS_APUESTA:
+            raise ValueError(f"Tipo de apuesta desconocido: {tipo}")
+        if cadencia < 1:
+            raise ValueError("La cadencia del chi-cuadrado debe ser al menos 1")
+        codigos, nombres = TIPOS_APUESTA[tipo]
+        esperadas = np.bincount(codigos) / 37
+        alternativas = np.minimum(esperadas * (1 + efecto), 0.999)
+        acierto = np.log(alternativas / esperadas)
+        fallo = np.log((1 - alternativas) / (1 - esperadas))
+        deriva = esperadas * acierto + (1 - esperadas) * fallo
+
+        self.tipo = tipo
+        self.alfa = alfa
+        self.cadencia = cadencia
+        self.nombres = nombres
+        self._tabla_codigos = np.asarray(codigos, dtype=np.intp)
+        self._codigos = codigos.tolist()
+        self._esperadas_np = esperadas
+        self._esperadas = esperadas.tolist()
+        self._llr_acierto = acierto.tolist()
+        self._llr_fallo = fallo.tolist()
+        # Cada categoría recibe arl × categorías: el tipo completo queda con ARL ≈ arl
+        self.umbrales = [umbral_cusum(arl * len(esperadas), d) for d in deriva]
+        self.min_tiradas = math.ceil(min_esperado / esperadas.min())
+        self.reiniciar()
+
+    def __len__(self) -> int:
+        return self.n
+
+    def reiniciar(self):
+        """Vuelve al estado sin tiradas"""
+        categorias = len(self._esperadas)
+        self.n = 0
+        self.conteos = [0] * categorias
+        self._suma_ponderada = 0.0
+        self._cusum = [0.0] * categorias  # S tras la última aparición de cada categoría
+        self._ultima = [0] * categorias  # Tirada de esa última aparición
+        self._alarma = [False] * categorias
+        self.chi_significativo = False
+
+    def agregar(self, numero: int) -> List[Dict]:
+        """
+        Incorpora una tirada
+
+        Returns:
+            Alertas nuevas (vacía si no se cruzó ningún umbral)
+        """
+        k = self._codigos[numero]
+        # Pasos negativos de las tiradas en que k no salió, de una vez
+        previo = self._cusum[k] + (self.n - self._ultima[k]) * self._llr_fallo[k]
+        if previo <= 0:
+            previo = 0.0
+            self._alarma[k] = False
+
+        self.n += 1
+        self._suma_ponderada += (2 * self.conteos[k] + 1) / self._esperadas[k]
+        self.conteos[k] += 1
+        self._cusum[k] = previo + self._llr_acierto[k]
+        self._ultima[k] = self.n
+
+        alertas = []
+        if self._cusum[k] >= self.umbrales[k] and not self._alarma[k]:
+            self._alarma[k] = True
+            alertas.append(self._alerta('cusum', self.nombres[k], self._cusum[k]))
+
+        if self.n % self.cadencia == 0 and self.n >= self.min_tiradas:
+            alerta = self._evaluar_chi(self.n, self.chi_cuadrado)
+            if alerta:
+                alertas.append(alerta)
+        return alertas
+
+    def agregar_varios(self, numeros: np.ndarray) -> List[Dict]:
+        """
+        Incorpora varias tiradas en orden con operaciones vectorizadas
+        (equivale a llamar a `agregar` con cada una)
+
+        Returns:
+            Alertas nuevas ordenadas por tirada
+        """
+        codigos = self._tabla_codigos[np.asarray(numeros, dtype=np.intp)]
+        if codigos.size == 0:
+            return []
+        alertas = self._cusum_lote(codigos) + self._chi_lote(codigos)
+        alertas.sort(key=lambda alerta: alerta['tirada'])
+
+        conteos = np.asarray(self.conteos) + np.bincount(codigos, minlength=len(self.conteos))
+        self.conteos = conteos.tolist()
+        self.n += codigos.size
+        self._suma_ponderada = float((conteos ** 2 / self._esperadas_np).sum())
+        return alertas
+
+    def estadistico_cusum(self, k: int) -> float:
+        """Valor actual del CUSUM de la categoría k"""
+        return max(0.0, self._cusum[k] + (self.n - self._ultima[k]) * self._llr_fallo[k])
+
+    @property
+    def categorias_alarmadas(self) -> List[int]:
+        """Categorías cuyo CUSUM alertó y todavía no volvió a 0"""
+        return [k for k, alarma in enumerate(self._alarma)
+                if alarma and self.estadistico_cusum(k) > 0]
+
+    def alfa_evaluacion(self, n: int) -> float:
+        """Nivel del chi-cuadrado en la evaluación de la tirada n"""
+        return self.alfa * _GASTO_ALFA / (n // self.cadencia) ** 2
+
+    @property
+    def chi_cuadrado(self) -> float:
+        return self._suma_ponderada / self.n - self.n if self.n else 0.0
+
+    def p_valor(self) -> float:
+        """p-valor del chi-cuadrado contra la distribución uniforme de la rueda"""
+        return _cola_chi_cuadrado(self.chi_cuadrado, len(self.conteos) - 1)
+
+    def resumen(self) -> Dict:
+        """Estado actual de ambas pruebas"""
+        evaluable = self.n >= self.min_tiradas
+        return {
+            'tiradas': self.n,
+            'chi_cuadrado': round(self.chi_cuadrado, 3),
+            'p_valor': round(self.p_valor(), 6) if evaluable else None,
+            'sesgo_significativo': self.chi_significativo,
+            'categorias_cusum': [self.nombres[k] for k in self.categorias_alarmadas]
+        }
+
+    def _evaluar_chi(self, n: int, chi: float) -> Optional[Dict]:
+        """Evaluación programada del chi-cuadrado (con histéresis al salir)"""
+        p_valor = _cola_chi_cuadrado(chi, len(self.conteos) - 1)
+        if not self.chi_significativo and p_valor < self.alfa_evaluacion(n):
+            self.chi_significativo = True
+            return self._alerta('chi_cuadrado', None, chi, n)
+        if self.chi_significativo and p_valor >= self.alfa * HISTERESIS:
+            self.chi_significativo = False
+        return None
+
+    def _cusum_lote(self, codigos: np.ndarray) -> List[Dict]:
+        """CUSUM de todas las categorías sobre un lote (recursión de Lindley cerrada)"""
+        alertas = []
+        orden = np.argsort(codigos, kind='stable')
+        cortes = np.cumsum(np.bincount(codigos, minlength=len(self.conteos)))[:-1]
+        for k, tiradas in enumerate(np.split(self.n + 1 + orden, cortes)):
+            if tiradas.size == 0:
+                continue
+            # Pasos alternados: los fallos previos juntos y luego la aparición
+            pasos = np.empty(2 * tiradas.size)
+            pasos[0::2] = (np.diff(tiradas, prepend=self._ultima[k]) - 1) * self._llr_fallo[k]
+            pasos[1::2] = self._llr_acierto[k]
+            # S_i = C_i - min(-S_0, min_{j<=i} C_j) resuelve S = max(0, S + x)
+            acumulado = np.cumsum(pasos)
+            cusum = acumulado - np.minimum(np.minimum.accumulate(acumulado), -self._cusum[k])
+            ceros = cusum[0::2] <= 0
+            cruces = cusum[1::2] >= self.umbrales[k]
+
+            # Alarma vigente antes de cada aparición: el último cruce previo
+            # manda salvo que S haya vuelto a 0 después
+            indices = np.arange(tiradas.size)
+            ultimo_cero = np.maximum.accumulate(np.where(ceros, indices, -1))
+            ultimo_cruce = np.empty_like(indices)
+            ultimo_cruce[0] = -1
+            ultimo_cruce[1:] = np.maximum.accumulate(np.where(cruces, indices, -1))[:-1]
+            alarmada = np.where(ultimo_cruce >= np.maximum(ultimo_cero, 0), True,
+                                np.where(ultimo_cero >= 0, False, self._alarma[k]))
+            for i in np.flatnonzero(cruces & ~alarmada).tolist():
+                alertas.append(self._alerta('cusum', self.nombres[k], float(cusum[2 * i + 1]),
+                                            int(tiradas[i])))
+
+            self._alarma[k] = bool(alarmada[-1] or cruces[-1])
+            self._cusum[k] = float(cusum[-1])
+            self._ultima[k] = int(tiradas[-1])
+        return alertas
+
+    def _chi_lote(self, codigos: np.ndarray) -> List[Dict]:
+        """Evaluaciones programadas del chi-cuadrado que caen dentro del lote"""
+        primera = max(self.n // self.cadencia + 1, -(-self.min_tiradas // self.cadencia))
+        puntos = np.arange(primera * self.cadencia, self.n + codigos.size + 1, self.cadencia)
+        if puntos.size == 0:
+            return []
+        # Conteos acumulados en cada punto de evaluación: un bincount por tramo
+        categorias = len(self.conteos)
+        tramo = np.searchsorted(puntos, np.arange(self.n + 1, self.n + codigos.size + 1))
+        dentro = tramo < puntos.size
+        conteos = np.bincount(tramo[dentro] * categorias + codigos[dentro],
+                              minlength=puntos.size * categorias).reshape(puntos.size, categorias)
+        conteos = np.cumsum(conteos, axis=0) + np.asarray(self.conteos)
+        chi = (conteos ** 2 / self._esperadas_np).sum(axis=1) / puntos - puntos
+
+        alertas = []
+        for n, valor in zip(puntos.tolist(), chi.tolist()):
+            alerta = self._evaluar_chi(n, valor)
+            if alerta:
+                alertas.append(alerta)
+        return alertas
+
+    def _alerta(self, prueba: str, categoria, valor: float, tirada: int = None) -> Dict:
+        return {
+            'tipo_apuesta': self.tipo,
+            'prueba': prueba,
+            'categoria': categoria,
+            'valor': round(valor, 3),
+            'tirada': self.n if tirada is None else tirada
+        }
+
+
+class DetectorSesgoRuleta:
+    """
+    Conjunto de pruebas de sesgo de una mesa: una PruebaSesgo por tipo de
+    apuesta y un registro acotado de las últimas alertas.
+    """
+
+    def __init__(self, alfa: float = 0.001, arl: float = 1_000_000, efecto: float = 0.5,
+                 cadencia: int = 100, max_alertas: int = 50):
+        """
+        Args:
+            alfa: Probabilidad total de falsa alarma de cada chi-cuadrado
+            arl: Tiradas esperadas entre falsas alarmas de los CUSUM de la
+                mesa (se reparte entre los tipos de apuesta)
+            efecto: Aumento relativo de probabilidad que busca el CUSUM
+            cadencia: Tiradas entre dos evaluaciones del chi-cuadrado
+            max_alertas: Alertas recientes que se conservan
+        """
+        self.pruebas = {tipo: PruebaSesgo(tipo, alfa, arl * len(TIPOS_APUESTA), efecto, cadencia)
+                        for tipo in TIPOS_APUESTA}
+        self.alertas = deque(maxlen=max_alertas)
+
+    def agregar(self, numero: int) -> List[Dict]:
+        """Incorpora una tirada en todas las pruebas y devuelve las alertas nuevas"""
+        numero = int(numero)
+        if not 0 <= numero <= 36:
+            raise ValueError(f"Número de ruleta inválido: {numero}")
+        nuevas = []
+        for prueba in self.pruebas.values():
+            nuevas.extend(prueba.agregar(numero))
+        self.alertas.extend(nuevas)
+        return nuevas
+
+    def agregar_varios(self, numeros: Iterable[int]) -> List[Dict]:
+        """Incorpora varias tiradas en orden (vectorizado por tipo de apuesta)"""
+        if not isinstance(numeros, np.ndarray):
+            numeros = np.fromiter(numeros, dtype=np.int64)
+        if numeros.size == 0:
+            return []
+        if numeros.min() < 0 or numeros.max() > 36:
+            raise ValueError("Las tiradas solo pueden contener números 0-36")
+        nuevas = []
+        for prueba in self.pruebas.values():
+            nuevas.extend(prueba.agregar_varios(numeros))
+        nuevas.sort(key=lambda alerta: alerta['tirada'])
+        self.alertas.extend(nuevas)
+        return nuevas
+
+    def reiniciar(self):
+        """Vacía todas las pruebas y alertas"""
+        for prueba in self.pruebas.values():
+            prueba.reiniciar()
+        self.alertas.clear()
+
+    @property
+    def sesgada(self) -> bool:
+        """True si alguna prueba indica sesgo en este momento"""
+        return any(p.chi_significativo or p.categorias_alarmadas for p in self.pruebas.values())
+
+    def resumen(self) -> Dict:
+        """Estado de cada prueba y alertas recientes"""
+        return {
+            'rueda_sesgada': self.sesgada,
+            'pruebas': {tipo: prueba.resumen() for tipo, prueba in self.pruebas.items()},
+            'alertas': list(self.alertas)
+        }
+
+
+def _cola_chi_cuadrado(x: float, grados: int) -> float:
+    """
+    P(χ² > x) exacta para grados de libertad enteros (gamma incompleta
+    regularizada por su serie finita)
+    """
+    if x <= 0:
+        return 1.0
+    m = x / 2
+    if grados % 2 == 0:
+        termino = suma = math.exp(-m)
+        for i in range(1, grados // 2):
+            termino *= m / i
+            suma += termino
+        return min(suma, 1.0)
+
+    suma = math.erfc(math.sqrt(m))
+    if grados > 1:
+        termino = math.exp(-m) * math.sqrt(m) / math.gamma(1.5)
+        suma += termino
+        for i in range(2, (grados - 1) // 2 + 1):
+            termino *= m / (i - 0.5)
+            suma += termino
+    return min(suma, 1.0)
@@ -0,0 +1,137 @@
+"""
+TABLA_PREFLOP.PY
+Tabla precalculada de equidad preflop: 169 clases de mano inicial × 1-9 rivales
+Se genera una vez (python -m core.tabla_preflop) y en ejecución se abre con
+np.memmap, así que cada consulta es un acceso O(1) sin coste de arranque.
+"""
+
+import os
+import time
+import numpy as np
+from typing import Dict, Iterable, Optional
+from .cartas import RANGOS, Carta, codificar_carta
+from .equidad_poker import calcular_equidad
+
+
+RUTA_TABLA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'data', 'equidad_preflop.bin')
+
+MAX_OPONENTES = 9
+# Campos por celda, en centésimas de punto porcentual (uint16)
+CAMPOS = ('victoria', 'empate', 'equidad', 'margen')
+FORMA_TABLA = (169, MAX_OPONENTES, len(CAMPOS))
+
+_tabla = None
+
+
+def clase_inicial(mano: Iterable[Carta]) -> int:
+    """
+    Índice (0-168) de la clase de una mano inicial en una matriz 13×13:
+    parejas en la diagonal, suited con fila = rango alto y offsuit con
+    fila = rango bajo
+    """
+    a, b = [codificar_carta(c) for c in mano]
+    alto, bajo = max(a % 13, b % 13), min(a % 13, b % 13)
+    if a // 13 == b // 13:
+        return alto * 13 + bajo
+    return bajo * 13 + alto
+
+
+def nombre_clase(indice: int) -> str:
+    """Nombre de una clase inicial (ej: 'AKs', 'T9o', 'QQ')"""
+    fila, columna = divmod(indice, 13)
+    alto, bajo = RANGOS[max(fila, columna)], RANGOS[min(fila, columna)]
+    alto, bajo = alto.replace('10', 'T'), bajo.replace('10', 'T')
+    if fila == columna:
+        return alto + bajo
+    return alto + bajo + ('s' if fila > columna else 'o')
+
+
+def construir_tabla(ruta: str = RUTA_TABLA, muestras: int = 30000,
+                    semilla: int = 0, verbose: bool = True) -> np.ndarray:
+    """
+    Calcula la equidad de las 169 clases contra 1-9 rivales y la guarda en disco
+
+    Args:
+        ruta: Archivo binario de salida
+        muestras: Repartos Monte Carlo por celda
+        semilla: Semilla base (la tabla es reproducible)
+        verbose: Si debe imprimir el progreso
+
+    Returns:
+        np.ndarray: Tabla generada (169 × 9 × 4, uint16)
+    """
+    tabla = np.memmap(ruta, dtype=np.uint16, mode='w+', shape=FORMA_TABLA)
+    inicio = time.perf_counter()
+
+    for indice in range(169):
+        fila, columna = divmod(indice, 13)
+        alto, bajo = max(fila, columna), min(fila, columna)
+        # Representante: mismo palo si es suited, palos distintos si no
+        mano = [alto, 13 + bajo] if fila <= columna else [alto, bajo]
+
+        for oponentes in range(1, MAX_OPONENTES + 1):
+            resultado = calcular_equidad(mano, (), oponentes, muestras,
+                                         semilla=semilla + indice * MAX_OPONENTES + oponentes)
+            bajo_ic, alto_ic = resultado['intervalo_confianza']
+            tabla[indice, oponentes - 1] = np.round([
+                resultado['victoria'] * 100,
+                resultado['empate'] * 100,
+                resultado['equidad'] * 100,
+                (alto_ic - bajo_ic) / 2 * 100
+            ])
+
+        if verbose:
+            print(f"   {nombre_clase(indice):>4} listo ({time.perf_counter() - inicio:.1f}s)")
+
+    tabla.flush()
+    return np.array(tabla)
+
+
+def cargar_tabla(ruta: str = RUTA_TABLA) -> Optional[np.memmap]:
+    """Abre la tabla en modo solo lectura (None si aún no se generó)"""
+    global _tabla
+    if _tabla is None or _tabla.filename != os.path.abspath(ruta):
+        if not os.path.exists(ruta):
+            return None
+        _tabla = np.memmap(ruta, dtype=np.uint16, mode='r', shape=FORMA_TABLA)
+    return _tabla
+
+
+def equidad_preflop(mano: Iterable[Carta], oponentes: int = 1) -> Optional[Dict]:
+    """
+    Equidad precalculada de una mano inicial
+
+    Args:
+        mano: 2 cartas del jugador
+        oponentes: Cantidad de rivales (1-9)
+
+    Returns:
+        Dict con el mismo formato que calcular_equidad, o None si la tabla no existe
+    """
+    if not 1 <= oponentes <= MAX_OPONENTES:
+        raise ValueError("Se admiten entre 1 y 9 oponentes")
+
+    tabla = cargar_tabla()
+    if tabla is None:
+        return None
+
+    indice = clase_inicial(mano)
+    victoria, empate, equidad, margen = (tabla[indice, oponentes - 1] / 100).tolist()
+    return {
+        'victoria': victoria,
+        'empate': empate,
+        'derrota': round(100 - victoria - empate, 2),
+        'equidad': equidad,
+        'intervalo_confianza': [round(max(equidad - margen, 0), 2),
+                                round(min(equidad + margen, 100), 2)],
+        'oponentes': oponentes,
+        'clase': nombre_clase(indice),
+        'fuente': 'tabla_preflop'
+    }
+
+
+if __name__ == "__main__":
+    print("🎴 Generando tabla de equidad preflop...")
+    construir_tabla()
+    print(f"✅ Tabla guardada en {RUTA_TABLA}")
@@ -0,0 +1,185 @@
+"""
+VENTANAS_RULETA.PY
+Análisis simultáneo de varias ventanas de ruleta (10, 50, 100, 1.000, 10.000 tiradas)
+Se guardan los conteos acumulados por número cada `paso` tiradas, así que
+los conteos de cualquier ventana salen de una resta de 37 enteros más un
+bincount de menos de `paso` tiradas recientes.
+"""
+
+import math
+import numpy as np
+from typing import Dict, Iterable, Optional, Sequence
+from .geometria_ruleta import COLOR, DOCENA
+
+VENTANAS_POR_DEFECTO = (10, 50, 100, 1000, 10000)
+
+# Matrices 37 × categorías para pasar de conteos por número a color/docena
+_UNO_COLOR = np.eye(3, dtype=np.int64)[COLOR]
+_UNO_DOCENA = np.eye(4, dtype=np.int64)[DOCENA]
+
+
+class VentanasRuleta:
+    """
+    Conteos prefijo por puntos de control: cada `paso` tiradas se guarda
+    cuántas veces salió cada número desde el inicio (int32) y las tiradas
+    recientes se guardan crudas (uint8). Los conteos de una ventana w son
+    prefijo[t] - prefijo[t - w], donde prefijo[t - w] es el punto de control
+    anterior más un bincount de menos de `paso` tiradas crudas.
+    La memoria se reserva con la primera tirada (~25 KB para 10.000 tiradas).
+    """
+
+    def __init__(self, ventanas: Sequence[int] = VENTANAS_POR_DEFECTO,
+                 paso: Optional[int] = None):
+        """
+        Args:
+            ventanas: Tamaños de ventana a analizar (tiradas)
+            paso: Tiradas entre puntos de control (por defecto la raíz
+                cuadrada de la ventana mayor)
+        """
+        ventanas = tuple(sorted(set(int(w) for w in ventanas)))
+        if not ventanas or ventanas[0] < 1:
+            raise ValueError("Las ventanas deben ser enteros positivos")
+        if paso is not None and paso < 1:
+            raise ValueError("El paso entre puntos de control debe ser al menos 1")
+        self.ventanas = ventanas
+        self.paso = paso or max(1, math.isqrt(ventanas[-1]))
+        # Puntos de control y tiradas crudas que cubren la ventana mayor
+        self._puntos = ventanas[-1] // self.paso + 2
+        self._capacidad = ventanas[-1] + self.paso
+        self._controles = None
+        self._crudas = None
+        self._actual = None
+        self.tiradas = 0
+        self.huecos = 0
+
+    def __len__(self) -> int:
+        return self.tiradas
+
+    def reiniciar(self):
+        """Vuelve al estado sin tiradas (libera los buffers)"""
+        self._controles = None
+        self._crudas = None
+        self._actual = None
+        self.tiradas = 0
+        self.huecos = 0
+
+    def marcar_hueco(self):
+        """
+        Faltan tiradas entre las ya vistas y las siguientes: ninguna ventana
+        puede cruzar el hueco, así que se empieza de cero y las ventanas que
+        aún no se llenaron se reportan como interrumpidas
+        """
+        huecos = self.huecos
+        self.reiniciar()
+        self.huecos = huecos + 1
+
+    def agregar(self, numero: int):
+        """Incorpora una tirada (O(1); copia 37 contadores cada `paso` tiradas)"""
+        numero = int(numero)
+        if not 0 <= numero <= 36:
+            raise ValueError(f"Número de ruleta inválido: {numero}")
+        if self._actual is None:
+            self._reservar()
+        self._crudas[self.tiradas % self._capacidad] = numero
+        self._actual[numero] += 1
+        self.tiradas += 1
+        if self.tiradas % self.paso == 0:
+            self._controles[(self.tiradas // self.paso) % self._puntos] = self._actual
+
+    def agregar_varios(self, numeros: Iterable[int]):
+        """Incorpora varias tiradas en orden (puntos de control con un solo bincount)"""
+        if not isinstance(numeros, np.ndarray):
+            numeros = np.fromiter(numeros, dtype=np.int64)
+        numeros = numeros.astype(np.int64, copy=False)
+        if numeros.size == 0:
+            return
+        if numeros.min() < 0 or numeros.max() > 36:
+            raise ValueError("Las tiradas solo pueden contener números 0-36")
+        if self._actual is None:
+            self._reservar()
+
+        inicio, fin = self.tiradas, self.tiradas + numeros.size
+        # Solo las últimas `capacidad` tiradas crudas pueden volver a leerse
+        recientes = min(numeros.size, self._capacidad)
+        self._crudas[np.arange(fin - recientes, fin) % self._capacidad] = numeros[-recientes:]
+
+        # Puntos de control del lote que siguen en el anillo
+        ultimo = fin // self.paso
+        primero = max(inicio // self.paso + 1, ultimo - self._puntos + 1)
+        if primero <= ultimo:
+            # Tirada i (1-based) -> punto ceil(i / paso); las anteriores van al primero
+            tramo = np.arange(inicio, fin) // self.paso + 1 - primero
+            dentro = tramo <= ultimo - primero
+            cantidad = ultimo - primero + 1
+            filas = np.bincount(np.maximum(tramo[dentro], 0) * 37 + numeros[dentro],
+                                minlength=cantidad * 37).reshape(cantidad, 37)
+            filas = np.cumsum(filas, axis=0) + self._actual
+            self._controles[np.arange(primero, ultimo + 1) % self._puntos] = filas
+
+        self._actual += np.bincount(numeros, minlength=37).astype(np.int32)
+        self.tiradas = fin
+
+    def conteos(self, ventana: int) -> np.ndarray:
+        """Apariciones de cada número en las últimas `ventana` tiradas"""
+        if not 1 <= ventana <= self.ventanas[-1]:
+            raise ValueError(f"Ventana fuera de rango (1-{self.ventanas[-1]}): {ventana}")
+        if self._actual is None:
+            return np.zeros(37, dtype=np.int32)
+        return self._actual - self._prefijo(self.tiradas - min(ventana, self.tiradas))
+
+    def conteos_ventanas(self) -> np.ndarray:
+        """Matriz (ventanas × 37) de conteos de todas las ventanas"""
+        if self._actual is None:
+            return np.zeros((len(self.ventanas), 37), dtype=np.int32)
+        desde = [self.tiradas - min(w, self.tiradas) for w in self.ventanas]
+        return self._actual - np.stack([self._prefijo(t) for t in desde])
+
+    def _reservar(self):
+        """Reserva los buffers con la primera tirada"""
+        self._controles = np.zeros((self._puntos, 37), dtype=np.int32)
+        self._crudas = np.zeros(self._capacidad, dtype=np.uint8)
+        self._actual = np.zeros(37, dtype=np.int32)
+
+    def _prefijo(self, t: int) -> np.ndarray:
+        """Conteos de las primeras t tiradas: punto de control + tiradas crudas"""
+        punto = t // self.paso
+        fila = self._controles[punto % self._puntos]
+        resto = t - punto * self.paso
+        if not resto:
+            return fila
+        crudas = self._crudas[np.arange(t - resto, t) % self._capacidad]
+        return fila + np.bincount(crudas, minlength=37).astype(np.int32)
+
+    def resumen(self, cantidad: int = 5) -> Dict[str, Dict]:
+        """
+        Números calientes/fríos, colores y docenas de todas las ventanas
+
+        Returns:
+            Dict indexado por tamaño de ventana (como texto, apto para JSON)
+        """
+        conteos = self.conteos_ventanas()
+        totales = conteos.sum(axis=1)
+        colores = conteos @ _UNO_COLOR
+        docenas = conteos @ _UNO_DOCENA
+        calientes = np.argsort(-conteos, axis=1, kind='stable')[:, :cantidad]
+        frecuencias = np.take_along_axis(conteos, calientes, axis=1)
+
+        resumen = {}
+        for i, ventana in enumerate(self.ventanas):
+            total = int(totales[i])
+            divisor = total or 1
+            verde, rojo, negro = (colores[i] / divisor * 100).round(2).tolist()
+            resumen[str(ventana)] = {
+                'tiradas': total,
+                'completa': total == ventana,
+                # Incompleta por un hueco en las tiradas, no por ser una mesa nueva
+                'interrumpida': total < ventana and self.huecos > 0,
+                'numeros_calientes': [{'numero': n, 'frecuencia': f} for n, f in
+                                      zip(calientes[i].tolist(), frecuencias[i].tolist())
+                                      if f > 0],
+                'numeros_frios': np.flatnonzero(conteos[i] == 0)[:cantidad].tolist(),
+                'probabilidades_color': ({'rojo': rojo, 'negro': negro, 'verde': verde}
+                                         if total else {'rojo': 48.6, 'negro': 48.6, 'verde': 2.8}),
+                'docenas': (docenas[i, 1:] / divisor * 100).round(2).tolist()
+            }
+        return resumen
@@ -0,0 +1,128 @@
+"""
+ZAPATO_BLACKJACK.PY
+Seguimiento incremental de la composición del zapato de blackjack
+Cada carta se interpreta una sola vez y actualiza conteos en O(1)
+"""
+
+import numpy as np
+from typing import Dict, Iterable
+from .cartas import Carta, rango_carta
+from .conteo_cartas import SISTEMAS_CONTEO, contar_secuencia, matriz_etiquetas
+
+
+class ZapatoBlackjack:
+    """
+    Composición restante de un zapato de varios mazos con el conteo de
+    todos los sistemas registrados, actualizado en paralelo.
+    Se reinicia solo cuando detecta un barajado: una carta imposible para
+    la composición actual o un zapato que ya se repartió completo.
+    """
+
+    def __init__(self, num_mazos: int = 6, penetracion: float = 0.75,
+                 sistema: str = 'hi_lo'):
+        """
+        Args:
+            num_mazos: Mazos de 52 cartas en el zapato
+            penetracion: Fracción del zapato que se reparte antes de barajar
+            sistema: Sistema de conteo principal (ver conteo_cartas)
+        """
+        if num_mazos < 1:
+            raise ValueError("El zapato necesita al menos un mazo")
+        if not 0 < penetracion <= 1:
+            raise ValueError("La penetración debe estar entre 0 y 1")
+        if sistema not in SISTEMAS_CONTEO:
+            raise ValueError(f"Sistema de conteo desconocido: {sistema}")
+
+        self.num_mazos = num_mazos
+        self.penetracion = penetracion
+        self.total_cartas = num_mazos * 52
+        self.restantes = np.full(13, 4 * num_mazos, dtype=np.int64)
+        self.sistemas = list(SISTEMAS_CONTEO)
+        self.sistema = sistema
+        self._etiquetas = matriz_etiquetas(self.sistemas)
+        self._indice_sistema = self.sistemas.index(sistema)
+        self.conteos = np.zeros(len(self.sistemas), dtype=np.int64)
+        self.cartas_vistas = 0
+        self.barajadas = 0
+
+    def agregar(self, carta: Carta):
+        """Registra una carta vista; si no cabe en el zapato actual, baraja antes"""
+        rango = rango_carta(carta)
+        if self.restantes[rango] == 0 or self.cartas_vistas >= self.total_cartas:
+            self.barajar()
+
+        self.restantes[rango] -= 1
+        self.conteos += self._etiquetas[:, rango]
+        self.cartas_vistas += 1
+
+    def agregar_varias(self, cartas: Iterable[Carta]) -> Dict:
+        """
+        Registra varias cartas en orden, contando cada tramo entre barajados
+        de una sola pasada vectorizada (mismo estado final que `agregar`)
+
+        Returns:
+            Evolución del conteo durante el lote (formato de `contar_secuencia`:
+            conteo corrido y true count de cada sistema tras cada carta)
+        """
+        rangos = np.array([rango_carta(c) for c in cartas], dtype=np.intp)
+        tramos = []
+        while True:
+            # Primera carta que no cabe en el zapato actual: ahí hubo un barajado
+            usadas = np.cumsum(np.eye(13, dtype=np.int64)[rangos], axis=0)
+            excede = ((usadas[np.arange(rangos.size), rangos] > self.restantes[rangos])
+                      | (np.arange(1, rangos.size + 1) > self.total_cartas - self.cartas_vistas))
+            corte = int(np.argmax(excede)) if excede.any() else rangos.size
+            if corte == 0 and rangos.size:
+                self.barajar()
+                continue
+
+            tramo = contar_secuencia(rangos[:corte], self.sistemas, self.num_mazos,
+                                     self.conteos, self.cartas_vistas)
+            tramos.append(tramo)
+            if corte:
+                self.restantes -= usadas[corte - 1]
+                self.conteos[:] = tramo['conteo'][:, -1]
+                self.cartas_vistas += corte
+            rangos = rangos[corte:]
+            if not rangos.size:
+                break
+
+        return {
+            'sistemas': list(self.sistemas),
+            'conteo': np.concatenate([t['conteo'] for t in tramos], axis=1),
+            'true_count': np.concatenate([t['true_count'] for t in tramos], axis=1)
+        }
+
+    def barajar(self):
+        """Vuelve a un zapato completo"""
+        self.restantes[:] = 4 * self.num_mazos
+        self.conteos[:] = 0
+        self.cartas_vistas = 0
+        self.barajadas += 1
+
+    @property
+    def conteo(self) -> int:
+        """Conteo corrido del sistema principal"""
+        return int(self.conteos[self._indice_sistema])
+
+    def conteos_por_sistema(self) -> Dict[str, int]:
+        """Conteo corrido de cada sistema registrado"""
+        return dict(zip(self.sistemas, self.conteos.tolist()))
+
+    @property
+    def mazos_restantes(self) -> float:
+        return (self.total_cartas - self.cartas_vistas) / 52
+
+    @property
+    def true_count(self) -> float:
+        """Conteo por mazo restante (mínimo un mazo para evitar saltos al final)"""
+        return self.conteo / max(self.mazos_restantes, 1)
+
+    @property
+    def porcentaje_usado(self) -> float:
+        return self.cartas_vistas / self.total_cartas * 100
+
+    @property
+    def necesita_barajar(self) -> bool:
+        """True si ya se alcanzó la penetración configurada"""
+        return self.cartas_vistas >= self.penetracion * self.total_cartas
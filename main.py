@@ -76,7 +76,10 @@ class CasinoPredictorCLI:
                     print("⚠️ Se necesitan al menos 10 tiradas para predicción")
                     continue
                 
-                prediccion = self.predictor.predecir_ruleta(historial)
+                prediccion = self.predictor.predecir_ruleta(
+                    historial, mesa, self.simulador.obtener_secuencia('ruleta', mesa),
+                    epoca=self.simulador.obtener_epoca('ruleta', mesa)
+                )
                 print(formatear_prediccion(prediccion))
                 
             elif opcion == '4':
@@ -117,12 +120,16 @@ class CasinoPredictorCLI:
                     print("⚠️ No hay cartas registradas aún")
                     
             elif opcion == '3':
-                cartas_visibles = self.simulador.obtener_cartas_visibles_blackjack(mesa)
+                secuencia = self.simulador.obtener_secuencia('blackjack', mesa)
+                epoca = self.simulador.obtener_epoca('blackjack', mesa)
+                cartas_visibles = self.simulador.obtener_cartas_visibles_blackjack(mesa, None)
                 if len(cartas_visibles) < 10:
                     print("⚠️ Se necesitan al menos 10 cartas vistas para predicción")
                     continue
                 
-                prediccion = self.predictor.predecir_blackjack(cartas_visibles)
+                prediccion = self.predictor.predecir_blackjack(
+                    cartas_visibles, mesa, secuencia, epoca=epoca
+                )
                 print(formatear_prediccion(prediccion))
                 
             elif opcion == '4':
@@ -158,7 +165,8 @@ class CasinoPredictorCLI:
                 mano = self.simulador.simular_mano_poker(mesa)
                 prediccion = self.predictor.predecir_poker(
                     mano['mano_jugador'],
-                    mano['cartas_comunitarias']
+                    mano['cartas_comunitarias'],
+                    oponentes=mano['jugadores_activos'] - 1
                 )
                 print(formatear_prediccion(prediccion))
                 
@@ -195,8 +203,14 @@ class CasinoPredictorCLI:
                     
             elif opcion == '3':
                 estado = self.simulador.simular_jackpot()
-                prediccion = self.predictor.predecir_jackpot(estado['historial_premios'])
-                print(formatear_prediccion(prediccion))
+                prediccion = self.predictor.predecir_jackpot(
+                    estado['historial_premios'], estado['jackpot_id'],
+                    self.simulador.obtener_secuencia('jackpot', estado['jackpot_id'])
+                )
+                print(formatear_prediccion({
+                    **prediccion.a_dict(),
+                    'pronostico_simulado': self.simulador.pronosticar_jackpot(estado['jackpot_id'])
+                }))
                 
             elif opcion == '4':
                 break
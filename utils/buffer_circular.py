@@ -0,0 +1,77 @@
+"""
+BUFFER_CIRCULAR.PY
+Buffer circular de tamaño fijo sobre un array de NumPy
+Cada valor se escribe dos veces (posición i e i + capacidad), así que las
+últimas N entradas siempre forman un tramo contiguo y se devuelven como
+vista sin copiar. La memoria no crece por mucho que se escriba.
+"""
+
+import numpy as np
+from typing import Iterable
+
+
+class BufferCircular:
+    """
+    Historial acotado de valores numéricos con doble buffer espejado
+    (2 × capacidad elementos preasignados).
+    """
+
+    def __init__(self, capacidad: int, dtype=np.uint8):
+        """
+        Args:
+            capacidad: Máximo de valores recientes que se conservan
+            dtype: Tipo de los valores guardados
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad del buffer debe ser al menos 1")
+        self.capacidad = capacidad
+        self._datos = np.zeros(2 * capacidad, dtype=dtype)
+        self._posicion = 0
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacidad)
+
+    def agregar(self, valor):
+        """Escribe un valor (sobrescribe el más antiguo si está lleno)"""
+        self._datos[self._posicion] = valor
+        self._datos[self._posicion + self.capacidad] = valor
+        self._posicion = (self._posicion + 1) % self.capacidad
+        self.total += 1
+
+    def extender(self, valores: Iterable):
+        """Escribe varios valores en orden con dos copias en bloque"""
+        valores = np.asarray(valores if isinstance(valores, np.ndarray) else list(valores),
+                             dtype=self._datos.dtype)
+        cantidad = valores.size
+        if cantidad == 0:
+            return
+        # Solo las últimas `capacidad` pueden seguir en el buffer
+        recientes = valores[-self.capacidad:]
+        inicio = (self._posicion + cantidad - recientes.size) % self.capacidad
+        primera = min(recientes.size, self.capacidad - inicio)
+        for desplazamiento in (0, self.capacidad):
+            base = inicio + desplazamiento
+            self._datos[base:base + primera] = recientes[:primera]
+        resto = recientes.size - primera
+        if resto:
+            self._datos[:resto] = recientes[primera:]
+            self._datos[self.capacidad:self.capacidad + resto] = recientes[primera:]
+        self._posicion = (self._posicion + cantidad) % self.capacidad
+        self.total += cantidad
+
+    def ultimos(self, cantidad: int = None) -> np.ndarray:
+        """
+        Vista (sin copia) de los últimos valores, del más antiguo al más nuevo
+
+        La vista refleja escrituras posteriores: copiarla si debe conservarse.
+        """
+        disponibles = len(self)
+        cantidad = disponibles if cantidad is None else max(0, min(cantidad, disponibles))
+        fin = self._posicion + self.capacidad
+        return self._datos[fin - cantidad:fin]
+
+    def vaciar(self):
+        """Descarta todos los valores (sin liberar memoria)"""
+        self._posicion = 0
+        self.total = 0
@@ -0,0 +1,74 @@
+"""
+CACHE_PREDICCIONES.PY
+Caché LRU de predicciones indexada por (juego, mesa, versión)
+La versión la incrementa el simulador con cada evento de la mesa, así que
+mientras la mesa no cambie, repetir una consulta cuesta una búsqueda en dict.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional
+
+
+class CachePredicciones:
+    """
+    Caché de tamaño acotado con desalojo LRU y contadores de aciertos,
+    fallos y desalojos. Segura para uso desde varios hilos.
+    """
+
+    def __init__(self, capacidad: int = 1024):
+        """
+        Args:
+            capacidad: Máximo de predicciones guardadas
+        """
+        if capacidad < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1")
+        self.capacidad = capacidad
+        self._entradas: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def __contains__(self, clave: Hashable) -> bool:
+        return clave in self._entradas
+
+    def obtener(self, clave: Hashable) -> Optional[Any]:
+        """Predicción guardada para la clave (None si no está)"""
+        with self._lock:
+            valor = self._entradas.get(clave)
+            if valor is None:
+                self.fallos += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return valor
+
+    def guardar(self, clave: Hashable, valor: Any):
+        """Guarda una predicción y desaloja la menos usada si se supera la capacidad"""
+        with self._lock:
+            self._entradas[clave] = valor
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+                self.desalojos += 1
+
+    def limpiar(self):
+        """Vacía la caché (los contadores se conservan)"""
+        with self._lock:
+            self._entradas.clear()
+
+    def estadisticas(self) -> Dict:
+        """Aciertos, fallos, desalojos y ocupación de la caché"""
+        consultas = self.aciertos + self.fallos
+        return {
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'tasa_aciertos': round(self.aciertos / consultas * 100, 2) if consultas else 0.0,
+            'entradas': len(self._entradas),
+            'capacidad': self.capacidad
+        }
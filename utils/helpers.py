@@ -94,16 +94,19 @@ def emoji_por_probabilidad(probabilidad: float) -> str:
         return "🟢"
 
 
-def formatear_prediccion(prediccion: Dict) -> str:
+def formatear_prediccion(prediccion) -> str:
     """
     Formatea una predicción para mostrar en terminal
     
     Args:
-        prediccion: Dict con datos de predicción
+        prediccion: Resultado del predictor o dict con datos de predicción
         
     Returns:
         str: Texto formateado
     """
+    if hasattr(prediccion, 'a_dict'):
+        prediccion = prediccion.a_dict()
+    
     juego = prediccion.get('juego', 'desconocido')
     lineas = [f"\n📊 Predicción para {juego.upper()}:"]
     lineas.append("=" * 50)
@@ -0,0 +1,55 @@
+"""
+SEMILLAS.PY
+Flujos aleatorios reproducibles e independientes por mesa
+Todos derivan de una única numpy.random.SeedSequence maestra. La clave de
+cada flujo sale del nombre "juego/mesa" (BLAKE2b de 128 bits, en cuatro
+palabras de 32), no del orden de creación, así que una mesa genera lo mismo
+en 1 proceso o repartida entre 64 y dos mesas distintas no comparten flujo.
+"""
+
+import hashlib
+import numpy as np
+from typing import Tuple, Union
+
+SemillaMaestra = Union[None, int, np.random.SeedSequence]
+
+
+def semilla_maestra(semilla: SemillaMaestra = None) -> np.random.SeedSequence:
+    """
+    SeedSequence maestra (con semilla None toma entropía del sistema;
+    su `entropy` permite repetir la corrida después)
+    """
+    if isinstance(semilla, np.random.SeedSequence):
+        return semilla
+    return np.random.SeedSequence(semilla)
+
+
+def clave_mesa(juego: str, mesa: str) -> Tuple[int, ...]:
+    """Clave estable de 128 bits de una mesa (BLAKE2b de "juego/mesa" en 4 palabras)"""
+    resumen = hashlib.blake2b(f"{juego}/{mesa}".encode('utf-8'), digest_size=16).digest()
+    return tuple(np.frombuffer(resumen, dtype='<u4').tolist())
+
+
+def secuencia_mesa(maestra: SemillaMaestra, juego: str, mesa: str,
+                   *subclaves: int) -> np.random.SeedSequence:
+    """
+    SeedSequence de una mesa (y opcionalmente de un tramo de trabajo de ella)
+
+    Args:
+        maestra: Semilla maestra (entero, SeedSequence o None)
+        juego: Nombre del juego
+        mesa: Identificador de la mesa
+        subclaves: Enteros extra para subdividir el flujo (ej: número de lote)
+    """
+    maestra = semilla_maestra(maestra)
+    return np.random.SeedSequence(
+        maestra.entropy,
+        spawn_key=tuple(maestra.spawn_key) + clave_mesa(juego, mesa) + tuple(subclaves)
+    )
+
+
+def generador_mesa(maestra: SemillaMaestra, juego: str, mesa: str,
+                   *subclaves: int) -> np.random.Generator:
+    """Generator (PCG64) del flujo de una mesa"""
+    return np.random.Generator(np.random.PCG64(secuencia_mesa(maestra, juego, mesa, *subclaves)))
+